@@ -12,26 +12,24 @@ def setup_student_count_signals():
     post_delete.connect(update_class_student_count_on_user_delete, sender=User)
 
 
-def update_class_student_count_on_user_change(sender, instance, **kwargs):
-    """Update class student count when a user is created or updated."""
+def update_class_student_count_on_user_change(sender, instance, created, **kwargs):
+    """Update class student counts when a user's class or active flag changes."""
+    from apps.academic.models import Class
+
+    class_changed = instance.has_changed("assigned_class_id")
+    if not (created or class_changed or instance.has_changed("is_active")):
+        return
+
     # Update new class count if assigned
-    if instance.assigned_class:
+    if instance.assigned_class_id:
         instance.assigned_class.update_student_count()
 
-    # If this is an update, we need to check if the class changed
-    # We can detect this by checking if the instance has a pk
-    if instance.pk:
-        # Try to get the old instance to check if class changed
-        try:
-            User = sender
-            old_instance = User.objects.get(pk=instance.pk)
-            if (
-                old_instance.assigned_class
-                and old_instance.assigned_class != instance.assigned_class
-            ):
-                old_instance.assigned_class.update_student_count()
-        except sender.DoesNotExist:
-            pass
+    # The user left a class, so its count drops
+    old_class_id = instance.previous("assigned_class_id")
+    if class_changed and old_class_id:
+        old_class = Class.objects.filter(pk=old_class_id).first()
+        if old_class:
+            old_class.update_student_count()
 
 
 def update_class_student_count_on_user_delete(sender, instance, **kwargs):
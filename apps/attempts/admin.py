@@ -1,6 +1,13 @@
 from django.contrib import admin
 
-from .models import ExamAnswer, ExamAttempt
+from .models import (
+    AnswerEvent,
+    ExamAnswer,
+    ExamAttempt,
+    ExamStatistics,
+    PerformanceRollup,
+    RegradeRun,
+)
 
 
 @admin.register(ExamAttempt)
@@ -15,10 +22,117 @@ class ExamAttemptAdmin(admin.ModelAdmin):
     )
     list_filter = ("status", "exam")
     search_fields = ("student__email", "exam__title")
-    readonly_fields = ("question_order", "option_orders", "created_at", "updated_at")
+    exclude = ("stored_question_order", "stored_option_orders")
+    readonly_fields = (
+        "paper",
+        "shuffle_seed",
+        "journal_position",
+        "question_order",
+        "option_orders",
+        "created_at",
+        "updated_at",
+    )
 
 
 @admin.register(ExamAnswer)
 class ExamAnswerAdmin(admin.ModelAdmin):
     list_display = ("attempt", "question", "selected_option", "is_correct")
     list_filter = ("is_correct",)
+    list_select_related = ("attempt__student", "attempt__exam", "question")
+
+
+@admin.register(AnswerEvent)
+class AnswerEventAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "attempt",
+        "question",
+        "selected_option",
+        "client_seq",
+    )
+    list_select_related = ("attempt__student", "attempt__exam", "question")
+    search_fields = ("attempt__student__email", "attempt__exam__title")
+    raw_id_fields = ("attempt", "question", "selected_option")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(RegradeRun)
+class RegradeRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "triggered_by",
+        "answers_checked",
+        "answers_changed",
+        "attempts_rescored",
+        "completed_at",
+    )
+    readonly_fields = (
+        "question_ids",
+        "triggered_by",
+        "answers_checked",
+        "answers_changed",
+        "attempts_rescored",
+        "completed_at",
+        "created_at",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(PerformanceRollup)
+class PerformanceRollupAdmin(admin.ModelAdmin):
+    list_display = (
+        "student",
+        "subject",
+        "attempt_count",
+        "pass_count",
+        "best_percentage",
+        "worst_percentage",
+        "updated_at",
+    )
+    list_select_related = ("student", "subject")
+    search_fields = ("student__email", "subject__name")
+    raw_id_fields = ("student", "subject", "best_attempt", "worst_attempt")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ExamStatistics)
+class ExamStatisticsAdmin(admin.ModelAdmin):
+    list_display = (
+        "exam",
+        "attempt_count",
+        "pass_count",
+        "mean",
+        "median",
+        "updated_at",
+    )
+    list_select_related = ("exam",)
+    search_fields = ("exam__title",)
+    raw_id_fields = ("exam",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,119 @@
+"""
+Admission control for starting exam attempts under load.
+
+Students starting an exam take a numbered ticket from a counter in the
+cache. Tickets are admitted at ``EXAM_ADMISSION_RATE`` per second, after an
+initial burst of ``EXAM_ADMISSION_BURST``, which works like a token bucket:
+the highest admitted ticket grows with time from an epoch, and the epoch is
+moved forward whenever the queue has drained so idle time does not pile up
+into one large burst. Everyone else waits on a lightweight page that polls
+``get_status``, which only reads the cache.
+
+Ticket numbers come from ``cache.incr``, which is atomic on Redis and
+memcached. On the database and local-memory caches concurrent requests may
+occasionally share a number, which only admits slightly more than the rate.
+"""
+
+import math
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+ADMISSION_COUNTER_KEY = "exam_admission_counter"
+ADMISSION_EPOCH_KEY = "exam_admission_epoch"
+ADMISSION_TICKET_KEY = "exam_admission_ticket_{exam_id}_{student_id}"
+ADMISSION_TICKET_TIMEOUT = 60 * 60 * 6  # 6 hours
+
+
+def is_enabled():
+    """Check whether exam starts are admission-controlled."""
+    return settings.EXAM_ADMISSION_RATE > 0
+
+
+def _burst():
+    return max(1, settings.EXAM_ADMISSION_BURST or settings.EXAM_ADMISSION_RATE)
+
+
+def _capacity(epoch, now):
+    """Highest ticket number admitted at ``now``."""
+    return _burst() + settings.EXAM_ADMISSION_RATE * (now - epoch)
+
+
+def _ticket_key(exam_id, student_id):
+    return ADMISSION_TICKET_KEY.format(exam_id=exam_id, student_id=student_id)
+
+
+def take_ticket(exam_id, student_id):
+    """
+    Get a student's place in the start queue, joining it if needed.
+
+    Returns:
+        Dict with the ticket ``number`` and the ``queued_at`` timestamp
+    """
+    key = _ticket_key(exam_id, student_id)
+    ticket = cache.get(key)
+    if ticket is not None:
+        return ticket
+
+    cache.add(ADMISSION_COUNTER_KEY, 0, None)
+    try:
+        number = cache.incr(ADMISSION_COUNTER_KEY)
+    except ValueError:
+        # The counter was evicted; start a new sequence
+        cache.set(ADMISSION_COUNTER_KEY, 1, None)
+        cache.set(ADMISSION_EPOCH_KEY, None, None)
+        number = 1
+
+    now = time.time()
+    epoch = cache.get(ADMISSION_EPOCH_KEY)
+    if epoch is None or _capacity(epoch, now) > number - 1 + _burst():
+        # The queue has drained: refill the bucket to its burst size rather
+        # than letting unused capacity accumulate
+        epoch = now - (number - 1) / settings.EXAM_ADMISSION_RATE
+        cache.set(ADMISSION_EPOCH_KEY, epoch, None)
+
+    ticket = {"number": number, "queued_at": now}
+    cache.set(key, ticket, ADMISSION_TICKET_TIMEOUT)
+    return ticket
+
+
+def get_ticket(exam_id, student_id):
+    """Get a student's ticket for an exam, or None if they are not queued."""
+    return cache.get(_ticket_key(exam_id, student_id))
+
+
+def get_status(ticket):
+    """
+    Check whether a ticket has been admitted.
+
+    Returns:
+        Tuple of (admitted, queue position, estimated wait in seconds)
+    """
+    epoch = cache.get(ADMISSION_EPOCH_KEY)
+    if epoch is None:
+        # Queue state was lost; let the student through
+        return True, 0, 0
+    position = max(0, math.ceil(ticket["number"] - _capacity(epoch, time.time())))
+    return position == 0, position, math.ceil(position / settings.EXAM_ADMISSION_RATE)
+
+
+def release_ticket(exam_id, student_id, ticket):
+    """
+    Remove an admitted student's ticket.
+
+    Returns:
+        Time the student spent in the queue until admitted, as a timedelta
+        rounded down to whole seconds
+    """
+    cache.delete(_ticket_key(exam_id, student_id))
+    admitted_at = time.time()
+    epoch = cache.get(ADMISSION_EPOCH_KEY)
+    if epoch is not None:
+        # Don't count the time until the waiting page noticed the admission
+        admitted_at = min(
+            admitted_at,
+            epoch + (ticket["number"] - _burst()) / settings.EXAM_ADMISSION_RATE,
+        )
+    return timedelta(seconds=int(max(0, admitted_at - ticket["queued_at"])))
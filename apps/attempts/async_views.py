@@ -0,0 +1,138 @@
+"""
+Async exam-taking endpoints for deployment under an ASGI server.
+
+These mirror the JSON hot paths of the exam page (autosave, time sync and
+submit) using async views and the async ORM, so a single ASGI worker can
+hold many concurrent autosaves without a thread per request. The sync views
+in ``views.py`` keep working under both WSGI and ASGI.
+
+Async views cannot run inside ``ATOMIC_REQUESTS`` transactions, so they
+opt out, and the service calls that need a transaction open their own.
+"""
+
+import json
+
+from django.db import transaction
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.views import View
+
+from asgiref.sync import sync_to_async
+
+from .models import ExamAttempt
+from .services.answers import AnswerService
+from .services.scoring import ScoringService
+
+
+class AsyncStudentJSONView(View):
+    """Base async view that requires a logged-in student and answers in JSON."""
+
+    @transaction.non_atomic_requests
+    async def dispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return JsonResponse({"error": "Authentication required."}, status=401)
+        if not user.is_student:
+            return JsonResponse(
+                {"error": "Only students can access this endpoint."}, status=403
+            )
+        return await super().dispatch(request, *args, **kwargs)
+
+    async def get_in_progress_attempt(self, exam_id, user):
+        return await (
+            ExamAttempt.objects.filter(
+                exam_id=exam_id,
+                student=user,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            )
+            .select_related("exam")
+            .afirst()
+        )
+
+
+class AsyncAutosaveView(AsyncStudentJSONView):
+    """Async variant of ``StudentAutosaveView`` with the same JSON contract."""
+
+    async def post(self, request, pk):
+        try:
+            payload = json.loads(request.body)
+            seq = int(payload["seq"])
+            answers = payload.get("answers", {})
+        except (ValueError, TypeError, KeyError):
+            return JsonResponse({"error": "Invalid autosave payload."}, status=400)
+
+        if seq < 1:
+            return JsonResponse({"error": "Invalid sequence number."}, status=400)
+
+        attempt = await self.get_in_progress_attempt(pk, await request.auser())
+        if not attempt:
+            return JsonResponse({"error": "No active exam attempt."}, status=404)
+
+        if attempt.is_time_expired:
+            return JsonResponse({"error": "Exam time has expired."}, status=409)
+
+        applied, ack, saved = await AnswerService.aapply_delta(attempt, seq, answers)
+        return JsonResponse({"ack": ack, "applied": applied, "saved": saved})
+
+
+class AsyncHeartbeatView(AsyncStudentJSONView):
+    """Report the server clock and remaining time so the client timer can resync."""
+
+    async def get(self, request, pk):
+        attempt = await self.get_in_progress_attempt(pk, await request.auser())
+        if not attempt:
+            return JsonResponse({"error": "No active exam attempt."}, status=404)
+
+        return JsonResponse(
+            {
+                "server_time": timezone.now().isoformat(),
+                "time_remaining": attempt.time_remaining,
+            }
+        )
+
+
+class AsyncSubmitView(AsyncStudentJSONView):
+    """
+    Submit an exam from JSON.
+
+    Accepts ``{"answers": {"<question_id>": <option_id>}}`` with any answers
+    not yet autosaved. Finalizing needs a transaction and row lock, which
+    the async ORM does not provide, so it runs in a worker thread.
+    """
+
+    async def post(self, request, pk):
+        try:
+            payload = json.loads(request.body or b"{}")
+            answers = AnswerService.parse_delta(payload.get("answers", {}))
+        except (ValueError, TypeError, AttributeError):
+            return JsonResponse({"error": "Invalid submit payload."}, status=400)
+
+        user = await request.auser()
+        submitted = await sync_to_async(self.submit)(pk, user, answers)
+        if not submitted:
+            return JsonResponse({"error": "No active exam attempt."}, status=404)
+        return JsonResponse(
+            {
+                "status": ExamAttempt.Status.SUBMITTED,
+                "redirect": reverse("attempts:result", args=[pk]),
+            }
+        )
+
+    @staticmethod
+    def submit(exam_id, user, answers):
+        with transaction.atomic():
+            attempt = (
+                ExamAttempt.objects.select_for_update(of=("self",))
+                .select_related("exam")
+                .filter(
+                    exam_id=exam_id,
+                    student=user,
+                    status=ExamAttempt.Status.IN_PROGRESS,
+                )
+                .first()
+            )
+            if not attempt:
+                return False
+            AnswerService.record_answers(attempt, answers)
+            return ScoringService.finalize(attempt, ExamAttempt.Status.SUBMITTED)
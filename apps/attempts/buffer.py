@@ -0,0 +1,290 @@
+"""Write-behind buffering of exam answers in the cache."""
+
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+ANSWER_BUFFER_CACHE_KEY = "answer_buffer_{attempt_id}"
+ANSWER_BUFFER_FLUSHED_KEY = "answer_buffer_flushed_{attempt_id}"
+ANSWER_BUFFER_LOCK_KEY = "answer_buffer_lock_{attempt_id}"
+ANSWER_BUFFER_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+ANSWER_BUFFER_LOCK_TIMEOUT = 5  # seconds; frees the lock of a crashed worker
+
+# Cache backends grouped by how well they keep buffered answers. Only the
+# shared backends are trusted; any backend not listed is refused.
+SHARED_BACKENDS = {
+    "django.core.cache.backends.redis.RedisCache",
+    "django_redis.cache.RedisCache",
+}
+VOLATILE_BACKENDS = {"django.core.cache.backends.dummy.DummyCache"}
+PROCESS_LOCAL_BACKENDS = {"django.core.cache.backends.locmem.LocMemCache"}
+EVICTING_BACKENDS = {
+    "django.core.cache.backends.db.DatabaseCache",
+    "django.core.cache.backends.filebased.FileBasedCache",
+    "django.core.cache.backends.memcached.PyMemcacheCache",
+    "django.core.cache.backends.memcached.PyLibMCCache",
+}
+
+
+def get_buffer_durability():
+    """
+    Describe how durable the default cache is as an answer buffer.
+
+    Only ``"shared"`` caches can hold buffered answers safely: they are
+    visible to every worker and their atomic ``add`` backs the buffer
+    lock. Any other level loses answers, hides them from other workers or
+    cannot be vouched for.
+
+    Returns:
+        Tuple of (level, detail) where level is ``"none"``, ``"process"``,
+        ``"evicting"``, ``"unknown"`` or ``"shared"``
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend in SHARED_BACKENDS:
+        return "shared", (
+            f"{backend} is shared between workers; durability depends on its "
+            "persistence and eviction settings (e.g. Redis noeviction with AOF)"
+        )
+    if backend in VOLATILE_BACKENDS:
+        return "none", f"{backend} stores nothing; write-behind is disabled"
+    if backend in PROCESS_LOCAL_BACKENDS:
+        return "process", (
+            f"{backend} is private to each process; buffered answers are only "
+            "visible to the worker that received them and are lost on restart"
+        )
+    if backend in EVICTING_BACKENDS:
+        return "evicting", (
+            f"{backend} may evict or cull entries under memory or size "
+            "pressure, which discards buffered answers"
+        )
+    return "unknown", (
+        f"{backend} is not known to be shared between workers without "
+        "evicting entries; use Redis"
+    )
+
+
+def is_enabled():
+    """
+    Check whether answers should be buffered instead of written directly.
+
+    Answers are only buffered in a shared cache; with any other backend
+    they are written directly even if write-behind is enabled.
+    """
+    if not settings.EXAM_ANSWER_WRITE_BEHIND:
+        return False
+    level, _ = get_buffer_durability()
+    return level == "shared"
+
+
+def _buffer_key(attempt_id):
+    return ANSWER_BUFFER_CACHE_KEY.format(attempt_id=attempt_id)
+
+
+def _flushed_key(attempt_id):
+    return ANSWER_BUFFER_FLUSHED_KEY.format(attempt_id=attempt_id)
+
+
+def _lock_key(attempt_id):
+    return ANSWER_BUFFER_LOCK_KEY.format(attempt_id=attempt_id)
+
+
+@contextmanager
+def _locked(attempt_id):
+    """
+    Hold an attempt's buffer lock, waiting for other writers to release it.
+
+    The lock is a cache entry created with the atomic ``add``, so it is
+    shared by every worker using the cache. It expires after
+    ``ANSWER_BUFFER_LOCK_TIMEOUT`` in case its holder dies.
+    """
+    key = _lock_key(attempt_id)
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + ANSWER_BUFFER_LOCK_TIMEOUT * 2
+    while not cache.add(key, token, ANSWER_BUFFER_LOCK_TIMEOUT):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Answer buffer of attempt {attempt_id} is locked")
+        time.sleep(0.01)
+    try:
+        yield
+    finally:
+        # Do not release a lock that expired and was taken by another writer
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+def get_buffer(attempt):
+    """
+    Get an attempt's buffered answers and highest client sequence number.
+
+    Returns:
+        Tuple of (answers dict, client sequence number)
+    """
+    entry = cache.get(_buffer_key(attempt.pk))
+    if entry is None:
+        return {}, attempt.last_client_seq
+    return entry["answers"], max(entry["seq"], attempt.last_client_seq)
+
+
+def buffer_answers(attempt, answers, seq=None):
+    """
+    Merge validated answers into an attempt's buffer.
+
+    The read-modify-write runs under the attempt's buffer lock, so
+    concurrent writes from different workers cannot drop each other's
+    answers. Every write increments the buffer's version, which the flusher
+    compares to the last version it persisted to find dirty attempts. Each
+    answer also keeps the version it was last changed in, so periodic
+    flushes only write answers changed since the last one.
+
+    Args:
+        attempt: In-progress ExamAttempt instance
+        answers: Dict mapping question ID to selected option ID
+        seq: Optional client sequence number; stale deltas are dropped
+
+    Returns:
+        Tuple of (applied, acknowledged sequence number)
+    """
+    key = _buffer_key(attempt.pk)
+    with _locked(attempt.pk):
+        entry = cache.get(key)
+        if entry is None:
+            # Continue after the last flushed version, so answers of a buffer
+            # that expired and is recreated are not mistaken for flushed ones
+            entry = {
+                "answers": {},
+                "seq": attempt.last_client_seq,
+                "version": cache.get(_flushed_key(attempt.pk)) or 0,
+                "changed": {},
+            }
+        if seq is not None:
+            if seq <= entry["seq"]:
+                return False, entry["seq"]
+            entry["seq"] = seq
+        entry["version"] += 1
+        entry["answers"].update(answers)
+        entry["changed"].update(
+            (question_id, entry["version"]) for question_id in answers
+        )
+        cache.set(key, entry, ANSWER_BUFFER_CACHE_TIMEOUT)
+    return True, entry["seq"]
+
+
+def flush_attempts(attempt_ids, force=False):
+    """
+    Persist buffered answers of the given attempts to the database.
+
+    In-progress attempts are locked (skipping rows another flusher or a
+    submit holds) and their answers changed since the last flush are
+    written with one bulk write; a forced flush writes every buffered
+    answer. The buffer itself is kept; only the flushed version marker is
+    advanced, after the transaction commits, so a failed flush is retried
+    on the next run.
+
+    Args:
+        attempt_ids: IDs of attempts to flush
+        force: Flush even if the buffer looks unchanged since the last flush
+
+    Returns:
+        Number of attempts flushed
+    """
+    from apps.attempts.models import ExamAttempt
+    from apps.attempts.services.answers import AnswerService
+
+    attempt_ids = list(attempt_ids)
+    if not attempt_ids:
+        return 0
+
+    keys = [_buffer_key(i) for i in attempt_ids] + [
+        _flushed_key(i) for i in attempt_ids
+    ]
+    cached = cache.get_many(keys)
+    dirty = {}
+    for attempt_id in attempt_ids:
+        entry = cached.get(_buffer_key(attempt_id))
+        if entry is None:
+            continue
+        flushed = cached.get(_flushed_key(attempt_id))
+        if force:
+            dirty[attempt_id] = entry
+        elif entry["version"] != flushed:
+            dirty[attempt_id] = dict(entry, answers=_changed_since(entry, flushed))
+    if not dirty:
+        return 0
+
+    with transaction.atomic():
+        attempts = ExamAttempt.objects.in_progress().filter(pk__in=list(dirty))
+        if force:
+            # Finalizing: wait for any periodic flush holding the row
+            attempts = attempts.select_for_update(of=("self",))
+        elif connection.features.has_select_for_update_skip_locked:
+            attempts = attempts.select_for_update(skip_locked=True, of=("self",))
+        attempts = list(attempts.select_related("exam"))
+
+        AnswerService.write_many(
+            [(attempt, dirty[attempt.pk]["answers"]) for attempt in attempts],
+            seqs={attempt.pk: dirty[attempt.pk]["seq"] for attempt in attempts},
+        )
+        for attempt in attempts:
+            seq = dirty[attempt.pk]["seq"]
+            if seq > attempt.last_client_seq:
+                ExamAttempt.objects.filter(
+                    pk=attempt.pk, last_client_seq__lt=seq
+                ).update(last_client_seq=seq)
+
+        versions = {
+            _flushed_key(attempt.pk): dirty[attempt.pk]["version"]
+            for attempt in attempts
+        }
+        transaction.on_commit(
+            lambda: cache.set_many(versions, ANSWER_BUFFER_CACHE_TIMEOUT)
+        )
+    return len(attempts)
+
+
+def _changed_since(entry, flushed):
+    """Get the buffered answers changed after the given flushed version."""
+    if flushed is None:
+        return entry["answers"]
+    changed = entry.get("changed", {})
+    return {
+        question_id: option_id
+        for question_id, option_id in entry["answers"].items()
+        if changed.get(question_id, flushed + 1) > flushed
+    }
+
+
+def flush_all(batch_size=500):
+    """
+    Flush the buffers of every in-progress attempt.
+
+    Returns:
+        Number of attempts flushed
+    """
+    from apps.attempts.models import ExamAttempt
+
+    attempt_ids = list(
+        ExamAttempt.objects.in_progress().order_by("pk").values_list("pk", flat=True)
+    )
+    flushed = 0
+    for start in range(0, len(attempt_ids), batch_size):
+        try:
+            flushed += flush_attempts(attempt_ids[start : start + batch_size])
+        except Exception as e:
+            # Buffers are kept, so the next run retries this batch
+            logger.error(f"Failed to flush answer buffers: {e}")
+    return flushed
+
+
+def discard_buffers(attempt_ids):
+    """Drop the buffers of finalized attempts."""
+    keys = []
+    for attempt_id in attempt_ids:
+        keys += [_buffer_key(attempt_id), _flushed_key(attempt_id)]
+    cache.delete_many(keys)
@@ -0,0 +1,174 @@
+"""Append-only journal of answer selections."""
+
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef
+
+logger = logging.getLogger(__name__)
+
+
+def is_enabled():
+    """Check whether answers should be journaled instead of upserted."""
+    return settings.EXAM_ANSWER_JOURNAL
+
+
+def append(attempt_entries):
+    """
+    Append answer events for several attempts with one bulk insert.
+
+    Answers that do not belong to an attempt's paper are skipped. Events
+    are never updated, so concurrent saves do not contend on answer rows.
+    The attempts' rows are locked until the transaction commits, so
+    ``materialize`` cannot advance a journal position past an event that
+    is still being inserted.
+
+    Args:
+        attempt_entries: Iterable of (attempt, entries) pairs, where entries
+            is an iterable of (client sequence number or None, question ID,
+            option ID) tuples
+
+    Returns:
+        Number of events appended
+    """
+    from apps.attempts.models import AnswerEvent, ExamAttempt
+    from apps.attempts.services.answers import AnswerService
+
+    attempt_entries = list(attempt_entries)
+    events = [
+        AnswerEvent(
+            attempt=attempt,
+            question_id=question_id,
+            selected_option_id=option_id,
+            client_seq=seq,
+        )
+        for attempt, entries in attempt_entries
+        for seq, question_id, option_id in entries
+        if AnswerService.is_valid_answer(attempt, question_id, option_id)
+    ]
+    if events:
+        with transaction.atomic():
+            attempt_ids = {attempt.pk for attempt, _ in attempt_entries}
+            list(
+                ExamAttempt.objects.select_for_update()
+                .filter(pk__in=attempt_ids)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            AnswerEvent.objects.bulk_create(events)
+    return len(events)
+
+
+def get_pending_answers(attempt):
+    """Get answers journaled since the attempt was last materialized."""
+    events = attempt.answer_events.filter(pk__gt=attempt.journal_position)
+    return dict(events.order_by("pk").values_list("question_id", "selected_option_id"))
+
+
+def materialize(attempt_ids, force=False):
+    """
+    Fold new journal events into the ``ExamAnswer`` projection.
+
+    The latest event per question of each attempt is graded and written
+    with one bulk upsert, and the attempt's journal position advances past
+    the events folded in. In-progress attempts are locked, skipping rows
+    another compactor or an ``append`` holds unless ``force`` is set, so
+    every event below the new position has committed.
+
+    Args:
+        attempt_ids: IDs of attempts to materialize
+        force: Wait for locked attempts instead of skipping them (finalizing)
+
+    Returns:
+        Number of attempts materialized
+    """
+    from apps.attempts.models import AnswerEvent, ExamAttempt
+    from apps.attempts.services.answers import AnswerService
+
+    attempt_ids = list(attempt_ids)
+    if not attempt_ids:
+        return 0
+
+    with transaction.atomic():
+        attempts = ExamAttempt.objects.in_progress().filter(pk__in=attempt_ids)
+        if force:
+            attempts = attempts.select_for_update(of=("self",))
+        elif connection.features.has_select_for_update_skip_locked:
+            attempts = attempts.select_for_update(skip_locked=True, of=("self",))
+        attempts = {a.pk: a for a in attempts.select_related("exam")}
+
+        events = (
+            AnswerEvent.objects.filter(
+                attempt_id__in=list(attempts),
+                pk__gt=F("attempt__journal_position"),
+            )
+            .order_by("pk")
+            .values_list("pk", "attempt_id", "question_id", "selected_option_id")
+        )
+        latest = {}
+        positions = {}
+        for pk, attempt_id, question_id, option_id in events:
+            latest.setdefault(attempt_id, {})[question_id] = option_id
+            positions[attempt_id] = pk
+        if not latest:
+            return 0
+
+        AnswerService.upsert_answers(
+            [(attempts[attempt_id], answers) for attempt_id, answers in latest.items()]
+        )
+        for attempt_id, position in positions.items():
+            ExamAttempt.objects.filter(pk=attempt_id).update(journal_position=position)
+            attempts[attempt_id].journal_position = position
+    return len(latest)
+
+
+def compact(batch_size=500):
+    """
+    Materialize the journal of every in-progress attempt with new events.
+
+    Returns:
+        Number of attempts materialized
+    """
+    from apps.attempts.models import AnswerEvent, ExamAttempt
+
+    pending = AnswerEvent.objects.filter(
+        attempt=OuterRef("pk"), pk__gt=OuterRef("journal_position")
+    )
+    attempt_ids = list(
+        ExamAttempt.objects.in_progress()
+        .filter(Exists(pending))
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    compacted = 0
+    for start in range(0, len(attempt_ids), batch_size):
+        try:
+            compacted += materialize(attempt_ids[start : start + batch_size])
+        except Exception as e:
+            # Events are kept, so the next run retries this batch
+            logger.error(f"Failed to compact answer journal: {e}")
+    return compacted
+
+
+def replay(attempt, until=None):
+    """
+    Replay an attempt's journal, e.g. to settle a dispute.
+
+    Args:
+        attempt: ExamAttempt instance
+        until: Optional datetime; only events recorded up to then are replayed
+
+    Returns:
+        Tuple of (events, answers) where events is the list of AnswerEvent
+        instances in the order they were recorded and answers maps question
+        ID to the option selected after the last of them
+    """
+    events = attempt.answer_events.order_by("pk")
+    if until is not None:
+        events = events.filter(created_at__lte=until)
+    events = list(events)
+    answers = {}
+    for event in events:
+        answers[event.question_id] = event.selected_option_id
+    return events, answers
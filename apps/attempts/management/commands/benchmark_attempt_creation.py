@@ -0,0 +1,146 @@
+"""Management command to benchmark exam attempt creation."""
+
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.academic.models import Class, Subject
+from apps.attempts.models import ExamAttempt
+from apps.exams.models import Exam, ExamQuestion
+from apps.questions.models import Question, QuestionOption
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    """Raised to discard all benchmark fixtures."""
+
+
+class Command(BaseCommand):
+    """Measure attempt-creation latency and query count as paper size grows."""
+
+    help = (
+        "Benchmark ExamAttempt.create_attempt for increasing paper sizes. "
+        "All fixtures are created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="10,50,100,200",
+            help="Comma-separated question counts to benchmark (default: 10,50,100,200)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Attempts to create per paper size (default: 20)",
+        )
+        parser.add_argument(
+            "--options",
+            type=int,
+            default=4,
+            help="Options per question (default: 4)",
+        )
+        parser.add_argument(
+            "--random",
+            action="store_true",
+            help="Benchmark random-question exams instead of manual selection",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(s) for s in options["sizes"].split(",") if s.strip()]
+        except ValueError:
+            raise CommandError("--sizes must be a comma-separated list of integers")
+
+        mode = "random" if options["random"] else "manual"
+        self.stdout.write(
+            f"Attempt creation benchmark ({mode} selection, "
+            f"{options['repeat']} runs per size)"
+        )
+        self.stdout.write(
+            f"{'Questions':>10} {'Queries':>8} {'Mean ms':>9} "
+            f"{'Median ms':>10} {'Max ms':>8}"
+        )
+
+        try:
+            with transaction.atomic():
+                for size in sizes:
+                    exam, student = self._build_fixtures(
+                        size, options["options"], options["random"]
+                    )
+                    self._benchmark(exam, student, size, options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _benchmark(self, exam, student, size, repeat):
+        timings = []
+        query_counts = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                attempt = ExamAttempt.create_attempt(exam, student)
+                timings.append((time.perf_counter() - start) * 1000)
+            query_counts.append(len(ctx.captured_queries))
+            attempt.delete()
+
+        self.stdout.write(
+            f"{size:>10} {max(query_counts):>8} "
+            f"{statistics.mean(timings):>9.2f} "
+            f"{statistics.median(timings):>10.2f} {max(timings):>8.2f}"
+        )
+
+    def _build_fixtures(self, size, option_count, use_random):
+        suffix = f"{size}-{time.time_ns()}"
+        cls = Class.objects.create(name=f"Benchmark {suffix}"[:50])
+        subject = Subject.objects.create(name="Benchmark", assigned_class=cls)
+        author = User.objects.create_user(
+            username=f"bench-author-{suffix}",
+            email=f"bench-author-{suffix}@example.com",
+            role=User.Role.EXAMINER,
+        )
+        student = User.objects.create_user(
+            username=f"bench-student-{suffix}",
+            email=f"bench-student-{suffix}@example.com",
+            role=User.Role.STUDENT,
+            assigned_class=cls,
+        )
+
+        questions = Question.objects.bulk_create(
+            Question(
+                question_text=f"Benchmark question {i}",
+                subject=subject,
+                created_by=author,
+            )
+            for i in range(size)
+        )
+        QuestionOption.objects.bulk_create(
+            QuestionOption(question=question, text=f"Option {j}")
+            for question in questions
+            for j in range(option_count)
+        )
+
+        now = timezone.now()
+        exam = Exam.objects.create(
+            title=f"Benchmark {size}",
+            subject=subject,
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+            use_random_questions=use_random,
+            random_question_count=size,
+            created_by=author,
+        )
+        if not use_random:
+            ExamQuestion.objects.bulk_create(
+                ExamQuestion(exam=exam, question=question, order=i)
+                for i, question in enumerate(questions)
+            )
+        return exam, student
@@ -0,0 +1,220 @@
+"""Management command to benchmark concurrent autosave throughput."""
+
+import asyncio
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.academic.models import Class, Subject
+from apps.attempts.models import ExamAttempt
+from apps.exams.models import Exam, ExamQuestion
+from apps.questions.models import Question, QuestionOption
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Compare concurrent autosave throughput of the sync and async endpoints."""
+
+    help = (
+        "Benchmark concurrent autosaves through the sync (WSGI) and async "
+        "(ASGI) endpoints in-process. Fixtures are committed so worker "
+        "threads can see them, and deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--students",
+            type=int,
+            default=50,
+            help="Concurrent students, each with its own attempt (default: 50)",
+        )
+        parser.add_argument(
+            "--saves",
+            type=int,
+            default=20,
+            help="Autosaves sent by each student (default: 20)",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Sync request concurrency, like gunicorn workers x threads "
+            "(default: 8)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=64,
+            help="Async requests in flight at once (default: 64)",
+        )
+
+    def handle(self, *args, **options):
+        counts = ("students", "saves", "threads", "concurrency")
+        if min(options[name] for name in counts) < 1:
+            raise CommandError(
+                "--students, --saves, --threads and --concurrency must be positive"
+            )
+
+        cls = self._build_fixtures(options["students"])
+        try:
+            self.stdout.write(
+                f"Autosave benchmark: {options['students']} students x "
+                f"{options['saves']} saves"
+            )
+            self.stdout.write(
+                f"{'Mode':>8} {'Requests':>9} {'Seconds':>8} {'Req/s':>8} "
+                f"{'p50 ms':>8} {'p95 ms':>8} {'Errors':>7}"
+            )
+            # The test clients send requests to "testserver"
+            hosts = [*settings.ALLOWED_HOSTS, "testserver"]
+            with override_settings(ALLOWED_HOSTS=hosts):
+                self._report("sync", *self._run_sync(options))
+                self._report("async", *asyncio.run(self._run_async(options)))
+        finally:
+            connections.close_all()
+            cls.delete()
+            User.objects.filter(pk__in=[s.pk for s in self.students]).delete()
+
+    def _report(self, mode, elapsed, latencies, errors):
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+        self.stdout.write(
+            f"{mode:>8} {len(latencies):>9} {elapsed:>8.2f} "
+            f"{len(latencies) / elapsed:>8.1f} "
+            f"{statistics.median(latencies) if latencies else 0:>8.2f} "
+            f"{p95:>8.2f} {errors:>7}"
+        )
+
+    def _payload(self, question_ids, options, seq):
+        question_id = question_ids[seq % len(question_ids)]
+        return json.dumps(
+            {
+                "seq": seq,
+                "answers": {str(question_id): options[question_id][seq % 4]},
+            }
+        )
+
+    def _run_sync(self, options):
+        url = reverse("attempts:autosave", args=[self.exam.pk])
+        clients = []
+        for student in self.students:
+            client = Client()
+            client.force_login(student)
+            clients.append(client)
+
+        def student_session(index):
+            client = clients[index]
+            latencies, errors = [], 0
+            for seq in range(1, options["saves"] + 1):
+                start = time.perf_counter()
+                response = client.post(
+                    url,
+                    self._payload(self.question_ids, self.options, seq),
+                    content_type="application/json",
+                    secure=True,
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+                errors += response.status_code != 200
+            connections.close_all()
+            return latencies, errors
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+            results = list(pool.map(student_session, range(len(clients))))
+        elapsed = time.perf_counter() - start
+        return elapsed, [ms for r in results for ms in r[0]], sum(r[1] for r in results)
+
+    async def _run_async(self, options):
+        url = reverse("attempts:autosave_async", args=[self.exam.pk])
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        offset = options["saves"]  # Continue after the sync run's sequence
+
+        clients = []
+        for student in self.students:
+            client = AsyncClient()
+            await client.aforce_login(student)
+            clients.append(client)
+
+        async def student_session(client):
+            latencies, errors = [], 0
+            for seq in range(offset + 1, offset + options["saves"] + 1):
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.post(
+                        url,
+                        self._payload(self.question_ids, self.options, seq),
+                        content_type="application/json",
+                        secure=True,
+                    )
+                    latencies.append((time.perf_counter() - start) * 1000)
+                errors += response.status_code != 200
+            return latencies, errors
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(student_session(c) for c in clients))
+        elapsed = time.perf_counter() - start
+        return elapsed, [ms for r in results for ms in r[0]], sum(r[1] for r in results)
+
+    def _build_fixtures(self, student_count):
+        suffix = time.time_ns()
+        cls = Class.objects.create(name=f"Autosave bench {suffix}"[:50])
+        subject = Subject.objects.create(name="Benchmark", assigned_class=cls)
+        self.students = [
+            User.objects.create_user(
+                username=f"bench-autosave-{suffix}-{i}",
+                email=f"bench-autosave-{suffix}-{i}@example.com",
+                role=User.Role.STUDENT,
+                assigned_class=cls,
+            )
+            for i in range(student_count)
+        ]
+
+        questions = Question.objects.bulk_create(
+            Question(
+                question_text=f"Benchmark question {i}",
+                subject=subject,
+                created_by=self.students[0],
+            )
+            for i in range(20)
+        )
+        QuestionOption.objects.bulk_create(
+            QuestionOption(question=question, text=f"Option {j}")
+            for question in questions
+            for j in range(4)
+        )
+        now = timezone.now()
+        self.exam = Exam.objects.create(
+            title="Autosave benchmark",
+            subject=subject,
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+            created_by=self.students[0],
+        )
+        # Publish without signals so no notifications are sent
+        Exam.objects.filter(pk=self.exam.pk).update(status=Exam.Status.PUBLISHED)
+        ExamQuestion.objects.bulk_create(
+            ExamQuestion(exam=self.exam, question=question, order=i)
+            for i, question in enumerate(questions)
+        )
+        for student in self.students:
+            ExamAttempt.start_attempt(self.exam, student)
+
+        self.question_ids = [q.pk for q in questions]
+        self.options = {q.pk: [] for q in questions}
+        for question_id, option_id in QuestionOption.objects.filter(
+            question__in=questions
+        ).values_list("question_id", "id"):
+            self.options[question_id].append(option_id)
+        return cls
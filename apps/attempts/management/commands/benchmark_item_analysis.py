@@ -0,0 +1,185 @@
+"""Management command to benchmark exam item analysis."""
+
+import math
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.academic.models import Class, Subject
+from apps.attempts.models import ExamAnswer, ExamAttempt
+from apps.attempts.services.item_analysis import ItemAnalysisService
+from apps.exams.cache import get_current_paper
+from apps.exams.models import Exam, ExamQuestion
+from apps.questions.models import Question, QuestionOption
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    """Raised to discard all benchmark fixtures."""
+
+
+class Command(BaseCommand):
+    """Measure item analysis time for an exam with many completed attempts."""
+
+    help = (
+        "Benchmark ItemAnalysisService.analyze on a simulated exam whose "
+        "answers follow a one-parameter logistic model. All fixtures are "
+        "created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--attempts",
+            type=int,
+            default=5000,
+            help="Completed attempts to analyse (default: 5000)",
+        )
+        parser.add_argument(
+            "--questions",
+            type=int,
+            default=100,
+            help="Questions on the exam (default: 100)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Analyses to time (default: 3)",
+        )
+
+    def handle(self, *args, **options):
+        if not ItemAnalysisService.is_available():
+            raise CommandError("Item analysis requires NumPy (the analytics extra)")
+        if min(options["attempts"], options["questions"], options["repeat"]) < 1:
+            raise CommandError("--attempts, --questions and --repeat must be positive")
+
+        try:
+            with transaction.atomic():
+                start = time.perf_counter()
+                exam = self._build_fixtures(options["attempts"], options["questions"])
+                self.stdout.write(
+                    f"Built {options['attempts']} attempts x {options['questions']} "
+                    f"questions in {time.perf_counter() - start:.1f}s"
+                )
+                self._benchmark(exam, options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _benchmark(self, exam, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                analysis = ItemAnalysisService.analyze(exam)
+                timings.append((time.perf_counter() - start) * 1000)
+
+        items = analysis["items"]
+        self.stdout.write(
+            f"Analysis: {len(ctx.captured_queries)} queries, "
+            f"best {min(timings):.0f} ms, worst {max(timings):.0f} ms"
+        )
+        kr20 = "n/a" if analysis["kr20"] is None else f"{analysis['kr20']:.3f}"
+        self.stdout.write(
+            f"KR-20 {kr20}; mean difficulty "
+            f"{sum(i['p_value'] for i in items) / len(items):.3f}; mean "
+            f"discrimination "
+            f"{sum(i['discrimination'] or 0 for i in items) / len(items):.3f}"
+        )
+
+    def _build_fixtures(self, attempt_count, question_count):
+        suffix = time.time_ns()
+        cls = Class.objects.create(name=f"Item analysis bench {suffix}"[:50])
+        subject = Subject.objects.create(name="Benchmark", assigned_class=cls)
+        author = User.objects.create_user(
+            username=f"bench-items-author-{suffix}",
+            email=f"bench-items-author-{suffix}@example.com",
+            role=User.Role.EXAMINER,
+        )
+        students = User.objects.bulk_create(
+            User(
+                username=f"bench-items-{suffix}-{i}",
+                email=f"bench-items-{suffix}-{i}@example.com",
+                role=User.Role.STUDENT,
+                assigned_class=cls,
+                password="!",
+            )
+            for i in range(attempt_count)
+        )
+
+        questions = Question.objects.bulk_create(
+            Question(
+                question_text=f"Benchmark question {i}",
+                subject=subject,
+                created_by=author,
+            )
+            for i in range(question_count)
+        )
+        options = QuestionOption.objects.bulk_create(
+            QuestionOption(question=question, text=f"Option {j}")
+            for question in questions
+            for j in range(4)
+        )
+        options_by_question = {}
+        for option in options:
+            options_by_question.setdefault(option.question_id, []).append(option.pk)
+        for question in questions:
+            question.correct_option_id = options_by_question[question.pk][0]
+        Question.objects.bulk_update(questions, ["correct_option"])
+
+        now = timezone.now()
+        exam = Exam.objects.create(
+            title="Item analysis benchmark",
+            subject=subject,
+            use_random_questions=False,
+            start_time=now - timedelta(hours=2),
+            end_time=now - timedelta(hours=1),
+            created_by=author,
+        )
+        ExamQuestion.objects.bulk_create(
+            ExamQuestion(exam=exam, question=question, order=i)
+            for i, question in enumerate(questions)
+        )
+
+        paper = get_current_paper(exam)
+        attempts = ExamAttempt.objects.bulk_create(
+            ExamAttempt.build_attempt(
+                exam,
+                student,
+                paper,
+                status=ExamAttempt.Status.SUBMITTED,
+                submitted_at=now,
+            )
+            for student in students
+        )
+
+        # Students of varying ability answer questions of varying difficulty
+        rng = random.Random(0)
+        difficulty = [rng.gauss(0, 1) for _ in questions]
+        answers = []
+        for attempt in attempts:
+            ability = rng.gauss(0, 1)
+            for question, b in zip(questions, difficulty):
+                if rng.random() < 0.05:
+                    continue  # omitted
+                choices = options_by_question[question.pk]
+                correct = rng.random() < 1 / (1 + math.exp(b - ability))
+                answers.append(
+                    ExamAnswer(
+                        attempt=attempt,
+                        question=question,
+                        selected_option_id=(
+                            choices[0] if correct else rng.choice(choices[1:])
+                        ),
+                        is_correct=correct,
+                    )
+                )
+        ExamAnswer.objects.bulk_create(answers, batch_size=5000)
+        return exam
@@ -0,0 +1,52 @@
+"""Management command to materialize the answer journal."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.attempts import journal as answer_journal
+
+
+class Command(BaseCommand):
+    """Fold journaled answer events into the exam answers."""
+
+    help = (
+        "Materialize answers journaled since the last compaction into the "
+        "exam answers of in-progress attempts. Run with --loop next to the "
+        "web workers while EXAM_ANSWER_JOURNAL is enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep compacting until interrupted instead of running once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=30,
+            help="Seconds between compactions with --loop (default: 30)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Attempts compacted per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        if not answer_journal.is_enabled():
+            self.stdout.write(
+                self.style.WARNING(
+                    "The answer journal is disabled; only existing events are "
+                    "compacted."
+                )
+            )
+
+        while True:
+            compacted = answer_journal.compact(batch_size=options["batch_size"])
+            self.stdout.write(f"Compacted the journal of {compacted} attempts.")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,71 @@
+"""Management command to time out and score expired exam attempts."""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.attempts.services.scoring import ScoringService
+
+
+class Command(BaseCommand):
+    """Finalize in-progress attempts whose exam has ended."""
+
+    help = (
+        "Time out and score in-progress attempts whose exam has ended, and "
+        "delete pre-generated attempts nobody started. Safe to run on several "
+        "nodes at once; schedule it every minute or run it with --loop."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Attempts finalized per transaction (default: 500)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep sweeping until interrupted instead of exiting when done",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=30,
+            help="Seconds to sleep between sweeps with --loop (default: 30)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer")
+
+        while True:
+            total = self._sweep(options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Finalized {total} expired attempts.")
+            )
+            discarded = self._discard_pending(options["batch_size"])
+            if discarded:
+                self.stdout.write(
+                    f"Deleted {discarded} unstarted pre-generated attempts."
+                )
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
+
+    def _sweep(self, batch_size):
+        total = 0
+        while True:
+            finalized = ScoringService.finalize_expired(batch_size=batch_size)
+            if not finalized:
+                return total
+            total += finalized
+            self.stdout.write(f"  {total} attempts finalized")
+
+    def _discard_pending(self, batch_size):
+        total = 0
+        while True:
+            discarded = ScoringService.discard_expired_pending(batch_size=batch_size)
+            if not discarded:
+                return total
+            total += discarded
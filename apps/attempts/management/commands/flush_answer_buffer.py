@@ -0,0 +1,54 @@
+"""Management command to persist write-behind answer buffers."""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.attempts import buffer as answer_buffer
+
+
+class Command(BaseCommand):
+    """Flush buffered exam answers from the cache to the database."""
+
+    help = (
+        "Persist answers buffered in the cache by write-behind autosave. "
+        "Run with --loop next to the web workers while "
+        "EXAM_ANSWER_WRITE_BEHIND is enabled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep flushing until interrupted instead of running once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=settings.EXAM_ANSWER_FLUSH_INTERVAL,
+            help="Seconds between flushes with --loop "
+            f"(default: {settings.EXAM_ANSWER_FLUSH_INTERVAL})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Attempts flushed per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        level, detail = answer_buffer.get_buffer_durability()
+        style = self.style.SUCCESS if level == "shared" else self.style.ERROR
+        self.stdout.write(style(f"Cache durability: {level} - {detail}"))
+        if not answer_buffer.is_enabled():
+            self.stdout.write(
+                self.style.WARNING("Write-behind is disabled; nothing is buffered.")
+            )
+
+        while True:
+            flushed = answer_buffer.flush_all(batch_size=options["batch_size"])
+            self.stdout.write(f"Flushed answers of {flushed} attempts.")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
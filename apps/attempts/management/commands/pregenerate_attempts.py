@@ -0,0 +1,62 @@
+"""Management command to pre-generate exam attempts before exams start."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.attempts.models import ExamAttempt
+from apps.exams.models import Exam
+
+
+class Command(BaseCommand):
+    """Pre-generate randomized attempts for students of upcoming exams."""
+
+    help = (
+        "Pre-generate randomized attempts for every active student of exams "
+        "starting soon, so starting an exam only stamps started_at"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--exam-id",
+            type=int,
+            help="Pre-generate attempts for a specific exam ID only",
+        )
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=15,
+            help="Include published exams starting within this many minutes "
+            "(default: 15)",
+        )
+
+    def handle(self, *args, **options):
+        exam_id = options.get("exam_id")
+        exams = Exam.objects.published().active().select_related("subject")
+
+        if exam_id:
+            exams = exams.filter(pk=exam_id)
+            if not exams.exists():
+                self.stdout.write(
+                    self.style.ERROR(f"Published exam with ID {exam_id} not found")
+                )
+                return
+        else:
+            now = timezone.now()
+            exams = exams.filter(
+                start_time__gte=now,
+                start_time__lte=now + timedelta(minutes=options["minutes"]),
+            )
+
+        total = 0
+        for exam in exams:
+            with transaction.atomic():
+                created = ExamAttempt.pregenerate_attempts(exam)
+            total += created
+            self.stdout.write(f"{exam.title}: {created} attempts pre-generated")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Pre-generated {total} attempts in total.")
+        )
@@ -0,0 +1,60 @@
+"""Management command to rebuild exam score statistics."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.attempts.models import ExamAttempt, ExamStatistics
+from apps.attempts.services.exam_statistics import ExamStatisticsService
+from apps.exams.models import Exam
+
+
+class Command(BaseCommand):
+    """Recompute exam statistics from the completed attempts."""
+
+    help = (
+        "Rebuild the per-exam score statistics (mean, spread, histogram and "
+        "quantile estimates) from the completed attempts. Statistics are "
+        "kept up to date as attempts are finalized; run this to backfill, "
+        "after restoring data or after deleting attempts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--exam",
+            type=int,
+            help="Only rebuild the statistics of the exam with this ID",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Exams rebuilt per transaction (default: 50)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        if options["exam"] is not None:
+            if not Exam.objects.filter(pk=options["exam"]).exists():
+                raise CommandError(f"Exam {options['exam']} does not exist")
+            exam_ids = [options["exam"]]
+        else:
+            # Exams with statistics but no attempts left get theirs removed
+            exam_ids = sorted(
+                set(
+                    ExamAttempt.objects.completed()
+                    .values_list("exam_id", flat=True)
+                    .distinct()
+                )
+                | set(ExamStatistics.objects.values_list("exam_id", flat=True))
+            )
+
+        rebuilt = 0
+        batch_size = options["batch_size"]
+        for start in range(0, len(exam_ids), batch_size):
+            rebuilt += ExamStatisticsService.rebuild(
+                exam_ids[start : start + batch_size]
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt statistics for {rebuilt} exams.")
+        )
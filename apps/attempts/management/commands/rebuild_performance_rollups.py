@@ -0,0 +1,63 @@
+"""Management command to rebuild student performance rollups."""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.attempts.models import ExamAttempt, PerformanceRollup
+from apps.attempts.services.performance import PerformanceService
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Recompute performance rollups from the completed attempts."""
+
+    help = (
+        "Rebuild the per-student, per-subject performance rollups from the "
+        "completed attempts. Rollups are kept up to date as attempts are "
+        "finalized; run this after restoring data or deleting attempts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--student",
+            type=int,
+            help="Only rebuild the rollups of the student with this user ID",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Students rebuilt per transaction (default: 200)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        if options["student"] is not None:
+            if not User.objects.filter(pk=options["student"]).exists():
+                raise CommandError(f"User {options['student']} does not exist")
+            student_ids = [options["student"]]
+        else:
+            # Students with rollups but no attempts left get theirs removed
+            student_ids = sorted(
+                set(
+                    ExamAttempt.objects.completed()
+                    .values_list("student_id", flat=True)
+                    .distinct()
+                )
+                | set(PerformanceRollup.objects.values_list("student_id", flat=True))
+            )
+
+        rebuilt = 0
+        batch_size = options["batch_size"]
+        for start in range(0, len(student_ids), batch_size):
+            rebuilt += PerformanceService.rebuild(
+                student_ids[start : start + batch_size]
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {rebuilt} rollups for {len(student_ids)} students."
+            )
+        )
@@ -0,0 +1,82 @@
+"""Management command to regrade answers after an answer key change."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.attempts.services.regrade import RegradeService
+from apps.exams.models import ExamQuestion
+from apps.questions.models import Question
+
+
+class Command(BaseCommand):
+    """Recompute answer correctness and attempt scores for changed questions."""
+
+    help = (
+        "Regrade stored answers against the current answer key and rescore "
+        "the affected completed attempts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--question-id",
+            type=int,
+            action="append",
+            default=[],
+            help="Regrade a specific question (repeatable)",
+        )
+        parser.add_argument(
+            "--exam-id",
+            type=int,
+            help="Regrade every question assigned to an exam",
+        )
+        parser.add_argument(
+            "--subject-id",
+            type=int,
+            help="Regrade every question in a subject",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RegradeService.DEFAULT_BATCH_SIZE,
+            help=f"Rows updated per statement (default: {RegradeService.DEFAULT_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        question_ids = set(options["question_id"])
+        if options["exam_id"]:
+            question_ids.update(
+                ExamQuestion.objects.filter(exam_id=options["exam_id"]).values_list(
+                    "question_id", flat=True
+                )
+            )
+        if options["subject_id"]:
+            question_ids.update(
+                Question.objects.filter(subject_id=options["subject_id"]).values_list(
+                    "id", flat=True
+                )
+            )
+        if not question_ids:
+            raise CommandError(
+                "Nothing to regrade. Pass --question-id, --exam-id or --subject-id."
+            )
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer")
+
+        self.stdout.write(f"Regrading {len(question_ids)} question(s)...")
+        run = RegradeService.regrade_questions(
+            question_ids,
+            batch_size=options["batch_size"],
+            progress=self._report,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Regrade #{run.pk} complete: {run.answers_changed} of "
+                f"{run.answers_checked} answers changed, "
+                f"{run.attempts_rescored} attempts rescored."
+            )
+        )
+
+    def _report(self, stage, processed, changed):
+        if stage == "answers":
+            self.stdout.write(f"  answers: {processed} checked, {changed} changed")
+        else:
+            self.stdout.write(f"  attempts: {processed} rescored")
@@ -0,0 +1,77 @@
+"""Management command to replay an attempt's answer journal."""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from apps.attempts import journal as answer_journal
+from apps.attempts.models import ExamAttempt
+
+
+class Command(BaseCommand):
+    """Show the answer history of an attempt, e.g. to settle a dispute."""
+
+    help = (
+        "Replay the answer journal of an attempt: list every recorded "
+        "selection and the resulting answers, and compare them with the "
+        "stored answers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("attempt_id", type=int, help="ID of the attempt")
+        parser.add_argument(
+            "--until",
+            help="Only replay events recorded up to this ISO 8601 date and time",
+        )
+
+    def handle(self, *args, **options):
+        attempt = (
+            ExamAttempt.objects.select_related("student", "exam")
+            .filter(pk=options["attempt_id"])
+            .first()
+        )
+        if attempt is None:
+            raise CommandError(f"Attempt {options['attempt_id']} does not exist")
+
+        until = None
+        if options["until"]:
+            until = parse_datetime(options["until"])
+            if until is None:
+                raise CommandError("--until must be an ISO 8601 date and time")
+
+        events, answers = answer_journal.replay(attempt, until=until)
+        self.stdout.write(f"{attempt} ({attempt.get_status_display()})")
+        if not events:
+            self.stdout.write(self.style.WARNING("No journaled answers."))
+            return
+
+        self.stdout.write(
+            f"{'Recorded at':<32} {'Seq':>6} {'Question':>9} {'Option':>8}"
+        )
+        for event in events:
+            self.stdout.write(
+                f"{event.created_at.isoformat():<32} {event.client_seq or '-':>6} "
+                f"{event.question_id:>9} {event.selected_option_id:>8}"
+            )
+
+        self.stdout.write(f"\nReplayed answers: {len(answers)} questions")
+        if until is not None:
+            return
+
+        stored = dict(attempt.answers.values_list("question_id", "selected_option_id"))
+        differences = 0
+        for question_id in sorted(answers.keys() | stored.keys()):
+            replayed = answers.get(question_id)
+            if replayed != stored.get(question_id):
+                differences += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  Question {question_id}: journal {replayed}, "
+                        f"stored {stored.get(question_id)}"
+                    )
+                )
+        if differences:
+            self.stdout.write(
+                self.style.WARNING(f"{differences} answers differ from the journal.")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Stored answers match the journal."))
@@ -0,0 +1,212 @@
+"""Management command to stress-test concurrent exam attempt creation."""
+
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.academic.models import Class, Subject
+from apps.attempts.models import ExamAttempt
+from apps.attempts.services.scoring import ScoringService
+from apps.exams.models import Exam, ExamQuestion
+from apps.questions.models import Question, QuestionOption
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Start the same exam from many threads at once and check the invariants."""
+
+    help = (
+        "Stress-test ExamAttempt.start_attempt with concurrent starts by the "
+        "same students, like double clicks and retry storms, and verify that "
+        "no duplicate attempts are created. Fixtures are committed so worker "
+        "threads can see them, and deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--students",
+            type=int,
+            default=10,
+            help="Students starting the exams (default: 10)",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Concurrent starts per student (default: 8)",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=3,
+            help="Practice attempts each student starts and submits (default: 3)",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["students"], options["threads"], options["rounds"]) < 1:
+            raise CommandError("--students, --threads and --rounds must be positive")
+
+        cls = self._build_fixtures(options["students"])
+        try:
+            self.stdout.write(
+                f"Attempt creation stress test: {options['students']} students x "
+                f"{options['threads']} concurrent starts"
+            )
+            self.stdout.write(
+                f"{'Exam':>9} {'Starts':>7} {'Created':>8} {'Reused':>7} "
+                f"{'Errors':>7} {'p50 ms':>8} {'p95 ms':>8}"
+            )
+            failures = self._run_official(options) + self._run_practice(options)
+        finally:
+            connections.close_all()
+            cls.delete()
+            User.objects.filter(pk__in=[s.pk for s in self.students]).delete()
+
+        if failures:
+            for failure in failures:
+                self.stderr.write(self.style.ERROR(failure))
+            raise CommandError(f"{len(failures)} invariant violations")
+        self.stdout.write(self.style.SUCCESS("No duplicate attempts were created."))
+
+    def _start_concurrently(self, exam, threads):
+        """Start the exam for every student from ``threads`` threads at once."""
+        barrier = threading.Barrier(threads)
+
+        def start(student):
+            barrier.wait()
+            try:
+                begin = time.perf_counter()
+                # Mirrors a request under ATOMIC_REQUESTS
+                with transaction.atomic():
+                    attempt = ExamAttempt.start_attempt(exam, student)
+                return attempt.pk, (time.perf_counter() - begin) * 1000, None
+            except Exception as e:
+                return None, 0, e
+            finally:
+                connections.close_all()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for student in self.students:
+                results += pool.map(start, [student] * threads)
+        return results
+
+    def _report(self, label, results):
+        latencies = sorted(ms for pk, ms, error in results if error is None)
+        created = len({pk for pk, _, error in results if error is None})
+        errors = [error for _, _, error in results if error is not None]
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+        self.stdout.write(
+            f"{label:>9} {len(results):>7} {created:>8} "
+            f"{len(results) - len(errors) - created:>7} {len(errors):>7} "
+            f"{statistics.median(latencies) if latencies else 0:>8.2f} {p95:>8.2f}"
+        )
+        # Failed starts are retried by the student; only duplicates are fatal.
+        # SQLite rejects concurrent writers outright, so expect some there.
+        if errors:
+            self.stdout.write(self.style.WARNING(f"  first error: {errors[0]!r}"))
+
+    def _run_official(self, options):
+        results = self._start_concurrently(self.official, options["threads"])
+        self._report("official", results)
+        failures = []
+        counts = Counter(
+            ExamAttempt.objects.filter(exam=self.official).values_list(
+                "student_id", flat=True
+            )
+        )
+        for student in self.students:
+            if counts[student.pk] != 1:
+                failures.append(
+                    f"official: student {student.pk} has {counts[student.pk]} attempts"
+                )
+        return failures
+
+    def _run_practice(self, options):
+        failures = []
+        attempts = ExamAttempt.objects.filter(exam=self.practice)
+        for _ in range(options["rounds"]):
+            results = self._start_concurrently(self.practice, options["threads"])
+            self._report("practice", results)
+            counts = Counter(
+                attempts.in_progress().values_list("student_id", flat=True)
+            )
+            for student in self.students:
+                if counts[student.pk] != 1:
+                    failures.append(
+                        f"practice: student {student.pk} has {counts[student.pk]} "
+                        "attempts in progress"
+                    )
+            # Submit before the next round so it starts a new attempt
+            for attempt in attempts.in_progress():
+                ScoringService.finalize(attempt, ExamAttempt.Status.SUBMITTED)
+
+        for student in self.students:
+            numbers = sorted(
+                attempts.filter(student=student).values_list(
+                    "attempt_number", flat=True
+                )
+            )
+            if numbers != list(range(1, options["rounds"] + 1)):
+                failures.append(
+                    f"practice: student {student.pk} has attempt numbers {numbers}"
+                )
+        return failures
+
+    def _build_fixtures(self, student_count):
+        suffix = time.time_ns()
+        cls = Class.objects.create(name=f"Start stress {suffix}"[:50])
+        subject = Subject.objects.create(name="Stress", assigned_class=cls)
+        self.students = [
+            User.objects.create_user(
+                username=f"stress-start-{suffix}-{i}",
+                email=f"stress-start-{suffix}-{i}@example.com",
+                role=User.Role.STUDENT,
+                assigned_class=cls,
+            )
+            for i in range(student_count)
+        ]
+
+        questions = Question.objects.bulk_create(
+            Question(
+                question_text=f"Stress question {i}",
+                subject=subject,
+                created_by=self.students[0],
+            )
+            for i in range(10)
+        )
+        QuestionOption.objects.bulk_create(
+            QuestionOption(question=question, text=f"Option {j}")
+            for question in questions
+            for j in range(4)
+        )
+
+        now = timezone.now()
+        exams = []
+        for exam_type in (Exam.ExamType.OFFICIAL, Exam.ExamType.PRACTICE):
+            exam = Exam.objects.create(
+                title=f"Start stress ({exam_type})",
+                subject=subject,
+                exam_type=exam_type,
+                start_time=now,
+                end_time=now + timedelta(hours=1),
+                created_by=self.students[0],
+            )
+            # Publish without signals so no notifications are sent
+            Exam.objects.filter(pk=exam.pk).update(status=Exam.Status.PUBLISHED)
+            ExamQuestion.objects.bulk_create(
+                ExamQuestion(exam=exam, question=question, order=i)
+                for i, question in enumerate(questions)
+            )
+            exams.append(exam)
+        self.official, self.practice = exams
+        return cls
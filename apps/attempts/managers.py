@@ -4,6 +4,14 @@ from django.db import models
 class ExamAttemptQuerySet(models.QuerySet):
     """Custom QuerySet for ExamAttempt model with common filters."""
 
+    def pending(self):
+        """Filter to pre-generated attempts that have not been started."""
+        return self.filter(status=self.model.Status.PENDING)
+
+    def started(self):
+        """Exclude pre-generated attempts that have not been started."""
+        return self.exclude(status=self.model.Status.PENDING)
+
     def in_progress(self):
         """Filter to in-progress attempts."""
         return self.filter(status=self.model.Status.IN_PROGRESS)
@@ -22,6 +30,14 @@ class ExamAttemptQuerySet(models.QuerySet):
             status__in=[self.model.Status.SUBMITTED, self.model.Status.TIMED_OUT]
         )
 
+    def passed(self):
+        """Filter to attempts scoring at least the pass percentage."""
+        return self.filter(percentage__gte=self.model.PASS_PERCENTAGE)
+
+    def failed(self):
+        """Filter to attempts scoring below the pass percentage."""
+        return self.filter(percentage__lt=self.model.PASS_PERCENTAGE)
+
     def for_student(self, student):
         """Filter to attempts by a specific student."""
         return self.filter(student=student)
@@ -59,6 +75,14 @@ class ExamAttemptManager(models.Manager):
         """Return ExamAttemptQuerySet instead of default QuerySet."""
         return ExamAttemptQuerySet(self.model, using=self._db)
 
+    def pending(self):
+        """Filter to pre-generated attempts that have not been started."""
+        return self.get_queryset().pending()
+
+    def started(self):
+        """Exclude pre-generated attempts that have not been started."""
+        return self.get_queryset().started()
+
     def in_progress(self):
         """Filter to in-progress attempts."""
         return self.get_queryset().in_progress()
@@ -75,6 +99,14 @@ class ExamAttemptManager(models.Manager):
         """Filter to completed attempts."""
         return self.get_queryset().completed()
 
+    def passed(self):
+        """Filter to attempts scoring at least the pass percentage."""
+        return self.get_queryset().passed()
+
+    def failed(self):
+        """Filter to attempts scoring below the pass percentage."""
+        return self.get_queryset().failed()
+
     def for_student(self, student):
         """Filter to attempts by a specific student."""
         return self.get_queryset().for_student(student)
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0007_add_practice_mode_support"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examattempt",
+            name="last_client_seq",
+            field=models.PositiveBigIntegerField(
+                default=0,
+                help_text="Highest autosave sequence number applied for this attempt",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0008_examattempt_last_client_seq"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="examattempt",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("in_progress", "In Progress"),
+                    ("submitted", "Submitted"),
+                    ("timed_out", "Timed Out"),
+                ],
+                default="in_progress",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0009_add_pending_status"),
+        ("exams", "0006_exampaper"),
+    ]
+
+    operations = [
+        # Keep the existing columns for attempts created before papers; only
+        # the model field names change.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RenameField(
+                    model_name="examattempt",
+                    old_name="question_order",
+                    new_name="stored_question_order",
+                ),
+                migrations.RenameField(
+                    model_name="examattempt",
+                    old_name="option_orders",
+                    new_name="stored_option_orders",
+                ),
+                migrations.AlterField(
+                    model_name="examattempt",
+                    name="stored_question_order",
+                    field=models.JSONField(
+                        blank=True, db_column="question_order", default=list
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="examattempt",
+                    name="stored_option_orders",
+                    field=models.JSONField(
+                        blank=True, db_column="option_orders", default=dict
+                    ),
+                ),
+            ],
+            database_operations=[],
+        ),
+        migrations.AddField(
+            model_name="examattempt",
+            name="paper",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="attempts",
+                to="exams.exampaper",
+            ),
+        ),
+        migrations.AddField(
+            model_name="examattempt",
+            name="shuffle_seed",
+            field=models.CharField(
+                blank=True,
+                help_text="Secret seed that reproduces this attempt's question and option order",
+                max_length=64,
+            ),
+        ),
+    ]
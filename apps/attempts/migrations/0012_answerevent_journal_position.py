@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0011_regraderun"),
+        ("questions", "0006_add_performance_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examattempt",
+            name="journal_position",
+            field=models.PositiveBigIntegerField(
+                default=0,
+                help_text="ID of the last answer event materialized into the answers",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AnswerEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "client_seq",
+                    models.PositiveBigIntegerField(
+                        blank=True,
+                        help_text="Client sequence number of the save that carried this answer",
+                        null=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "attempt",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="answer_events",
+                        to="attempts.examattempt",
+                    ),
+                ),
+                (
+                    "question",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="questions.question",
+                    ),
+                ),
+                (
+                    "selected_option",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="questions.questionoption",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Answer Event",
+                "verbose_name_plural": "Answer Events",
+                "db_table": "answer_events",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["attempt", "id"], name="answer_events_attempt_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:50
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0012_answerevent_journal_position"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examattempt",
+            name="time_credit",
+            field=models.DurationField(
+                default=datetime.timedelta(0),
+                help_text="Extra time granted after the exam's end time, e.g. for time spent in the start queue",
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:51
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def resolve_duplicate_attempts(apps, schema_editor):
+    """
+    Make existing attempts satisfy the new unique constraints.
+
+    Extra in-progress attempts of a student (all but the latest) are timed
+    out and scored, and attempts sharing a number are renumbered in the
+    order they were started.
+    """
+    ExamAttempt = apps.get_model("attempts", "ExamAttempt")
+    ExamAnswer = apps.get_model("attempts", "ExamAnswer")
+
+    in_progress = (
+        ExamAttempt.objects.filter(status="in_progress")
+        .values("exam_id", "student_id")
+        .annotate(n=Count("id"))
+        .filter(n__gt=1)
+    )
+    for group in in_progress:
+        extra = ExamAttempt.objects.filter(
+            exam_id=group["exam_id"],
+            student_id=group["student_id"],
+            status="in_progress",
+        ).order_by("-started_at", "-pk")[1:]
+        for attempt in extra:
+            attempt.status = "timed_out"
+            attempt.submitted_at = timezone.now()
+            attempt.score = ExamAnswer.objects.filter(
+                attempt=attempt, is_correct=True
+            ).count()
+            attempt.save(update_fields=["status", "submitted_at", "score"])
+
+    duplicated = (
+        ExamAttempt.objects.values("exam_id", "student_id", "attempt_number")
+        .annotate(n=Count("id"))
+        .filter(n__gt=1)
+        .values_list("exam_id", "student_id")
+    )
+    for exam_id, student_id in set(duplicated):
+        attempts = ExamAttempt.objects.filter(
+            exam_id=exam_id, student_id=student_id
+        ).order_by("started_at", "pk")
+        for number, attempt in enumerate(attempts, start=1):
+            if attempt.attempt_number != number:
+                attempt.attempt_number = number
+                attempt.save(update_fields=["attempt_number"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0013_examattempt_time_credit"),
+        ("exams", "0006_exampaper"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(resolve_duplicate_attempts, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="examattempt",
+            name="attempts_exam_student_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="examattempt",
+            constraint=models.UniqueConstraint(
+                fields=("exam", "student", "attempt_number"),
+                name="unique_attempt_number",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="examattempt",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "in_progress")),
+                fields=("exam", "student"),
+                name="unique_in_progress_attempt",
+            ),
+        ),
+    ]
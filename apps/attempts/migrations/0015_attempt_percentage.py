@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:57
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0014_unique_attempt_constraints"),
+        ("exams", "0006_exampaper"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examattempt",
+            name="percentage",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        then=django.db.models.expressions.CombinedExpression(
+                            django.db.models.expressions.CombinedExpression(
+                                django.db.models.functions.comparison.Cast(
+                                    "score", models.FloatField()
+                                ),
+                                "*",
+                                models.Value(100),
+                            ),
+                            "/",
+                            models.F("total_questions"),
+                        ),
+                        total_questions__gt=0,
+                    ),
+                    default=models.Value(0.0),
+                ),
+                help_text="Unrounded percentage score, for filtering and sorting in SQL",
+                output_field=models.FloatField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="examattempt",
+            index=models.Index(
+                fields=["student", "submitted_at"],
+                name="attempts_student_submitted_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="examattempt",
+            index=models.Index(
+                fields=["student", "percentage"], name="attempts_student_pct_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,122 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_rollups(apps, schema_editor):
+    """Build rollups for the attempts completed before they were tracked."""
+    ExamAttempt = apps.get_model("attempts", "ExamAttempt")
+    PerformanceRollup = apps.get_model("attempts", "PerformanceRollup")
+
+    rollups = {}
+    attempts = (
+        ExamAttempt.objects.filter(status__in=["submitted", "timed_out"])
+        .order_by("pk")
+        .values_list(
+            "pk",
+            "student_id",
+            "exam__subject_id",
+            "score",
+            "total_questions",
+            "percentage",
+        )
+    )
+    for pk, student_id, subject_id, score, total, percentage in attempts.iterator():
+        rollup = rollups.get((student_id, subject_id))
+        if rollup is None:
+            rollup = rollups[(student_id, subject_id)] = PerformanceRollup(
+                student_id=student_id, subject_id=subject_id
+            )
+        rollup.attempt_count += 1
+        rollup.score_sum += score or 0
+        rollup.total_sum += total
+        rollup.pass_count += percentage >= 50
+        if rollup.best_attempt_id is None or percentage >= rollup.best_percentage:
+            rollup.best_percentage = percentage
+            rollup.best_attempt_id = pk
+        if rollup.worst_attempt_id is None or percentage <= rollup.worst_percentage:
+            rollup.worst_percentage = percentage
+            rollup.worst_attempt_id = pk
+    PerformanceRollup.objects.bulk_create(rollups.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academic", "0003_alter_subject_unique_together_and_more"),
+        ("attempts", "0015_attempt_percentage"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PerformanceRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.PositiveBigIntegerField(default=0)),
+                ("total_sum", models.PositiveBigIntegerField(default=0)),
+                ("pass_count", models.PositiveIntegerField(default=0)),
+                ("best_percentage", models.FloatField(blank=True, null=True)),
+                ("worst_percentage", models.FloatField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "best_attempt",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="attempts.examattempt",
+                    ),
+                ),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="performance_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "subject",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="academic.subject",
+                    ),
+                ),
+                (
+                    "worst_attempt",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="attempts.examattempt",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Performance Rollup",
+                "verbose_name_plural": "Performance Rollups",
+                "db_table": "performance_rollups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("student", "subject"), name="unique_rollup_per_subject"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attempts", "0016_performancerollup"),
+        ("exams", "0006_exampaper"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExamStatistics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("pass_count", models.PositiveIntegerField(default=0)),
+                ("percentage_sum", models.FloatField(default=0)),
+                ("percentage_sumsq", models.FloatField(default=0)),
+                ("min_percentage", models.FloatField(blank=True, null=True)),
+                ("max_percentage", models.FloatField(blank=True, null=True)),
+                ("histogram", models.JSONField(default=list)),
+                ("quantile_markers", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "exam",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics",
+                        to="exams.exam",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Statistics",
+                "verbose_name_plural": "Exam Statistics",
+                "db_table": "exam_statistics",
+            },
+        ),
+    ]
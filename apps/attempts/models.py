@@ -1,27 +1,73 @@
+import hashlib
+import hmac
+import math
 import secrets
+from datetime import timedelta
 
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Cast
 from django.utils import timezone
+from django.utils.functional import cached_property
 
-from apps.core.models import TimestampedModel
+from apps.core.models import FieldTrackerMixin, TimestampedModel
 
 from .managers import ExamAnswerManager, ExamAttemptManager
 
 
-def secure_shuffle(items):
-    """Cryptographically secure shuffle using secrets module."""
+class SeededRandom:
+    """
+    Deterministic random stream derived from a secret seed.
+
+    Blocks of HMAC-SHA256(seed, label:counter) are consumed 64 bits at a
+    time, so a 256-bit seed reproduces the same unpredictable sequence for
+    the same label.
+    """
+
+    def __init__(self, seed, label):
+        self._key = bytes.fromhex(seed)
+        self._label = label.encode()
+        self._counter = 0
+        self._buffer = b""
+
+    def _next64(self):
+        if len(self._buffer) < 8:
+            message = self._label + b":" + str(self._counter).encode()
+            self._buffer += hmac.new(self._key, message, hashlib.sha256).digest()
+            self._counter += 1
+        value, self._buffer = self._buffer[:8], self._buffer[8:]
+        return int.from_bytes(value, "big")
+
+    def randbelow(self, n):
+        """Return an unbiased integer in ``[0, n)`` using rejection sampling."""
+        limit = (1 << 64) - (1 << 64) % n
+        while True:
+            value = self._next64()
+            if value < limit:
+                return value % n
+
+
+def seeded_shuffle(items, seed, label, count=None):
+    """
+    Reproducible shuffle of ``items`` driven by a secret seed.
+
+    Only the first ``count`` positions are drawn (a partial Fisher-Yates),
+    which is a uniform random sample of that size in random order.
+    """
     items = list(items)
-    for i in range(len(items) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
+    count = len(items) if count is None else min(count, len(items))
+    rng = SeededRandom(seed, label)
+    for i in range(count):
+        j = i + rng.randbelow(len(items) - i)
         items[i], items[j] = items[j], items[i]
-    return items
+    return items[:count]
 
 
-class ExamAttempt(TimestampedModel):
+class ExamAttempt(FieldTrackerMixin, TimestampedModel):
     """Student's attempt at an exam with randomization data."""
 
     class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
         IN_PROGRESS = "in_progress", "In Progress"
         SUBMITTED = "submitted", "Submitted"
         TIMED_OUT = "timed_out", "Timed Out"
@@ -36,8 +82,25 @@ class ExamAttempt(TimestampedModel):
         on_delete=models.CASCADE,
         related_name="exam_attempts",
     )
-    question_order = models.JSONField(default=list)
-    option_orders = models.JSONField(default=dict)
+    paper = models.ForeignKey(
+        "exams.ExamPaper",
+        on_delete=models.CASCADE,
+        related_name="attempts",
+        null=True,
+        blank=True,
+    )
+    shuffle_seed = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Secret seed that reproduces this attempt's question and option order",
+    )
+    # Explicit orders, only populated for attempts created before papers
+    stored_question_order = models.JSONField(
+        default=list, blank=True, db_column="question_order"
+    )
+    stored_option_orders = models.JSONField(
+        default=dict, blank=True, db_column="option_orders"
+    )
     started_at = models.DateTimeField(auto_now_add=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
     status = models.CharField(
@@ -47,69 +110,294 @@ class ExamAttempt(TimestampedModel):
     )
     score = models.PositiveIntegerField(null=True, blank=True)
     total_questions = models.PositiveIntegerField(default=0)
+    percentage = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                total_questions__gt=0,
+                then=Cast("score", models.FloatField())
+                * 100
+                / models.F("total_questions"),
+            ),
+            default=models.Value(0.0),
+        ),
+        output_field=models.FloatField(),
+        db_persist=True,
+        help_text="Unrounded percentage score, for filtering and sorting in SQL",
+    )
     attempt_number = models.PositiveIntegerField(default=1)
+    last_client_seq = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Highest autosave sequence number applied for this attempt",
+    )
+    time_credit = models.DurationField(
+        default=timedelta(0),
+        help_text="Extra time granted after the exam's end time, e.g. for "
+        "time spent in the start queue",
+    )
+    journal_position = models.PositiveBigIntegerField(
+        default=0,
+        help_text="ID of the last answer event materialized into the answers",
+    )
 
     objects = ExamAttemptManager()
 
+    tracked_fields = ("status",)
+
+    # Times a practice attempt is renumbered after losing a creation race
+    CREATE_RETRIES = 5
+    # Minimum percentage score for a pass
+    PASS_PERCENTAGE = 50
+
     class Meta:
         db_table = "exam_attempts"
         verbose_name = "Exam Attempt"
         verbose_name_plural = "Exam Attempts"
-        # Note: Unique constraint for official exams is enforced in application logic
-        # to allow multiple attempts for practice exams
+        # Official exams only ever use attempt number 1, so the number
+        # constraint also limits them to a single attempt per student
+        constraints = [
+            models.UniqueConstraint(
+                fields=["exam", "student", "attempt_number"],
+                name="unique_attempt_number",
+            ),
+            models.UniqueConstraint(
+                fields=["exam", "student"],
+                condition=models.Q(status="in_progress"),
+                name="unique_in_progress_attempt",
+            ),
+        ]
         indexes = [
             models.Index(fields=["status"], name="attempts_status_idx"),
             models.Index(
                 fields=["student", "status"], name="attempts_student_status_idx"
             ),
-            models.Index(fields=["exam", "student"], name="attempts_exam_student_idx"),
+            # Seek indexes for the student's history sorted by date or score
+            models.Index(
+                fields=["student", "submitted_at"],
+                name="attempts_student_submitted_idx",
+            ),
+            models.Index(
+                fields=["student", "percentage"], name="attempts_student_pct_idx"
+            ),
         ]
 
     def __str__(self):
         return f"{self.student.email} - {self.exam.title}"
 
     @classmethod
-    def create_attempt(cls, exam, student):
-        """Create a new attempt with randomized questions and options."""
-        questions = exam.get_questions()
+    def build_attempt(cls, exam, student, paper, **kwargs):
+        """Return an unsaved attempt on ``paper`` with a fresh shuffle seed."""
+        return cls(
+            exam=exam,
+            student=student,
+            paper=paper,
+            shuffle_seed=secrets.token_hex(32),
+            total_questions=paper.sample_size,
+            **kwargs,
+        )
+
+    @classmethod
+    def create_attempt(cls, exam, student, time_credit=timedelta(0)):
+        """
+        Create a new attempt with randomized questions and options.
+
+        Duplicates are prevented by unique constraints rather than checked
+        for first, so concurrent starts (double clicks, retries) conflict on
+        insert. Official exams always use attempt number 1; practice
+        attempts that lose a race for the next number retry with a new one.
+
+        Returns:
+            The new attempt, or the attempt a concurrent request created:
+            the student's in-progress attempt, or for official exams their
+            existing attempt
+        """
+        from apps.exams.cache import get_current_paper
+
+        paper = get_current_paper(exam)
+        attempts = cls.objects.filter(exam=exam, student=student)
+
+        for _ in range(cls.CREATE_RETRIES):
+            attempt_number = 1
+            if exam.is_practice:
+                latest = attempts.aggregate(latest=models.Max("attempt_number"))
+                attempt_number = (latest["latest"] or 0) + 1
+
+            attempt = cls.build_attempt(
+                exam,
+                student,
+                paper,
+                attempt_number=attempt_number,
+                time_credit=time_credit,
+            )
+            try:
+                with transaction.atomic():
+                    attempt.save()
+                return attempt
+            except IntegrityError:
+                existing = attempts.in_progress().first()
+                if existing is None and not exam.is_practice:
+                    existing = attempts.first()
+                if existing is not None:
+                    return existing
+        raise IntegrityError(
+            f"Could not number a new attempt of exam {exam.pk} for student "
+            f"{student.pk} after {cls.CREATE_RETRIES} tries"
+        )
 
-        question_ids = [q.id for q in questions]
-        shuffled_ids = secure_shuffle(question_ids)
+    @classmethod
+    def claim_pending_attempt(cls, exam, student, time_credit=timedelta(0)):
+        """
+        Start a student's pre-generated attempt, if they have one.
+
+        The attempt is claimed by stamping ``started_at`` with an UPDATE
+        guarded on the pending status, so only one request can claim it.
+
+        Returns:
+            The claimed attempt, or None
+        """
+        pending_id = (
+            cls.objects.filter(exam=exam, student=student)
+            .pending()
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if pending_id is None:
+            return None
+        now = timezone.now()
+        claimed = cls.objects.filter(pk=pending_id, status=cls.Status.PENDING).update(
+            status=cls.Status.IN_PROGRESS,
+            started_at=now,
+            time_credit=time_credit,
+            updated_at=now,
+        )
+        if not claimed:
+            return None
+        from .services.exam_state import ExamStateService
 
-        # Store shuffled option IDs for each question
-        option_orders = {}
-        for q in questions:
-            option_ids = list(q.options.values_list("id", flat=True))
-            option_orders[str(q.id)] = secure_shuffle(option_ids)
+        ExamStateService.invalidate_students([student.pk])
+        return cls.objects.get(pk=pending_id)
 
-        # Calculate attempt number (for practice exams, this can be > 1)
-        attempt_number = cls.objects.filter(exam=exam, student=student).count() + 1
+    @classmethod
+    def start_attempt(cls, exam, student, time_credit=timedelta(0)):
+        """
+        Start an attempt for a student.
+
+        A pre-generated attempt is claimed by stamping ``started_at`` on the
+        existing row; otherwise a new attempt is created.
+
+        Args:
+            exam: Exam being started
+            student: Student starting it
+            time_credit: Extra time to grant after the exam's end time
+
+        Returns:
+            The started attempt, or the attempt that a concurrent request
+            created (see ``create_attempt``)
+        """
+        attempt = cls.claim_pending_attempt(exam, student, time_credit)
+        if attempt is None:
+            attempt = cls.create_attempt(exam, student, time_credit=time_credit)
+        if attempt.status == cls.Status.PENDING:
+            # The attempt was pre-generated while we were creating one
+            attempt = cls.claim_pending_attempt(exam, student, time_credit) or attempt
+        return attempt
 
-        return cls.objects.create(
-            exam=exam,
-            student=student,
-            question_order=shuffled_ids,
-            option_orders=option_orders,
-            total_questions=len(questions),
-            attempt_number=attempt_number,
+    @classmethod
+    def pregenerate_attempts(cls, exam, batch_size=500):
+        """
+        Pre-generate pending attempts for every active student in the class.
+
+        Students who already have an attempt for the exam are skipped, so
+        this is safe to run repeatedly before the exam starts. Students who
+        start the exam concurrently are skipped by the unique constraints.
+
+        Returns:
+            Number of attempts created (or skipped by a concurrent start)
+        """
+        from django.contrib.auth import get_user_model
+
+        from apps.exams.cache import get_current_paper
+
+        User = get_user_model()
+
+        students = list(
+            User.objects.filter(
+                role=User.Role.STUDENT,
+                is_active=True,
+                assigned_class_id=exam.subject.assigned_class_id,
+            ).exclude(id__in=cls.objects.filter(exam=exam).values("student_id"))
         )
+        if not students:
+            return 0
 
-    def get_question_at_index(self, index):
-        """Get question at specific index in student's order."""
-        from apps.questions.models import Question
+        paper = get_current_paper(exam)
+        attempts = [
+            cls.build_attempt(exam, student, paper, status=cls.Status.PENDING)
+            for student in students
+        ]
+        cls.objects.bulk_create(attempts, batch_size=batch_size, ignore_conflicts=True)
+        return len(attempts)
+
+    @cached_property
+    def paper_structure(self):
+        """The shared ExamPaper this attempt permutes, read from the cache."""
+        from apps.exams.cache import get_paper
+
+        if self.paper_id is None:
+            return None
+        return get_paper(self.paper_id)
+
+    @cached_property
+    def question_order(self):
+        """Question IDs in this student's order."""
+        if not self.shuffle_seed:
+            return self.stored_question_order
+        return seeded_shuffle(
+            self.paper_structure.question_ids,
+            self.shuffle_seed,
+            "questions",
+            self.total_questions,
+        )
 
-        if 0 <= index < len(self.question_order):
-            question_id = self.question_order[index]
-            return Question.objects.get(id=question_id)
-        return None
+    @cached_property
+    def question_ids(self):
+        """Set of question IDs on this attempt's paper."""
+        paper = self.paper_structure
+        if self.shuffle_seed and len(paper.question_ids) == self.total_questions:
+            # Every question is used, so no shuffle is needed
+            return set(paper.question_ids)
+        return set(self.question_order)
+
+    def get_option_order(self, question_id):
+        """
+        Get option IDs of a question in this student's order.
+
+        Returns None if the question is not part of the attempt.
+        """
+        if not self.shuffle_seed:
+            return self.stored_option_orders.get(str(question_id))
+        if question_id not in self.question_ids:
+            return None
+        return seeded_shuffle(
+            self.paper_structure.option_ids.get(str(question_id), []),
+            self.shuffle_seed,
+            f"options:{question_id}",
+        )
 
-    def get_shuffled_options_for_question(self, question):
-        """Get options in student's shuffled order for a question."""
-        # Build option map from database
-        option_map = {opt.id: opt.text for opt in question.options.all()}
+    @cached_property
+    def option_orders(self):
+        """Mapping of question ID (string) to option IDs in this student's order."""
+        if not self.shuffle_seed:
+            return self.stored_option_orders
+        return {
+            str(question_id): self.get_option_order(question_id)
+            for question_id in self.question_order
+        }
 
-        # Get the shuffled order for this question (list of option IDs)
-        order = self.option_orders.get(str(question.id), list(option_map.keys()))
+    def get_ordered_options(self, question_id, option_map):
+        """Order a question's ``{option_id: text}`` map by this attempt's shuffle."""
+        order = self.get_option_order(question_id)
+        if order is None:
+            order = list(option_map.keys())
 
         options = []
         for idx, opt_id in enumerate(order):
@@ -123,48 +411,111 @@ class ExamAttempt(TimestampedModel):
                 )
         return options
 
-    def get_all_questions_with_options(self):
-        """Get all questions with shuffled options and existing answers."""
-        from apps.questions.models import Question
+    def get_question_map(self):
+        """
+        Get this attempt's questions as ``{question_id: serialized question}``.
+
+        The questions are those of the attempt's own frozen paper. For
+        manually-assembled exams they are read from the exam's cached
+        snapshot, so no question or option queries are needed; questions
+        since removed from the exam are missing from the snapshot and are
+        loaded individually. Exams with per-attempt random questions load
+        just this attempt's questions.
+        """
+        from apps.exams.cache import get_paper_snapshot, serialize_questions
+
+        snapshot = get_paper_snapshot(self.exam)
+        cached = snapshot["questions"] if snapshot is not None else {}
+        questions = {
+            question_id: cached[question_id]
+            for question_id in self.question_order
+            if question_id in cached
+        }
+        missing = [
+            question_id
+            for question_id in self.question_order
+            if question_id not in questions
+        ]
+        if missing:
+            questions.update(serialize_questions(missing))
+        return questions
 
-        questions = Question.objects.filter(
-            id__in=self.question_order
-        ).prefetch_related("options")
-        questions_dict = {q.id: q for q in questions}
+    def get_selected_answers(self):
+        """Get a mapping of question ID to selected option ID for this attempt."""
+        from apps.attempts import buffer as answer_buffer
+        from apps.attempts import journal as answer_journal
 
         # Get selected option IDs from answers with optimized query
-        answers = {
-            a.question_id: a.selected_option_id
-            for a in self.answers.select_related("selected_option").only(
-                "question_id", "selected_option_id"
-            )
-        }
-
-        result = []
-        for idx, q_id in enumerate(self.question_order):
-            question = questions_dict.get(q_id)
+        answers = dict(self.answers.values_list("question_id", "selected_option_id"))
+        if answer_journal.is_enabled():
+            # Overlay answers journaled since the projection was materialized
+            answers.update(answer_journal.get_pending_answers(self))
+        if answer_buffer.is_enabled():
+            # Overlay answers not flushed yet, and seed the client's autosave
+            # sequence from the buffer so new deltas are not dropped as stale
+            buffered, self.last_client_seq = answer_buffer.get_buffer(self)
+            answers.update(buffered)
+        return answers
+
+    def get_paper_etag(self):
+        """
+        Get a strong ETag for this attempt's permuted paper.
+
+        Derived from the attempt, its shuffle and the exam's paper version,
+        which changes whenever question or option text is edited, so it can
+        be checked without building the paper.
+        """
+        from apps.exams.cache import get_paper_version
+
+        version = get_paper_version(self.exam_id)
+        order = self.shuffle_seed or ",".join(map(str, self.stored_question_order))
+        digest = hashlib.sha256(f"{self.pk}:{order}:{version}".encode())
+        return digest.hexdigest()[:32]
+
+    def get_paper_data(self):
+        """Get this attempt's paper in display order as JSON-ready data."""
+        questions = self.get_question_map()
+        paper = []
+        for q_id in self.question_order:
+            question = questions.get(q_id)
             if question:
-                result.append(
+                paper.append(
                     {
-                        "index": idx,
-                        "question": question,
-                        "options": self.get_shuffled_options_for_question(question),
-                        "selected_answer": answers.get(q_id),
+                        "id": q_id,
+                        "text": question["question_text"],
+                        "options": [
+                            {
+                                "id": option["option_id"],
+                                "number": option["display_number"],
+                                "text": option["text"],
+                            }
+                            for option in self.get_ordered_options(
+                                q_id, question["options"]
+                            )
+                        ],
                     }
                 )
-        return result
+        return paper
+
+    @property
+    def ends_at(self):
+        """End of this attempt: the exam's end time plus any time credit."""
+        return self.exam.end_time + self.time_credit
 
-    def calculate_score(self):
-        """Calculate and save the score."""
-        correct_count = self.answers.filter(is_correct=True).count()
-        self.score = correct_count
-        self.save()
-        return correct_count
+    @property
+    def time_remaining(self):
+        """Whole seconds left in this attempt, never negative."""
+        return max(0, int((self.ends_at - timezone.now()).total_seconds()))
 
     @property
     def is_time_expired(self):
         """Check if exam time has passed."""
-        return timezone.now() > self.exam.end_time
+        return timezone.now() > self.ends_at
+
+    @property
+    def sync_deadline(self):
+        """Latest time queued offline answers are accepted for this attempt."""
+        return self.ends_at + timedelta(seconds=settings.EXAM_SYNC_GRACE_PERIOD)
 
     @property
     def percentage_score(self):
@@ -211,10 +562,280 @@ class ExamAnswer(models.Model):
             ),
         ]
 
+    def _get_subject_id(self):
+        """Get the exam's subject ID, with one query unless the exam is loaded."""
+        if ExamAnswer.attempt.is_cached(self) and ExamAttempt.exam.is_cached(
+            self.attempt
+        ):
+            return self.attempt.exam.subject_id
+        return (
+            ExamAttempt.objects.filter(pk=self.attempt_id)
+            .values_list("exam__subject_id", flat=True)
+            .first()
+        )
+
     def save(self, *args, **kwargs):
-        """Auto-check if answer is correct."""
-        if self.selected_option and self.question.correct_option:
-            self.is_correct = self.selected_option_id == self.question.correct_option_id
-        else:
-            self.is_correct = False
+        """Auto-check if answer is correct against the cached answer key."""
+        from .services.answers import AnswerService
+
+        correct_option_id = AnswerService.get_answer_key(
+            [self.question_id], self._get_subject_id()
+        ).get(self.question_id)
+        self.is_correct = (
+            self.selected_option_id is not None
+            and self.selected_option_id == correct_option_id
+        )
         super().save(*args, **kwargs)
+
+
+class AnswerEvent(models.Model):
+    """
+    Append-only journal entry recording one answer selection.
+
+    Rows are only ever inserted. With the journal enabled, ``ExamAnswer``
+    is a projection of the latest event per question, materialized on
+    finalize or by the ``compact_answer_journal`` command.
+    """
+
+    attempt = models.ForeignKey(
+        ExamAttempt,
+        on_delete=models.CASCADE,
+        related_name="answer_events",
+    )
+    question = models.ForeignKey(
+        "questions.Question",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    selected_option = models.ForeignKey(
+        "questions.QuestionOption",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    client_seq = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Client sequence number of the save that carried this answer",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "answer_events"
+        verbose_name = "Answer Event"
+        verbose_name_plural = "Answer Events"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["attempt", "id"], name="answer_events_attempt_idx"),
+        ]
+
+    def __str__(self):
+        return f"Attempt {self.attempt_id}: Q{self.question_id} -> {self.selected_option_id}"
+
+
+class RegradeRun(TimestampedModel):
+    """Audit record of a bulk regrade after an answer key change."""
+
+    question_ids = models.JSONField(default=list)
+    triggered_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="regrade_runs",
+    )
+    answers_checked = models.PositiveIntegerField(default=0)
+    answers_changed = models.PositiveIntegerField(default=0)
+    attempts_rescored = models.PositiveIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "regrade_runs"
+        verbose_name = "Regrade Run"
+        verbose_name_plural = "Regrade Runs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Regrade of {len(self.question_ids)} question(s) at {self.created_at}"
+
+
+class PerformanceRollup(models.Model):
+    """
+    Running totals of a student's completed attempts in one subject.
+
+    Maintained incrementally as attempts are finalized, so performance
+    pages read a few rows instead of the student's whole history. Rebuilt
+    from the attempts by the ``rebuild_performance_rollups`` command and
+    after a regrade.
+    """
+
+    student = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="performance_rollups",
+    )
+    subject = models.ForeignKey(
+        "academic.Subject",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    attempt_count = models.PositiveIntegerField(default=0)
+    score_sum = models.PositiveBigIntegerField(default=0)
+    total_sum = models.PositiveBigIntegerField(default=0)
+    pass_count = models.PositiveIntegerField(default=0)
+    best_percentage = models.FloatField(null=True, blank=True)
+    best_attempt = models.ForeignKey(
+        ExamAttempt,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    worst_percentage = models.FloatField(null=True, blank=True)
+    worst_attempt = models.ForeignKey(
+        ExamAttempt,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "performance_rollups"
+        verbose_name = "Performance Rollup"
+        verbose_name_plural = "Performance Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "subject"], name="unique_rollup_per_subject"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Student {self.student_id}: subject {self.subject_id}"
+
+    @property
+    def avg_percentage(self):
+        """Return the average percentage over all attempts."""
+        if self.total_sum > 0:
+            return round((self.score_sum / self.total_sum) * 100, 1)
+        return 0
+
+
+class ExamStatistics(models.Model):
+    """
+    Streaming summary of the percentages of an exam's completed attempts.
+
+    Updated as each attempt is finalized: running count, sum and sum of
+    squares give the mean and standard deviation, a fixed-bin histogram
+    the distribution, and P² markers estimate quantiles without keeping
+    the scores. Rebuilt from the attempts by the
+    ``rebuild_exam_statistics`` command and after a regrade.
+    """
+
+    HISTOGRAM_BINS = 10
+    QUANTILES = (0.25, 0.5, 0.75, 0.9)
+
+    exam = models.OneToOneField(
+        "exams.Exam",
+        on_delete=models.CASCADE,
+        related_name="statistics",
+    )
+    attempt_count = models.PositiveIntegerField(default=0)
+    pass_count = models.PositiveIntegerField(default=0)
+    percentage_sum = models.FloatField(default=0)
+    percentage_sumsq = models.FloatField(default=0)
+    min_percentage = models.FloatField(null=True, blank=True)
+    max_percentage = models.FloatField(null=True, blank=True)
+    histogram = models.JSONField(default=list)
+    quantile_markers = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "exam_statistics"
+        verbose_name = "Exam Statistics"
+        verbose_name_plural = "Exam Statistics"
+
+    def __str__(self):
+        return f"Statistics for exam {self.exam_id}"
+
+    @property
+    def mean(self):
+        """Return the mean percentage."""
+        if self.attempt_count:
+            return round(self.percentage_sum / self.attempt_count, 1)
+        return 0
+
+    @property
+    def std_dev(self):
+        """Return the population standard deviation of the percentages."""
+        if not self.attempt_count:
+            return 0
+        mean = self.percentage_sum / self.attempt_count
+        variance = self.percentage_sumsq / self.attempt_count - mean**2
+        return round(math.sqrt(max(variance, 0)), 1)
+
+    @property
+    def pass_rate(self):
+        """Return the percentage of attempts that passed."""
+        if self.attempt_count:
+            return round(self.pass_count / self.attempt_count * 100, 1)
+        return 0
+
+    def quantile(self, p):
+        """
+        Return the estimated ``p`` quantile of the percentages.
+
+        Exact while there are at most five attempts, when the markers still
+        hold every score; a P² estimate after that. Returns None for
+        quantiles that are not tracked or before any attempt.
+        """
+        markers = self.quantile_markers.get(str(p))
+        if not markers:
+            return None
+        heights = markers["heights"]
+        if self.attempt_count > 5:
+            return round(heights[2], 1)
+        rank = p * (len(heights) - 1)
+        low = math.floor(rank)
+        high = min(low + 1, len(heights) - 1)
+        return round(heights[low] + (heights[high] - heights[low]) * (rank - low), 1)
+
+    @property
+    def median(self):
+        """Return the estimated median percentage."""
+        return self.quantile(0.5)
+
+    @property
+    def lower_quartile(self):
+        """Return the estimated 25th percentile."""
+        return self.quantile(0.25)
+
+    @property
+    def upper_quartile(self):
+        """Return the estimated 75th percentile."""
+        return self.quantile(0.75)
+
+    @property
+    def percentile_90(self):
+        """Return the estimated 90th percentile."""
+        return self.quantile(0.9)
+
+    @property
+    def histogram_bins(self):
+        """
+        Return the histogram as a list of dicts for display.
+
+        Each bin has ``low`` and ``high`` percentage bounds, its ``count``
+        and ``height``, the count as a percentage of the largest bin.
+        """
+        width = 100 // self.HISTOGRAM_BINS
+        tallest = max(self.histogram, default=0)
+        return [
+            {
+                "low": i * width,
+                "high": (i + 1) * width,
+                "count": count,
+                "height": round(count / tallest * 100) if tallest else 0,
+            }
+            for i, count in enumerate(self.histogram)
+        ]
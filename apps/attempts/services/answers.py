@@ -0,0 +1,411 @@
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+
+from asgiref.sync import sync_to_async
+
+from apps.attempts import buffer as answer_buffer
+from apps.attempts import journal as answer_journal
+from apps.attempts.models import ExamAnswer, ExamAttempt
+
+
+class AnswerService:
+    """Service for persisting a student's answers within an attempt."""
+
+    FIELD_PREFIX = "question_"
+    UPSERT_OPTIONS = {
+        "update_conflicts": True,
+        "unique_fields": ["attempt", "question"],
+        "update_fields": ["selected_option", "is_correct"],
+    }
+
+    @staticmethod
+    def parse_answers(data):
+        """
+        Extract ``question_<id>`` fields from submitted form data.
+
+        Args:
+            data: QueryDict or mapping of submitted field names to values
+
+        Returns:
+            Dict mapping question ID to selected option ID. Malformed keys
+            or values are skipped.
+        """
+        answers = {}
+        prefix = AnswerService.FIELD_PREFIX
+        for key, value in data.items():
+            if not key.startswith(prefix) or not value:
+                continue
+            try:
+                answers[int(key[len(prefix) :])] = int(value)
+            except (ValueError, TypeError):
+                continue
+        return answers
+
+    @staticmethod
+    def get_valid_answers(attempt, answers):
+        """
+        Keep only answers that belong to the attempt's paper.
+
+        A question must be part of the attempt and the option must be one
+        of the options shuffled for that question.
+        """
+        return {
+            question_id: option_id
+            for question_id, option_id in answers.items()
+            if AnswerService.is_valid_answer(attempt, question_id, option_id)
+        }
+
+    @staticmethod
+    def is_valid_answer(attempt, question_id, option_id):
+        """Check that an answer belongs to the attempt's paper."""
+        if question_id not in attempt.question_ids:
+            return False
+        option_ids = attempt.get_option_order(question_id)
+        return option_ids is None or option_id in option_ids
+
+    @staticmethod
+    def get_answer_key(question_ids, subject_id):
+        """
+        Return a mapping of question ID to correct option ID.
+
+        Reads the subject's cached answer key; only questions from another
+        subject (possible on manually-assembled exams) hit the database.
+
+        Args:
+            question_ids: IDs of the questions to grade
+            subject_id: Subject of the exam being graded
+
+        Returns:
+            Dict mapping question ID to correct option ID. Unknown
+            questions are omitted.
+        """
+        from apps.questions.cache import get_answer_key
+        from apps.questions.models import Question
+
+        subject_key = get_answer_key(subject_id)
+        answer_key = {}
+        missing = []
+        for question_id in question_ids:
+            if question_id in subject_key:
+                answer_key[question_id] = subject_key[question_id]
+            else:
+                missing.append(question_id)
+        if missing:
+            answer_key.update(
+                Question.objects.filter(id__in=missing).values_list(
+                    "id", "correct_option_id"
+                )
+            )
+        return answer_key
+
+    @staticmethod
+    def parse_delta(answers):
+        """
+        Extract answers from a JSON autosave delta.
+
+        Args:
+            answers: Mapping of question ID (string or int) to option ID
+
+        Returns:
+            Dict mapping question ID to selected option ID. Malformed
+            entries are skipped.
+        """
+        parsed = {}
+        if not isinstance(answers, dict):
+            return parsed
+        for key, value in answers.items():
+            if isinstance(value, bool):
+                continue
+            try:
+                parsed[int(key)] = int(value)
+            except (ValueError, TypeError):
+                continue
+        return parsed
+
+    @staticmethod
+    def write_answers(attempt, answers, seq=None):
+        """
+        Persist answers with a single bulk write (see ``write_many``).
+
+        Args:
+            attempt: In-progress ExamAttempt instance
+            answers: Dict mapping question ID to selected option ID
+            seq: Optional client sequence number of the save
+
+        Returns:
+            Number of answers written
+        """
+        return AnswerService.write_many([(attempt, answers)], seqs={attempt.pk: seq})
+
+    @staticmethod
+    def build_answers(attempt_answers):
+        """
+        Validate and grade answers of several attempts without saving them.
+
+        Args:
+            attempt_answers: Iterable of (attempt, answers dict) pairs
+
+        Returns:
+            List of unsaved ExamAnswer instances
+        """
+        objs = []
+        for attempt, answers in attempt_answers:
+            answers = AnswerService.get_valid_answers(attempt, answers)
+            if not answers:
+                continue
+            answer_key = AnswerService.get_answer_key(
+                answers.keys(), attempt.exam.subject_id
+            )
+            objs.extend(
+                ExamAnswer(
+                    attempt=attempt,
+                    question_id=question_id,
+                    selected_option_id=option_id,
+                    is_correct=answer_key[question_id] == option_id,
+                )
+                for question_id, option_id in answers.items()
+                if question_id in answer_key
+            )
+        return objs
+
+    @staticmethod
+    def write_many(attempt_answers, seqs=None):
+        """
+        Persist answers of several attempts with one bulk write.
+
+        Answers are upserted, or appended to the answer journal when it is
+        enabled.
+
+        Args:
+            attempt_answers: Iterable of (attempt, answers dict) pairs
+            seqs: Optional mapping of attempt ID to the client sequence
+                number of the save, recorded on journal events
+
+        Returns:
+            Number of answers written
+        """
+        if answer_journal.is_enabled():
+            seqs = seqs or {}
+            return answer_journal.append(
+                (attempt, [(seqs.get(attempt.pk), q, o) for q, o in answers.items()])
+                for attempt, answers in attempt_answers
+            )
+        return AnswerService.upsert_answers(attempt_answers)
+
+    @staticmethod
+    def upsert_answers(attempt_answers):
+        """
+        Grade and upsert answers of several attempts with one bulk upsert.
+
+        Args:
+            attempt_answers: Iterable of (attempt, answers dict) pairs
+
+        Returns:
+            Number of answers written
+        """
+        objs = AnswerService.build_answers(attempt_answers)
+        if not objs:
+            return 0
+        ExamAnswer.objects.bulk_create(objs, **AnswerService.UPSERT_OPTIONS)
+        return len(objs)
+
+    @staticmethod
+    def record_answers(attempt, answers):
+        """
+        Record answers, buffering them in the cache in write-behind mode.
+
+        Args:
+            attempt: In-progress ExamAttempt instance
+            answers: Dict mapping question ID to selected option ID
+
+        Returns:
+            Number of answers recorded
+        """
+        if not answer_buffer.is_enabled():
+            return AnswerService.write_answers(attempt, answers)
+        answers = AnswerService.get_valid_answers(attempt, answers)
+        if answers:
+            answer_buffer.buffer_answers(attempt, answers)
+        return len(answers)
+
+    @staticmethod
+    def save_answers(attempt, data):
+        """
+        Record all ``question_<id>`` fields of a form post.
+
+        Args:
+            attempt: In-progress ExamAttempt instance
+            data: QueryDict or mapping containing ``question_<id>`` fields
+
+        Returns:
+            Number of answers recorded
+        """
+        return AnswerService.record_answers(attempt, AnswerService.parse_answers(data))
+
+    @staticmethod
+    def apply_delta(attempt, seq, answers):
+        """
+        Apply an autosave delta if its sequence number is newer.
+
+        The sequence number is advanced with a conditional UPDATE, so a
+        duplicate or out-of-order delta is dropped without touching any
+        answer rows. Work is proportional to the size of the delta, not to
+        the number of questions already answered.
+
+        Args:
+            attempt: In-progress ExamAttempt instance
+            seq: Client sequence number of this delta
+            answers: Mapping of question ID to selected option ID
+
+        Returns:
+            Tuple of (applied, acknowledged sequence number, answers written)
+        """
+        if seq <= attempt.last_client_seq:
+            return False, attempt.last_client_seq, 0
+
+        if answer_buffer.is_enabled():
+            answers = AnswerService.get_valid_answers(
+                attempt, AnswerService.parse_delta(answers)
+            )
+            applied, ack = answer_buffer.buffer_answers(attempt, answers, seq=seq)
+            return applied, ack, len(answers) if applied else 0
+
+        # Advance the sequence and write the answers together, so a failed
+        # write cannot leave the delta acknowledged but unsaved
+        with transaction.atomic():
+            advanced = ExamAttempt.objects.filter(
+                pk=attempt.pk,
+                status=ExamAttempt.Status.IN_PROGRESS,
+                last_client_seq__lt=seq,
+            ).update(last_client_seq=seq)
+            if not advanced:
+                current = (
+                    ExamAttempt.objects.filter(pk=attempt.pk)
+                    .values_list("last_client_seq", flat=True)
+                    .first()
+                )
+                return False, current or 0, 0
+
+            saved = AnswerService.write_answers(
+                attempt, AnswerService.parse_delta(answers), seq=seq
+            )
+        attempt.last_client_seq = seq
+        return True, seq, saved
+
+    @staticmethod
+    def parse_batch(payload, now):
+        """
+        Extract queued answers from an offline sync batch.
+
+        The payload is ``{"sent_at": <ms>, "answers": [{"seq", "question",
+        "option", "answered_at"}]}`` with times in milliseconds since the
+        epoch on the client clock. Answer times are shifted by the
+        difference between ``sent_at`` and ``now`` to correct for clock skew.
+
+        Args:
+            payload: Decoded JSON body of the sync request
+            now: Server time the batch was received
+
+        Returns:
+            List of (seq, question ID, option ID, answered_at) tuples in
+            sequence order. Malformed entries are skipped.
+
+        Raises:
+            ValueError: If the payload itself is malformed
+        """
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("answers"), list
+        ):
+            raise ValueError("Sync payload must contain a list of answers.")
+        sent_at = payload.get("sent_at")
+        if isinstance(sent_at, bool) or not isinstance(sent_at, (int, float)):
+            raise ValueError("Sync payload must contain a sent_at timestamp.")
+        skew = now - datetime.fromtimestamp(sent_at / 1000, tz=dt_timezone.utc)
+
+        entries = []
+        for entry in payload["answers"]:
+            try:
+                values = [
+                    entry[k] for k in ("seq", "question", "option", "answered_at")
+                ]
+                if any(isinstance(v, bool) for v in values):
+                    continue
+                seq, question_id, option_id = (int(v) for v in values[:3])
+                answered_at = datetime.fromtimestamp(
+                    float(values[3]) / 1000, tz=dt_timezone.utc
+                )
+            except (KeyError, TypeError, ValueError, OverflowError, OSError):
+                continue
+            if seq >= 1:
+                entries.append((seq, question_id, option_id, answered_at + skew))
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+    @staticmethod
+    def apply_batch(attempt, entries, deadline):
+        """
+        Apply queued offline answers idempotently.
+
+        Entries at or below the attempt's client sequence number were
+        applied by an earlier sync and are skipped, so a retried batch is a
+        no-op. The rest are applied in sequence order (the latest answer to
+        a question wins) and the sequence number advances past all of them.
+        Answers given after ``deadline`` are acknowledged but dropped.
+
+        Args:
+            attempt: In-progress ExamAttempt instance, locked for update
+            entries: Queued answers as returned by ``parse_batch``
+            deadline: Latest accepted answer time, normally the exam end time
+
+        Returns:
+            Tuple of (acknowledged sequence number, answers written)
+        """
+        buffered = answer_buffer.is_enabled()
+        if buffered:
+            _, current = answer_buffer.get_buffer(attempt)
+        else:
+            current = attempt.last_client_seq
+
+        pending = [entry for entry in entries if entry[0] > current]
+        if not pending:
+            return current, 0
+
+        answers = {
+            question_id: option_id
+            for _, question_id, option_id, answered_at in pending
+            if answered_at <= deadline
+        }
+        seq = pending[-1][0]
+
+        if buffered:
+            answers = AnswerService.get_valid_answers(attempt, answers)
+            applied, ack = answer_buffer.buffer_answers(attempt, answers, seq=seq)
+            return ack, len(answers) if applied else 0
+
+        ExamAttempt.objects.filter(pk=attempt.pk).update(last_client_seq=seq)
+        attempt.last_client_seq = seq
+        if answer_journal.is_enabled():
+            # Journal every queued answer, not just the latest per question
+            entries = [
+                (entry_seq, question_id, option_id)
+                for entry_seq, question_id, option_id, answered_at in pending
+                if answered_at <= deadline
+            ]
+            return seq, answer_journal.append([(attempt, entries)])
+        return seq, AnswerService.write_answers(attempt, answers)
+
+    @staticmethod
+    async def aapply_delta(attempt, seq, answers):
+        """
+        Async version of ``apply_delta`` for ASGI views.
+
+        Stale deltas are dropped without leaving the event loop. Newer ones
+        are applied by ``apply_delta`` in a worker thread, since advancing
+        the sequence and writing the answers must share a transaction,
+        which the async ORM cannot open.
+        """
+        if seq <= attempt.last_client_seq:
+            return False, attempt.last_client_seq, 0
+        return await sync_to_async(AnswerService.apply_delta)(attempt, seq, answers)
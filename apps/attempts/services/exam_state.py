@@ -0,0 +1,168 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    Count,
+    F,
+    FilteredRelation,
+    FloatField,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.functions import Cast, NullIf
+
+from apps.attempts.models import ExamAttempt
+
+STUDENT_STATE_VERSION_KEY = "student_exam_state_version_{student_id}"
+CLASS_EXAMS_VERSION_KEY = "class_exams_version_{class_id}"
+STUDENT_STATE_CACHE_KEY = (
+    "student_exam_state_{student_id}_{class_id}_{student_version}_{class_version}"
+)
+STUDENT_STATE_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+
+class ExamStateService:
+    """
+    Service for a student's view of their exams and attempt states.
+
+    The state map is built with two queries: one aggregating the student's
+    attempts per visible exam, and one loading each exam's latest attempt.
+    It is cached per student under version tokens that are bumped when the
+    student's attempts or the class's exams change.
+    """
+
+    @staticmethod
+    def get_student_states(student):
+        """
+        Get the state of every exam visible to a student.
+
+        Args:
+            student: Student user
+
+        Returns:
+            Dict mapping exam ID to a dict with the ``exam``, its latest
+            started ``attempt`` (or None), ``attempt_count``,
+            ``has_in_progress``, ``submitted_count`` and ``best_percentage``
+            (or None if no attempt is completed), in exam order
+        """
+        class_id = student.assigned_class_id
+        if class_id is None:
+            return {}
+
+        student_key = STUDENT_STATE_VERSION_KEY.format(student_id=student.pk)
+        class_key = CLASS_EXAMS_VERSION_KEY.format(class_id=class_id)
+        versions = cache.get_many([student_key, class_key])
+        if student_key not in versions:
+            cache.add(student_key, time.time_ns(), None)
+        if class_key not in versions:
+            cache.add(class_key, time.time_ns(), None)
+        if len(versions) < 2:
+            versions = cache.get_many([student_key, class_key])
+
+        key = STUDENT_STATE_CACHE_KEY.format(
+            student_id=student.pk,
+            class_id=class_id,
+            student_version=versions.get(student_key),
+            class_version=versions.get(class_key),
+        )
+        states = cache.get(key)
+        if states is None:
+            states = ExamStateService._build_states(student)
+            cache.set(key, states, STUDENT_STATE_CACHE_TIMEOUT)
+        return states
+
+    @staticmethod
+    def _build_states(student):
+        from apps.exams.models import Exam
+
+        started = ~Q(attempts__status=ExamAttempt.Status.PENDING)
+        latest_attempt = (
+            ExamAttempt.objects.filter(exam=OuterRef("pk"), student=student)
+            .started()
+            .order_by("-started_at", "-pk")
+            .values("pk")[:1]
+        )
+        completed = [ExamAttempt.Status.SUBMITTED, ExamAttempt.Status.TIMED_OUT]
+        percentage = (
+            Cast("student_attempts__score", FloatField())
+            * 100
+            / NullIf(F("student_attempts__total_questions"), 0)
+        )
+        exams = (
+            Exam.objects.filter(
+                subject__assigned_class_id=student.assigned_class_id,
+                status=Exam.Status.PUBLISHED,
+                is_active=True,
+            )
+            .select_related("subject", "subject__assigned_class")
+            .annotate(
+                # Join only this student's attempts, not the whole exam's
+                student_attempts=FilteredRelation(
+                    "attempts", condition=Q(attempts__student=student) & started
+                ),
+                attempt_count=Count("student_attempts"),
+                in_progress_count=Count(
+                    "student_attempts",
+                    filter=Q(student_attempts__status=ExamAttempt.Status.IN_PROGRESS),
+                ),
+                submitted_count=Count(
+                    "student_attempts",
+                    filter=Q(student_attempts__status=ExamAttempt.Status.SUBMITTED),
+                ),
+                best_percentage=Max(
+                    percentage, filter=Q(student_attempts__status__in=completed)
+                ),
+                latest_attempt_id=Subquery(latest_attempt),
+            )
+            # Meta.ordering is not applied to aggregate queries
+            .order_by("-start_time")
+        )
+        exams = list(exams)
+
+        attempts = ExamAttempt.objects.defer(
+            "stored_question_order", "stored_option_orders"
+        ).in_bulk([exam.latest_attempt_id for exam in exams if exam.latest_attempt_id])
+        states = {}
+        for exam in exams:
+            attempt = attempts.get(exam.latest_attempt_id)
+            if attempt is not None:
+                attempt.exam = exam
+            states[exam.pk] = {
+                "exam": exam,
+                "attempt": attempt,
+                "attempt_count": exam.attempt_count,
+                "has_in_progress": exam.in_progress_count > 0,
+                "submitted_count": exam.submitted_count,
+                "best_percentage": (
+                    round(exam.best_percentage, 1)
+                    if exam.best_percentage is not None
+                    else None
+                ),
+            }
+        return states
+
+    @staticmethod
+    def invalidate_students(student_ids):
+        """
+        Invalidate the cached exam states of students once the transaction commits.
+
+        Bumping after commit means a concurrent request cannot cache state
+        read before the change under the new version.
+        """
+        keys = {
+            STUDENT_STATE_VERSION_KEY.format(student_id=student_id)
+            for student_id in student_ids
+        }
+        if keys:
+            transaction.on_commit(
+                lambda: cache.set_many(dict.fromkeys(keys, time.time_ns()), None)
+            )
+
+    @staticmethod
+    def invalidate_class(class_id):
+        """Invalidate the cached exam states of every student in a class."""
+        key = CLASS_EXAMS_VERSION_KEY.format(class_id=class_id)
+        transaction.on_commit(lambda: cache.set(key, time.time_ns(), None))
@@ -0,0 +1,221 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.attempts.models import ExamAttempt, ExamStatistics
+
+STATISTICS_FIELDS = (
+    "attempt_count",
+    "pass_count",
+    "percentage_sum",
+    "percentage_sumsq",
+    "min_percentage",
+    "max_percentage",
+    "histogram",
+    "quantile_markers",
+)
+
+
+class ExamStatisticsService:
+    """Service maintaining streaming per-exam score statistics."""
+
+    @staticmethod
+    def _percentages(attempts):
+        """Group completed attempts' percentages by exam, in submission order."""
+        percentages = {}
+        rows = (
+            attempts.completed()
+            .order_by("submitted_at", "pk")
+            .values_list("exam_id", "percentage")
+        )
+        for exam_id, percentage in rows.iterator():
+            percentages.setdefault(exam_id, []).append(percentage)
+        return percentages
+
+    @staticmethod
+    def _reset(statistics):
+        for field in STATISTICS_FIELDS:
+            setattr(
+                statistics, field, ExamStatistics._meta.get_field(field).get_default()
+            )
+
+    @staticmethod
+    def update_quantile(markers, p, x, count):
+        """
+        Add an observation to a P² quantile estimate (Jain & Chlamtac, 1985).
+
+        The first five observations are kept sorted in ``heights``; from
+        then on the five markers are moved towards their desired positions,
+        adjusting heights with a piecewise-parabolic fit.
+
+        Args:
+            markers: Dict with ``heights`` and ``positions`` lists, updated
+                in place
+            p: Quantile being estimated, between 0 and 1
+            x: New observation
+            count: Number of observations including ``x``
+        """
+        q = markers.setdefault("heights", [])
+        n = markers.setdefault("positions", [])
+        if count <= 5:
+            q.append(x)
+            q.sort()
+            if count == 5:
+                n[:] = [1, 2, 3, 4, 5]
+            return
+
+        # Find the cell containing x, extending the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+        for i in range(k + 1, 5):
+            n[i] += 1
+
+        increments = (0, p / 2, p, (1 + p) / 2, 1)
+        for i in range(1, 4):
+            d = 1 + (count - 1) * increments[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    @staticmethod
+    def fold(statistics, percentages):
+        """
+        Add attempt percentages to an exam's statistics in place.
+
+        Args:
+            statistics: ExamStatistics instance to update
+            percentages: Iterable of percentages in submission order
+        """
+        bins = ExamStatistics.HISTOGRAM_BINS
+        if len(statistics.histogram) != bins:
+            statistics.histogram = [0] * bins
+        for x in percentages:
+            statistics.attempt_count += 1
+            statistics.pass_count += x >= ExamAttempt.PASS_PERCENTAGE
+            statistics.percentage_sum += x
+            statistics.percentage_sumsq += x * x
+            if statistics.min_percentage is None or x < statistics.min_percentage:
+                statistics.min_percentage = x
+            if statistics.max_percentage is None or x > statistics.max_percentage:
+                statistics.max_percentage = x
+            # The last bin includes 100%
+            statistics.histogram[min(int(x * bins // 100), bins - 1)] += 1
+            for p in ExamStatistics.QUANTILES:
+                ExamStatisticsService.update_quantile(
+                    statistics.quantile_markers.setdefault(str(p), {}),
+                    p,
+                    x,
+                    statistics.attempt_count,
+                )
+
+    @staticmethod
+    def _lock(exam_ids, create_ids):
+        """Create missing statistics rows and lock the exams' rows."""
+        ExamStatistics.objects.bulk_create(
+            [ExamStatistics(exam_id=exam_id) for exam_id in create_ids],
+            ignore_conflicts=True,
+        )
+        return list(
+            ExamStatistics.objects.select_for_update()
+            .filter(exam_id__in=exam_ids)
+            .order_by("exam_id")
+        )
+
+    @staticmethod
+    def _save(rows):
+        now = timezone.now()
+        for statistics in rows:
+            statistics.updated_at = now
+        ExamStatistics.objects.bulk_update(rows, [*STATISTICS_FIELDS, "updated_at"])
+
+    @staticmethod
+    def record_attempts(attempt_ids):
+        """
+        Add newly finalized attempts to their exams' statistics.
+
+        Call in the transaction that finalizes the attempts. Each exam's
+        row is locked while it is updated, so concurrent finalizes for the
+        same exam apply one after the other. An exam without statistics
+        yet gets them built from all of its completed attempts, read after
+        the lock, so earlier attempts are included without a backfill.
+
+        Args:
+            attempt_ids: IDs of attempts that were just finalized
+
+        Returns:
+            Number of exams updated
+        """
+        percentages = ExamStatisticsService._percentages(
+            ExamAttempt.objects.filter(pk__in=attempt_ids)
+        )
+        if not percentages:
+            return 0
+
+        with transaction.atomic():
+            rows = ExamStatisticsService._lock(percentages, percentages)
+            fresh = [row.exam_id for row in rows if not row.attempt_count]
+            if fresh:
+                percentages.update(
+                    ExamStatisticsService._percentages(
+                        ExamAttempt.objects.filter(exam_id__in=fresh)
+                    )
+                )
+            for statistics in rows:
+                ExamStatisticsService.fold(statistics, percentages[statistics.exam_id])
+            ExamStatisticsService._save(rows)
+        return len(rows)
+
+    @staticmethod
+    def rebuild(exam_ids):
+        """
+        Recompute exams' statistics from their completed attempts.
+
+        Used for backfilling and after scores change outside finalizing,
+        e.g. by a regrade. Statistics of exams left without completed
+        attempts are deleted.
+
+        Args:
+            exam_ids: IDs of exams to rebuild
+
+        Returns:
+            Number of exams with statistics
+        """
+        exam_ids = list(exam_ids)
+        if not exam_ids:
+            return 0
+
+        with transaction.atomic():
+            completed = ExamAttempt.objects.completed().filter(exam_id__in=exam_ids)
+            rows = ExamStatisticsService._lock(
+                exam_ids, completed.values_list("exam_id", flat=True).distinct()
+            )
+            percentages = ExamStatisticsService._percentages(
+                ExamAttempt.objects.filter(exam_id__in=exam_ids)
+            )
+            updated, stale = [], []
+            for statistics in rows:
+                ExamStatisticsService._reset(statistics)
+                if statistics.exam_id in percentages:
+                    ExamStatisticsService.fold(
+                        statistics, percentages[statistics.exam_id]
+                    )
+                    updated.append(statistics)
+                else:
+                    stale.append(statistics.pk)
+            ExamStatisticsService._save(updated)
+            if stale:
+                ExamStatistics.objects.filter(pk__in=stale).delete()
+        return len(updated)
@@ -0,0 +1,249 @@
+import itertools
+import time
+
+from django.core.cache import cache
+from django.db import connections, transaction
+
+from apps.attempts.models import ExamAnswer, ExamAttempt
+
+try:
+    import numpy as np
+except ImportError:  # Optional: install the "analytics" extra
+    np = None
+
+ITEM_ANALYSIS_VERSION_KEY = "exam_item_analysis_version_{exam_id}"
+ITEM_ANALYSIS_CACHE_KEY = "exam_item_analysis_{exam_id}_{version}"
+ITEM_ANALYSIS_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+STREAM_CHUNK_SIZE = 10000
+
+
+class ItemAnalysisService:
+    """
+    Service computing classical item statistics for an exam's results.
+
+    The completed attempts' answers are streamed into a NumPy response
+    matrix with one query, and every statistic is computed with vectorized
+    operations over it. Results are cached per exam under a version token
+    bumped when attempts are finalized or rescored.
+    """
+
+    @staticmethod
+    def is_available():
+        """Check whether NumPy is installed."""
+        return np is not None
+
+    @staticmethod
+    def get_analysis(exam):
+        """
+        Get the cached item analysis of an exam, computing it if needed.
+
+        Returns:
+            The analysis dict (see ``analyze``), or None without NumPy
+        """
+        if np is None:
+            return None
+
+        version_key = ITEM_ANALYSIS_VERSION_KEY.format(exam_id=exam.pk)
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, time.time_ns(), None)
+            version = cache.get(version_key)
+
+        key = ITEM_ANALYSIS_CACHE_KEY.format(exam_id=exam.pk, version=version)
+        analysis = cache.get(key)
+        if analysis is None:
+            analysis = ItemAnalysisService.analyze(exam)
+            cache.set(key, analysis, ITEM_ANALYSIS_CACHE_TIMEOUT)
+        return analysis
+
+    @staticmethod
+    def invalidate(exam_ids):
+        """Invalidate the cached analyses of exams once the transaction commits."""
+        keys = {
+            ITEM_ANALYSIS_VERSION_KEY.format(exam_id=exam_id) for exam_id in exam_ids
+        }
+        if keys:
+            transaction.on_commit(
+                lambda: cache.set_many(dict.fromkeys(keys, time.time_ns()), None)
+            )
+
+    @staticmethod
+    def analyze(exam):
+        """
+        Compute item statistics over an exam's completed attempts.
+
+        Each question is analysed over the attempts whose paper included
+        it, so exams drawing random questions are handled too. Answers are
+        marked against the current answer key, and unanswered questions
+        count as incorrect.
+
+        Returns:
+            Dict with ``attempt_count``, ``kr20`` (KR-20 reliability, or None
+            unless every attempt had the same questions) and ``items``, a
+            list of dicts per question with ``question_id``,
+            ``question_text``, ``administered``, ``p_value`` (proportion
+            correct), ``discrimination`` (corrected point-biserial
+            correlation with the rest of the score, or None if undefined),
+            ``omit_rate`` and ``options``, a list of ``{"text", "rate",
+            "is_correct"}`` dicts
+        """
+        from apps.exams.cache import get_paper, serialize_questions
+
+        from .answers import AnswerService
+
+        attempts = list(
+            ExamAttempt.objects.completed()
+            .filter(exam=exam)
+            .only(
+                "paper_id",
+                "shuffle_seed",
+                "total_questions",
+                "stored_question_order",
+            )
+            .order_by("pk")
+        )
+        if not attempts:
+            return {"attempt_count": 0, "kr20": None, "items": []}
+
+        # Share each paper between its attempts instead of one cache read each
+        papers = {
+            paper_id: get_paper(paper_id)
+            for paper_id in {attempt.paper_id for attempt in attempts}
+            if paper_id is not None
+        }
+        for attempt in attempts:
+            attempt.paper_structure = papers.get(attempt.paper_id)
+
+        # Administered matrix: which questions were on each attempt's paper
+        attempt_questions = [sorted(attempt.question_ids) for attempt in attempts]
+        question_ids = np.array(
+            sorted(set(itertools.chain.from_iterable(attempt_questions))),
+            dtype=np.int64,
+        )
+        administered = np.zeros((len(attempts), len(question_ids)), dtype=bool)
+        for row, ids in enumerate(attempt_questions):
+            administered[row, np.searchsorted(question_ids, ids)] = True
+
+        # Map every option to its question's column and whether it is correct
+        questions = serialize_questions(question_ids.tolist())
+        answer_key = AnswerService.get_answer_key(
+            question_ids.tolist(), exam.subject_id
+        )
+        option_map = sorted(
+            (option_id, col, option_id == answer_key.get(question_id))
+            for col, question_id in enumerate(question_ids.tolist())
+            if question_id in questions
+            for option_id in questions[question_id]["options"]
+        )
+        option_ids = np.array([row[0] for row in option_map], dtype=np.int64)
+        option_cols = np.array([row[1] for row in option_map], dtype=np.intp)
+        option_correct = np.array([row[2] for row in option_map], dtype=bool)
+
+        # Stream (attempt, selected option) pairs into one array. Only
+        # answered questions are read, and the rows are plain integers read
+        # from the cursor rather than through per-row model converters.
+        answers = (
+            ExamAnswer.objects.filter(
+                attempt__exam=exam,
+                attempt__status__in=[
+                    ExamAttempt.Status.SUBMITTED,
+                    ExamAttempt.Status.TIMED_OUT,
+                ],
+                selected_option__isnull=False,
+            )
+            .values_list("attempt_id", "selected_option_id")
+            .order_by()
+        )
+        sql, params = answers.query.sql_with_params()
+        with connections[answers.db].cursor() as cursor:
+            cursor.execute(sql, params)
+            chunks = iter(lambda: cursor.fetchmany(STREAM_CHUNK_SIZE), [])
+            rows = np.fromiter(
+                itertools.chain.from_iterable(itertools.chain.from_iterable(chunks)),
+                dtype=np.int64,
+            ).reshape(-1, 2)
+
+        attempt_ids = np.array([attempt.pk for attempt in attempts])
+        row_idx = np.searchsorted(attempt_ids, rows[:, 0])
+        opt_idx = np.searchsorted(option_ids, rows[:, 1])
+        # Drop answers from attempts finalized since they were listed, and
+        # to questions that were not on the attempt's paper
+        valid = (row_idx < len(attempt_ids)) & (opt_idx < len(option_ids))
+        valid[valid] &= attempt_ids[row_idx[valid]] == rows[valid, 0]
+        valid[valid] &= option_ids[opt_idx[valid]] == rows[valid, 1]
+        valid[valid] &= administered[row_idx[valid], option_cols[opt_idx[valid]]]
+        row_idx, opt_idx = row_idx[valid], opt_idx[valid]
+        col_idx = option_cols[opt_idx]
+
+        correct = np.zeros(administered.shape, dtype=np.float64)
+        correct[row_idx, col_idx] = option_correct[opt_idx]
+        totals = correct.sum(axis=1)
+
+        # Difficulty: proportion correct among attempts given the question
+        n = administered.sum(axis=0).astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = correct.sum(axis=0) / n
+
+            # Discrimination: correlation of the item with the rest score,
+            # from masked sums so each item only uses its own attempts
+            rest = (totals[:, None] - correct) * administered
+            mean_rest = rest.sum(axis=0) / n
+            cov = (correct * rest).sum(axis=0) / n - p * mean_rest
+            var_rest = (rest**2).sum(axis=0) / n - mean_rest**2
+            discrimination = cov / np.sqrt(p * (1 - p) * var_rest)
+
+        # Distractors: selection counts per option
+        selections = dict(
+            zip(
+                option_ids.tolist(),
+                np.bincount(opt_idx, minlength=len(option_ids)).tolist(),
+            )
+        )
+        answered = np.bincount(col_idx, minlength=len(question_ids))
+
+        # KR-20 needs every attempt to have taken the same questions
+        kr20 = None
+        k = len(question_ids)
+        if k > 1 and administered.all() and totals.var() > 0:
+            kr20 = float(k / (k - 1) * (1 - (p * (1 - p)).sum() / totals.var()))
+
+        items = []
+        for col, question_id in enumerate(question_ids.tolist()):
+            question = questions.get(question_id)
+            if question is None or not n[col]:
+                continue
+            items.append(
+                {
+                    "question_id": question_id,
+                    "question_text": question["question_text"],
+                    "administered": int(n[col]),
+                    "p_value": float(p[col]),
+                    "discrimination": (
+                        float(discrimination[col])
+                        if np.isfinite(discrimination[col])
+                        else None
+                    ),
+                    "omit_rate": float(1 - answered[col] / n[col]),
+                    "options": [
+                        {
+                            "text": text,
+                            "rate": float(selections.get(option_id, 0) / n[col]),
+                            "is_correct": option_id == answer_key.get(question_id),
+                        }
+                        for option_id, text in question["options"].items()
+                    ],
+                }
+            )
+
+        if not exam.use_random_questions:
+            # List questions in the exam's order
+            order = {
+                question_id: i
+                for i, question_id in enumerate(
+                    exam.exam_questions.order_by("order").values_list(
+                        "question_id", flat=True
+                    )
+                )
+            }
+            items.sort(key=lambda item: order.get(item["question_id"], len(order)))
+        return {"attempt_count": len(attempts), "kr20": kr20, "items": items}
@@ -0,0 +1,197 @@
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from apps.attempts.models import ExamAttempt, PerformanceRollup
+
+ROLLUP_FIELDS = (
+    "attempt_count",
+    "score_sum",
+    "total_sum",
+    "pass_count",
+    "best_percentage",
+    "best_attempt_id",
+    "worst_percentage",
+    "worst_attempt_id",
+)
+
+
+class PerformanceService:
+    """Service maintaining per-student, per-subject performance rollups."""
+
+    @staticmethod
+    def _attempt_rows(attempts):
+        return attempts.order_by("pk").values_list(
+            "pk",
+            "student_id",
+            "exam__subject_id",
+            "score",
+            "total_questions",
+            "percentage",
+        )
+
+    @staticmethod
+    def fold(rows):
+        """
+        Fold completed attempts into per-student, per-subject totals.
+
+        Args:
+            rows: Iterable of (attempt ID, student ID, subject ID, score,
+                total questions, percentage) tuples in attempt order
+
+        Returns:
+            Dict mapping (student ID, subject ID) to a dict of rollup values
+        """
+        totals = {}
+        for pk, student_id, subject_id, score, total, percentage in rows:
+            rollup = totals.setdefault(
+                (student_id, subject_id),
+                {
+                    "attempt_count": 0,
+                    "score_sum": 0,
+                    "total_sum": 0,
+                    "pass_count": 0,
+                    "best_percentage": None,
+                    "best_attempt_id": None,
+                    "worst_percentage": None,
+                    "worst_attempt_id": None,
+                },
+            )
+            rollup["attempt_count"] += 1
+            rollup["score_sum"] += score or 0
+            rollup["total_sum"] += total
+            rollup["pass_count"] += percentage >= ExamAttempt.PASS_PERCENTAGE
+            # Later attempts win ties
+            if (
+                rollup["best_attempt_id"] is None
+                or percentage >= rollup["best_percentage"]
+            ):
+                rollup["best_percentage"] = percentage
+                rollup["best_attempt_id"] = pk
+            if (
+                rollup["worst_attempt_id"] is None
+                or percentage <= rollup["worst_percentage"]
+            ):
+                rollup["worst_percentage"] = percentage
+                rollup["worst_attempt_id"] = pk
+        return totals
+
+    @staticmethod
+    def record_attempts(attempt_ids):
+        """
+        Add newly finalized attempts to their students' rollups.
+
+        Call in the transaction that finalizes the attempts, so the totals
+        commit or roll back with them. Each rollup is changed by one UPDATE
+        of expressions over its current values, so concurrent finalizes for
+        the same student and subject serialize on the row instead of
+        overwriting each other.
+
+        Args:
+            attempt_ids: IDs of attempts that were just finalized
+
+        Returns:
+            Number of rollups updated
+        """
+        totals = PerformanceService.fold(
+            PerformanceService._attempt_rows(
+                ExamAttempt.objects.filter(pk__in=attempt_ids)
+            )
+        )
+        if not totals:
+            return 0
+
+        PerformanceRollup.objects.bulk_create(
+            [
+                PerformanceRollup(student_id=student_id, subject_id=subject_id)
+                for student_id, subject_id in totals
+            ],
+            ignore_conflicts=True,
+        )
+        now = timezone.now()
+        for (student_id, subject_id), rollup in totals.items():
+            is_best = Q(best_attempt__isnull=True) | Q(
+                best_percentage__lte=rollup["best_percentage"]
+            )
+            is_worst = Q(worst_attempt__isnull=True) | Q(
+                worst_percentage__gte=rollup["worst_percentage"]
+            )
+            PerformanceRollup.objects.filter(
+                student_id=student_id, subject_id=subject_id
+            ).update(
+                attempt_count=F("attempt_count") + rollup["attempt_count"],
+                score_sum=F("score_sum") + rollup["score_sum"],
+                total_sum=F("total_sum") + rollup["total_sum"],
+                pass_count=F("pass_count") + rollup["pass_count"],
+                best_percentage=Case(
+                    When(is_best, then=Value(rollup["best_percentage"])),
+                    default=F("best_percentage"),
+                ),
+                best_attempt_id=Case(
+                    When(is_best, then=Value(rollup["best_attempt_id"])),
+                    default=F("best_attempt_id"),
+                    output_field=models.IntegerField(),
+                ),
+                worst_percentage=Case(
+                    When(is_worst, then=Value(rollup["worst_percentage"])),
+                    default=F("worst_percentage"),
+                ),
+                worst_attempt_id=Case(
+                    When(is_worst, then=Value(rollup["worst_attempt_id"])),
+                    default=F("worst_attempt_id"),
+                    output_field=models.IntegerField(),
+                ),
+                updated_at=now,
+            )
+        return len(totals)
+
+    @staticmethod
+    def rebuild(student_ids):
+        """
+        Recompute students' rollups from their completed attempts.
+
+        Used after scores change outside finalizing, e.g. by a regrade.
+        The students' existing rollups are locked first, so finalizes for
+        them wait until the rebuilt rows are committed.
+
+        Args:
+            student_ids: IDs of students to rebuild
+
+        Returns:
+            Number of rollups written
+        """
+        student_ids = list(student_ids)
+        if not student_ids:
+            return 0
+
+        rollups = PerformanceRollup.objects.filter(student_id__in=student_ids)
+        with transaction.atomic():
+            existing = rollups.select_for_update().values_list(
+                "pk", "student_id", "subject_id"
+            )
+            existing = {(student, subject): pk for pk, student, subject in existing}
+            totals = PerformanceService.fold(
+                PerformanceService._attempt_rows(
+                    ExamAttempt.objects.completed().filter(student_id__in=student_ids)
+                )
+            )
+            now = timezone.now()
+            PerformanceRollup.objects.bulk_create(
+                [
+                    PerformanceRollup(
+                        student_id=student_id,
+                        subject_id=subject_id,
+                        updated_at=now,
+                        **rollup,
+                    )
+                    for (student_id, subject_id), rollup in totals.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["student", "subject"],
+                update_fields=[*ROLLUP_FIELDS, "updated_at"],
+            )
+            # Drop rollups of subjects left without completed attempts
+            stale = [pk for key, pk in existing.items() if key not in totals]
+            if stale:
+                PerformanceRollup.objects.filter(pk__in=stale).delete()
+        return len(totals)
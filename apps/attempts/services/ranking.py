@@ -0,0 +1,204 @@
+import bisect
+import time
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, OuterRef, Subquery, Window
+from django.db.models.functions import PercentRank, Rank
+
+from apps.attempts.models import ExamAttempt
+
+RANKING_VERSION_KEY = "exam_ranking_version_{exam_id}"
+RANKING_CACHE_KEY = "exam_ranking_{exam_id}_{version}"
+RANKING_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+
+
+def ordinal(number):
+    """Return a number with its English ordinal suffix, e.g. ``91st``."""
+    if 10 <= number % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
+
+
+class RankingService:
+    """
+    Service ranking students by their results in an exam.
+
+    Each student is ranked by their best completed attempt (the only one
+    on official exams), highest percentage first. Tied students share a
+    rank and the next rank is skipped, as with SQL ``RANK()``. The
+    percentile is the share of the other students with a lower score.
+    Rankings are cached per exam under a version token bumped when
+    attempts are finalized, rescored or deleted.
+    """
+
+    @staticmethod
+    def _versions(exam_ids):
+        keys = {
+            exam_id: RANKING_VERSION_KEY.format(exam_id=exam_id) for exam_id in exam_ids
+        }
+        versions = cache.get_many(keys.values())
+        missing = [key for key in keys.values() if key not in versions]
+        if missing:
+            for key in missing:
+                cache.add(key, time.time_ns(), None)
+            versions.update(cache.get_many(missing))
+        return {exam_id: versions.get(key) for exam_id, key in keys.items()}
+
+    @staticmethod
+    def get_rankings(exam_ids):
+        """
+        Get the cached rankings of exams, computing missing ones together.
+
+        Args:
+            exam_ids: IDs of the exams
+
+        Returns:
+            Dict mapping exam ID to ``{"total", "students"}``, where
+            ``students`` maps student ID to an ``(attempt ID, rank,
+            percentile)`` tuple for their ranked attempt
+        """
+        exam_ids = set(exam_ids)
+        if not exam_ids:
+            return {}
+
+        keys = {
+            exam_id: RANKING_CACHE_KEY.format(exam_id=exam_id, version=version)
+            for exam_id, version in RankingService._versions(exam_ids).items()
+        }
+        cached = cache.get_many(keys.values())
+        rankings = {
+            exam_id: cached[key] for exam_id, key in keys.items() if key in cached
+        }
+        missing = exam_ids - rankings.keys()
+        if missing:
+            computed = RankingService.compute(missing)
+            cache.set_many(
+                {keys[exam_id]: computed[exam_id] for exam_id in missing},
+                RANKING_CACHE_TIMEOUT,
+            )
+            rankings.update(computed)
+        return rankings
+
+    @staticmethod
+    def get_standing(exam_id, student_id):
+        """
+        Get a student's rank in an exam.
+
+        Returns:
+            Dict with ``attempt_id`` (the ranked attempt), ``rank``,
+            ``total``, ``percentile`` and ``percentile_ordinal``, or None
+            if the student has no completed attempt
+        """
+        ranking = RankingService.get_rankings([exam_id])[exam_id]
+        return RankingService._standing(ranking, student_id)
+
+    @staticmethod
+    def _standing(ranking, student_id):
+        entry = ranking["students"].get(student_id)
+        if entry is None:
+            return None
+        attempt_id, rank, percentile = entry
+        return {
+            "attempt_id": attempt_id,
+            "rank": rank,
+            "total": ranking["total"],
+            "percentile": percentile,
+            "percentile_ordinal": ordinal(percentile),
+        }
+
+    @staticmethod
+    def get_attempt_standings(attempts):
+        """
+        Get the standings of the ranked attempts among ``attempts``.
+
+        Practice attempts other than the student's best are not ranked.
+
+        Returns:
+            Dict mapping attempt ID to its standing (see ``get_standing``)
+        """
+        rankings = RankingService.get_rankings({a.exam_id for a in attempts})
+        standings = {}
+        for attempt in attempts:
+            standing = RankingService._standing(
+                rankings[attempt.exam_id], attempt.student_id
+            )
+            if standing and standing["attempt_id"] == attempt.pk:
+                standings[attempt.pk] = standing
+        return standings
+
+    @staticmethod
+    def invalidate(exam_ids):
+        """Invalidate the cached rankings of exams once the transaction commits."""
+        keys = {RANKING_VERSION_KEY.format(exam_id=exam_id) for exam_id in exam_ids}
+        if keys:
+            transaction.on_commit(
+                lambda: cache.set_many(dict.fromkeys(keys, time.time_ns()), None)
+            )
+
+    @staticmethod
+    def compute(exam_ids):
+        """
+        Rank the students of exams in one query.
+
+        Uses ``RANK()`` and ``PERCENT_RANK()`` window functions partitioned
+        by exam; on databases without window functions the ranks are
+        computed from the sorted scores instead.
+
+        Returns:
+            Dict mapping exam ID to a ranking (see ``get_rankings``)
+        """
+        completed = ExamAttempt.objects.completed()
+        best_attempt = (
+            completed.filter(
+                exam_id=OuterRef("exam_id"), student_id=OuterRef("student_id")
+            )
+            .order_by("-percentage", "pk")
+            .values("pk")[:1]
+        )
+        best = completed.filter(exam_id__in=exam_ids, pk=Subquery(best_attempt))
+
+        rankings = {exam_id: {"total": 0, "students": {}} for exam_id in exam_ids}
+        if connection.features.supports_over_clause:
+            rows = best.annotate(
+                rank=Window(
+                    Rank(),
+                    partition_by=F("exam_id"),
+                    order_by=F("percentage").desc(),
+                ),
+                percent_rank=Window(
+                    PercentRank(),
+                    partition_by=F("exam_id"),
+                    order_by=F("percentage").asc(),
+                ),
+            ).values_list("exam_id", "student_id", "pk", "rank", "percent_rank")
+            for exam_id, student_id, attempt_id, rank, percent_rank in rows:
+                ranking = rankings[exam_id]
+                ranking["total"] += 1
+                ranking["students"][student_id] = (
+                    attempt_id,
+                    rank,
+                    round(percent_rank * 100),
+                )
+            return rankings
+
+        rows = best.values_list("exam_id", "student_id", "pk", "percentage")
+        scores = {}
+        for exam_id, student_id, attempt_id, percentage in rows:
+            scores.setdefault(exam_id, []).append((student_id, attempt_id, percentage))
+        for exam_id, students in scores.items():
+            ordered = sorted(percentage for _, _, percentage in students)
+            total = len(ordered)
+            rankings[exam_id]["total"] = total
+            for student_id, attempt_id, percentage in students:
+                below = bisect.bisect_left(ordered, percentage)
+                above = total - bisect.bisect_right(ordered, percentage)
+                percentile = round(below / (total - 1) * 100) if total > 1 else 0
+                rankings[exam_id]["students"][student_id] = (
+                    attempt_id,
+                    above + 1,
+                    percentile,
+                )
+        return rankings
@@ -0,0 +1,165 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from apps.attempts.models import ExamAnswer, ExamAttempt, RegradeRun
+from apps.attempts.services.exam_state import ExamStateService
+from apps.attempts.services.exam_statistics import ExamStatisticsService
+from apps.attempts.services.item_analysis import ItemAnalysisService
+from apps.attempts.services.performance import PerformanceService
+from apps.attempts.services.ranking import RankingService
+from apps.attempts.services.scoring import ScoringService
+
+logger = logging.getLogger(__name__)
+
+
+class RegradeService:
+    """Service for regrading stored answers after an answer key change."""
+
+    DEFAULT_BATCH_SIZE = 5000
+
+    @staticmethod
+    def _batches(queryset, batch_size):
+        """
+        Yield ``(low, high, size)`` primary-key batches covering a queryset.
+
+        Uses keyset pagination over the primary key, so each batch costs one
+        index range scan regardless of how far into the table it is.
+        """
+        last_pk = 0
+        while True:
+            pks = list(
+                queryset.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                return
+            yield last_pk, pks[-1], len(pks)
+            last_pk = pks[-1]
+
+    @staticmethod
+    def regrade_answers(question_ids, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+        """
+        Recompute ``is_correct`` for every answer to the given questions.
+
+        Each batch is two UPDATEs that only touch rows whose result
+        changes, comparing the selected option to the question's current
+        correct option in the database.
+
+        Returns:
+            Tuple of (answers checked, answers changed)
+        """
+        from apps.questions.models import Question
+
+        matches_key = Exists(
+            Question.objects.filter(
+                pk=OuterRef("question_id"),
+                correct_option_id=OuterRef("selected_option_id"),
+            )
+        )
+        answers = ExamAnswer.objects.filter(question_id__in=question_ids)
+
+        checked = changed = 0
+        for low, high, size in RegradeService._batches(answers, batch_size):
+            batch = answers.filter(pk__gt=low, pk__lte=high)
+            with transaction.atomic():
+                changed += (
+                    batch.filter(is_correct=False)
+                    .filter(matches_key)
+                    .update(is_correct=True)
+                )
+                changed += (
+                    batch.filter(is_correct=True)
+                    .exclude(matches_key)
+                    .update(is_correct=False)
+                )
+            checked += size
+            if progress:
+                progress("answers", checked, changed)
+        return checked, changed
+
+    @staticmethod
+    def rescore_attempts(question_ids, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+        """
+        Recompute scores of completed attempts that answered the questions.
+
+        Returns:
+            Number of attempts rescored
+        """
+        attempts = ExamAttempt.objects.completed().filter(
+            Exists(
+                ExamAnswer.objects.filter(
+                    attempt=OuterRef("pk"), question_id__in=question_ids
+                )
+            )
+        )
+
+        rescored = 0
+        rescored_exam_ids = set()
+        for low, high, size in RegradeService._batches(attempts, batch_size):
+            with transaction.atomic():
+                batch = attempts.filter(pk__gt=low, pk__lte=high)
+                students_exams = set(batch.values_list("student_id", "exam_id"))
+                student_ids = {student_id for student_id, _ in students_exams}
+                exam_ids = {exam_id for _, exam_id in students_exams}
+                batch.update(score=ScoringService.score_expression())
+                ExamStateService.invalidate_students(student_ids)
+                ItemAnalysisService.invalidate(exam_ids)
+                RankingService.invalidate(exam_ids)
+                PerformanceService.rebuild(student_ids)
+            rescored_exam_ids |= exam_ids
+            rescored += size
+            if progress:
+                progress("attempts", rescored, rescored)
+        # Exams span batches, so their statistics are rebuilt once at the end
+        ExamStatisticsService.rebuild(sorted(rescored_exam_ids))
+        return rescored
+
+    @staticmethod
+    def regrade_questions(
+        question_ids, user=None, batch_size=DEFAULT_BATCH_SIZE, progress=None
+    ):
+        """
+        Regrade answers and rescore attempts for changed questions.
+
+        Args:
+            question_ids: IDs of questions whose correct option changed
+            user: User who triggered the regrade, for the audit record
+            batch_size: Maximum rows updated per statement
+            progress: Optional callable ``(stage, processed, changed)``
+
+        Returns:
+            The completed RegradeRun audit record
+        """
+        question_ids = sorted(set(question_ids))
+        run = RegradeRun.objects.create(question_ids=question_ids, triggered_by=user)
+
+        checked, changed = RegradeService.regrade_answers(
+            question_ids, batch_size=batch_size, progress=progress
+        )
+        rescored = RegradeService.rescore_attempts(
+            question_ids, batch_size=batch_size, progress=progress
+        )
+
+        run.answers_checked = checked
+        run.answers_changed = changed
+        run.attempts_rescored = rescored
+        run.completed_at = timezone.now()
+        run.save(
+            update_fields=[
+                "answers_checked",
+                "answers_changed",
+                "attempts_rescored",
+                "completed_at",
+                "updated_at",
+            ]
+        )
+
+        logger.info(
+            f"Regraded {len(question_ids)} question(s): {changed} of {checked} "
+            f"answers changed, {rescored} attempts rescored"
+        )
+        return run
@@ -0,0 +1,239 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import (
+    Count,
+    DateTimeField,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.attempts import buffer as answer_buffer
+from apps.attempts import journal as answer_journal
+from apps.attempts.models import ExamAnswer, ExamAttempt
+from apps.attempts.services.exam_state import ExamStateService
+from apps.attempts.services.exam_statistics import ExamStatisticsService
+from apps.attempts.services.item_analysis import ItemAnalysisService
+from apps.attempts.services.performance import PerformanceService
+from apps.attempts.services.ranking import RankingService
+
+logger = logging.getLogger(__name__)
+
+
+class ScoringService:
+    """Service for finalizing attempts and computing scores in the database."""
+
+    @staticmethod
+    def score_expression():
+        """
+        Build an expression counting an attempt's correct answers.
+
+        The correlated subquery references the outer attempt row, so it can
+        be used in ``update()`` or ``annotate()`` on any attempt queryset.
+        """
+        correct_answers = (
+            ExamAnswer.objects.filter(attempt=OuterRef("pk"), is_correct=True)
+            .order_by()
+            .values("attempt")
+            .annotate(correct=Count("pk"))
+            .values("correct")
+        )
+        return Coalesce(
+            Subquery(correct_answers, output_field=IntegerField()),
+            0,
+        )
+
+    @staticmethod
+    def finalize(attempt, status, submitted_at=None):
+        """
+        Finalize an in-progress attempt and store its score in one UPDATE.
+
+        The update is guarded on ``status=in_progress``, so a repeated or
+        concurrent finalize is a no-op and the result notification is sent
+        exactly once, after the transaction commits.
+
+        Args:
+            attempt: ExamAttempt to finalize
+            status: Final status (submitted or timed out)
+            submitted_at: Submission time, defaults to now
+
+        Returns:
+            True if this call finalized the attempt, False if it was
+            already finalized
+        """
+        submitted_at = submitted_at or timezone.now()
+        buffered = answer_buffer.is_enabled()
+        if buffered:
+            # Persist write-behind answers so they count towards the score
+            answer_buffer.flush_attempts([attempt.pk], force=True)
+        if answer_journal.is_enabled():
+            # Bring the answer projection up to date with the journal
+            answer_journal.materialize([attempt.pk], force=True)
+
+        with transaction.atomic():
+            finalized = ExamAttempt.objects.filter(
+                pk=attempt.pk,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            ).update(
+                status=status,
+                submitted_at=submitted_at,
+                score=ScoringService.score_expression(),
+                updated_at=timezone.now(),
+            )
+            if not finalized:
+                return False
+            PerformanceService.record_attempts([attempt.pk])
+            ExamStatisticsService.record_attempts([attempt.pk])
+        ItemAnalysisService.invalidate([attempt.exam_id])
+        RankingService.invalidate([attempt.exam_id])
+
+        attempt.status = status
+        attempt.submitted_at = submitted_at
+        attempt_id = attempt.pk
+        ExamStateService.invalidate_students([attempt.student_id])
+        if buffered:
+            transaction.on_commit(lambda: answer_buffer.discard_buffers([attempt_id]))
+        transaction.on_commit(lambda: ScoringService.notify_result(attempt_id))
+        return True
+
+    @staticmethod
+    def finalize_expired(batch_size=500, now=None):
+        """
+        Time out and score one batch of in-progress attempts past the end time.
+
+        Candidate rows are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``
+        where the database supports it, so several workers can sweep
+        concurrently without blocking on or double-processing the same rows.
+        The batch is then finalized with a single UPDATE, using each
+        attempt's end time (the exam's plus any time credit) as the
+        submission time, and only the attempts that UPDATE actually timed
+        out are recorded and notified. In offline mode attempts are left
+        open for the sync grace period, so queued answers can still arrive.
+
+        Args:
+            batch_size: Maximum number of attempts to finalize
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of attempts finalized
+        """
+        from apps.exams.models import Exam
+
+        now = now or timezone.now()
+        cutoff = now
+        if settings.EXAM_OFFLINE_MODE:
+            cutoff -= timedelta(seconds=settings.EXAM_SYNC_GRACE_PERIOD)
+        with transaction.atomic():
+            expired = (
+                ExamAttempt.objects.in_progress()
+                .alias(ends_at=F("exam__end_time") + F("time_credit"))
+                .filter(ends_at__lt=cutoff)
+            )
+            if connection.features.has_select_for_update_skip_locked:
+                expired = expired.select_for_update(skip_locked=True, of=("self",))
+            rows = list(
+                expired.order_by("pk").values_list("pk", "student_id", "exam_id")[
+                    :batch_size
+                ]
+            )
+            if not rows:
+                return 0
+            attempt_ids = [attempt_id for attempt_id, _, _ in rows]
+
+            buffered = answer_buffer.is_enabled()
+            if buffered:
+                answer_buffer.flush_attempts(attempt_ids, force=True)
+            if answer_journal.is_enabled():
+                answer_journal.materialize(attempt_ids, force=True)
+
+            end_time = Exam.objects.filter(pk=OuterRef("exam_id")).values("end_time")
+            ends_at = ExpressionWrapper(
+                Subquery(end_time) + F("time_credit"), output_field=DateTimeField()
+            )
+            # Without row locks a claimed attempt can be submitted before the
+            # UPDATE runs, so stamp the rows finalized here and re-select them
+            claimed_at = timezone.now()
+            ExamAttempt.objects.filter(
+                pk__in=attempt_ids,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            ).update(
+                status=ExamAttempt.Status.TIMED_OUT,
+                submitted_at=ends_at,
+                score=ScoringService.score_expression(),
+                updated_at=claimed_at,
+            )
+            finalized_ids = set(
+                ExamAttempt.objects.filter(
+                    pk__in=attempt_ids,
+                    status=ExamAttempt.Status.TIMED_OUT,
+                    updated_at=claimed_at,
+                ).values_list("pk", flat=True)
+            )
+            rows = [row for row in rows if row[0] in finalized_ids]
+            if not rows:
+                return 0
+            attempt_ids = [attempt_id for attempt_id, _, _ in rows]
+
+            PerformanceService.record_attempts(attempt_ids)
+            ExamStatisticsService.record_attempts(attempt_ids)
+            ExamStateService.invalidate_students(
+                {student_id for _, student_id, _ in rows}
+            )
+            exam_ids = {exam_id for _, _, exam_id in rows}
+            ItemAnalysisService.invalidate(exam_ids)
+            RankingService.invalidate(exam_ids)
+            if buffered:
+                transaction.on_commit(
+                    lambda: answer_buffer.discard_buffers(attempt_ids)
+                )
+            for attempt_id in attempt_ids:
+                transaction.on_commit(
+                    lambda attempt_id=attempt_id: ScoringService.notify_result(
+                        attempt_id
+                    )
+                )
+        return len(attempt_ids)
+
+    @staticmethod
+    def discard_expired_pending(batch_size=500, now=None):
+        """
+        Delete one batch of pre-generated attempts unclaimed after the exam ended.
+
+        Args:
+            batch_size: Maximum number of attempts to delete
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of attempts deleted
+        """
+        now = now or timezone.now()
+        expired_ids = list(
+            ExamAttempt.objects.pending()
+            .filter(exam__end_time__lt=now)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not expired_ids:
+            return 0
+        _, deleted = ExamAttempt.objects.filter(pk__in=expired_ids).pending().delete()
+        return deleted.get(ExamAttempt._meta.label, 0)
+
+    @staticmethod
+    def notify_result(attempt_id):
+        """Send the result-available notification for a finalized attempt."""
+        from apps.core.services.notification import NotificationService
+
+        try:
+            attempt = ExamAttempt.objects.select_related(
+                "student", "student__notification_preferences", "exam__subject"
+            ).get(pk=attempt_id)
+            NotificationService.notify_result_available(attempt)
+        except Exception as e:
+            logger.error(f"Failed to send result notification: {e}")
@@ -1,33 +1,23 @@
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from apps.attempts.models import ExamAttempt
+from apps.attempts.services.exam_state import ExamStateService
+from apps.attempts.services.item_analysis import ItemAnalysisService
+from apps.attempts.services.ranking import RankingService
+from apps.exams.models import Exam
 
 logger = logging.getLogger(__name__)
 
 
-# Store old status before save to detect status change
-@receiver(pre_save, sender=ExamAttempt)
-def store_old_attempt_status(sender, instance, **kwargs):
-    """Store the old status before saving to detect status changes."""
-    if instance.pk:
-        try:
-            old_instance = ExamAttempt.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.status
-        except ExamAttempt.DoesNotExist:
-            instance._old_status = None
-    else:
-        instance._old_status = None
-
-
 @receiver(post_save, sender=ExamAttempt)
 def notify_result_available(sender, instance, created, **kwargs):
     """Send notification when exam is submitted and result is available."""
     from apps.core.services.notification import NotificationService
 
-    old_status = getattr(instance, "_old_status", None)
+    old_status = instance.previous("status")
 
     # Only notify if status changed to submitted or timed_out
     # (meaning the result is now available)
@@ -43,3 +33,25 @@ def notify_result_available(sender, instance, created, **kwargs):
             NotificationService.notify_result_available(instance)
         except Exception as e:
             logger.error(f"Failed to send result notification: {e}")
+
+
+@receiver(post_save, sender=ExamAttempt)
+@receiver(post_delete, sender=ExamAttempt)
+def invalidate_student_exam_states(sender, instance, **kwargs):
+    """Refresh the student's cached exam states when an attempt changes."""
+    ExamStateService.invalidate_students([instance.student_id])
+
+
+@receiver(post_delete, sender=ExamAttempt)
+def invalidate_exam_results(sender, instance, **kwargs):
+    """Refresh the exam's cached rankings and item analysis when a result is removed."""
+    if instance.status in (ExamAttempt.Status.SUBMITTED, ExamAttempt.Status.TIMED_OUT):
+        RankingService.invalidate([instance.exam_id])
+        ItemAnalysisService.invalidate([instance.exam_id])
+
+
+@receiver(post_save, sender=Exam)
+@receiver(post_delete, sender=Exam)
+def invalidate_class_exam_states(sender, instance, **kwargs):
+    """Refresh cached exam states of the class when one of its exams changes."""
+    ExamStateService.invalidate_class(instance.subject.assigned_class_id)
@@ -1,16 +1,42 @@
 from django.urls import path
 
-from . import views
+from . import async_views, views
 
 app_name = "attempts"
 
 urlpatterns = [
     path("", views.StudentExamListView.as_view(), name="list"),
+    path("sw.js", views.ExamServiceWorkerView.as_view(), name="service_worker"),
     path("performance/", views.StudentPerformanceView.as_view(), name="performance"),
     path("history/", views.StudentExamHistoryView.as_view(), name="history"),
     path("<int:pk>/start/", views.StudentStartExamView.as_view(), name="start"),
+    path("<int:pk>/waiting/", views.StudentWaitingRoomView.as_view(), name="waiting"),
+    path(
+        "<int:pk>/waiting/status/",
+        views.StudentAdmissionStatusView.as_view(),
+        name="admission_status",
+    ),
     path("<int:pk>/take/", views.StudentExamView.as_view(), name="take"),
+    path("<int:pk>/paper/", views.StudentPaperView.as_view(), name="paper"),
+    path("<int:pk>/autosave/", views.StudentAutosaveView.as_view(), name="autosave"),
+    path("<int:pk>/sync/", views.StudentSyncView.as_view(), name="sync"),
     path("<int:pk>/submit/", views.StudentSubmitExamView.as_view(), name="submit"),
+    # Async (ASGI) variants of the exam-taking hot paths
+    path(
+        "<int:pk>/async/autosave/",
+        async_views.AsyncAutosaveView.as_view(),
+        name="autosave_async",
+    ),
+    path(
+        "<int:pk>/async/heartbeat/",
+        async_views.AsyncHeartbeatView.as_view(),
+        name="heartbeat_async",
+    ),
+    path(
+        "<int:pk>/async/submit/",
+        async_views.AsyncSubmitView.as_view(),
+        name="submit_async",
+    ),
     path("<int:pk>/result/", views.StudentResultView.as_view(), name="result"),
     path(
         "<int:pk>/result/pdf/", views.StudentResultPDFView.as_view(), name="result_pdf"
@@ -1,11 +1,15 @@
 import json
+from datetime import timedelta
 
+from django.conf import settings
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Avg, Count, Max, Min
-from django.http import HttpResponse
+from django.db.models import Q, Subquery
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
 from django.views import View
 
 from apps.academic.models import Class
@@ -14,7 +18,12 @@ from apps.core.services.pdf import PDFService
 from apps.exams.models import Exam
 from apps.institution.models import Institution
 
-from .models import ExamAnswer, ExamAttempt
+from . import admission
+from .models import ExamAttempt, ExamStatistics, PerformanceRollup
+from .services.answers import AnswerService
+from .services.exam_state import ExamStateService
+from .services.ranking import RankingService
+from .services.scoring import ScoringService
 
 
 class StudentExamListView(StudentRequiredMixin, View):
@@ -23,87 +32,29 @@ class StudentExamListView(StudentRequiredMixin, View):
     template_name = "attempts/exam_list.html"
 
     def get(self, request):
-        user = request.user
-
-        # Get official exams
-        official_exams = Exam.objects.filter(
-            subject__assigned_class=user.assigned_class,
-            status=Exam.Status.PUBLISHED,
-            is_active=True,
-            exam_type=Exam.ExamType.OFFICIAL,
-        ).select_related("subject", "subject__assigned_class")
-
-        # Get practice exams
-        practice_exams = Exam.objects.filter(
-            subject__assigned_class=user.assigned_class,
-            status=Exam.Status.PUBLISHED,
-            is_active=True,
-            exam_type=Exam.ExamType.PRACTICE,
-        ).select_related("subject", "subject__assigned_class")
-
-        # Get attempts for official exams (only latest)
-        official_attempts = {
-            a.exam_id: a
-            for a in ExamAttempt.objects.filter(
-                student=user, exam__in=official_exams
-            ).order_by("-started_at")
-        }
+        states = ExamStateService.get_student_states(request.user)
 
-        # Get all attempts for practice exams
-        practice_attempts = {}
-        for attempt in ExamAttempt.objects.filter(
-            student=user, exam__in=practice_exams
-        ).order_by("-started_at"):
-            if attempt.exam_id not in practice_attempts:
-                practice_attempts[attempt.exam_id] = []
-            practice_attempts[attempt.exam_id].append(attempt)
-
-        # Categorize official exams
         upcoming_exams = []
         active_exams = []
         past_exams = []
+        practice_active = []
+        practice_available = []
 
-        for exam in official_exams:
-            exam_data = {
-                "exam": exam,
-                "attempt": official_attempts.get(exam.id),
-            }
-            if exam.is_upcoming:
+        for exam_data in states.values():
+            exam = exam_data["exam"]
+            if exam.is_practice:
+                if exam.is_running:
+                    practice_active.append(exam_data)
+                elif not exam.is_upcoming and exam_data["attempt_count"]:
+                    # Past practice exams still available if they've been attempted
+                    practice_available.append(exam_data)
+            elif exam.is_upcoming:
                 upcoming_exams.append(exam_data)
             elif exam.is_running:
                 active_exams.append(exam_data)
             else:
                 past_exams.append(exam_data)
 
-        # Categorize practice exams
-        practice_active = []
-        practice_available = []
-
-        for exam in practice_exams:
-            attempts_list = practice_attempts.get(exam.id, [])
-            # Get the latest attempt (if any)
-            latest_attempt = attempts_list[0] if attempts_list else None
-            # Check if there's an in-progress attempt
-            in_progress_attempt = None
-            for att in attempts_list:
-                if att.status == ExamAttempt.Status.IN_PROGRESS:
-                    in_progress_attempt = att
-                    break
-
-            exam_data = {
-                "exam": exam,
-                "attempt": in_progress_attempt or latest_attempt,
-                "attempts": attempts_list,
-                "attempt_count": len(attempts_list),
-                "has_in_progress": in_progress_attempt is not None,
-            }
-
-            if exam.is_running:
-                practice_active.append(exam_data)
-            elif not exam.is_upcoming and attempts_list:
-                # Past practice exams still available if they've been attempted
-                practice_available.append(exam_data)
-
         return render(
             request,
             self.template_name,
@@ -144,34 +95,25 @@ class StudentStartExamView(StudentRequiredMixin, View):
                 messages.warning(request, "This exam has ended.")
             return redirect("attempts:list")
 
-        # Get all attempts for this exam
-        attempts = ExamAttempt.objects.filter(exam=exam, student=request.user).order_by(
-            "-started_at"
-        )
+        exam_state = ExamStateService.get_student_states(request.user).get(exam.pk)
+        if exam_state is None:
+            # Published after the states were cached and not yet invalidated
+            exam_state = {"attempt_count": 0, "has_in_progress": False}
 
-        # Check for in-progress attempt
-        in_progress = attempts.filter(status=ExamAttempt.Status.IN_PROGRESS).first()
-        if in_progress:
+        if exam_state["has_in_progress"]:
             return redirect("attempts:take", pk=exam.pk)
 
         # For official exams, redirect to result if already completed
-        if not exam.is_practice and attempts.exists():
+        if not exam.is_practice and exam_state["attempt_count"]:
             return redirect("attempts:result", pk=exam.pk)
 
-        # For practice exams, show previous attempt count
+        # For practice exams, show previous attempt count and best score
         context = {
             "exam": exam,
-            "previous_attempts": attempts.count(),
-            "best_score": None,
+            "previous_attempts": exam_state["attempt_count"],
+            "best_score": exam_state.get("best_percentage"),
         }
 
-        # Calculate best score for practice exams
-        if exam.is_practice and attempts.exists():
-            completed = attempts.exclude(status=ExamAttempt.Status.IN_PROGRESS)
-            if completed.exists():
-                best = max(completed, key=lambda a: a.percentage_score)
-                context["best_score"] = best.percentage_score
-
         return render(request, self.template_name, context)
 
     def post(self, request, pk):
@@ -198,18 +140,78 @@ class StudentStartExamView(StudentRequiredMixin, View):
 
         # For official exams, check if already completed
         if not exam.is_practice:
-            existing = ExamAttempt.objects.filter(
-                exam=exam, student=request.user
-            ).first()
+            existing = (
+                ExamAttempt.objects.filter(exam=exam, student=request.user)
+                .started()
+                .first()
+            )
             if existing:
                 messages.info(request, "You have already completed this exam.")
                 return redirect("attempts:result", pk=exam.pk)
 
-        # Create new attempt
-        ExamAttempt.create_attempt(exam, request.user)
+        time_credit = timedelta(0)
+        if admission.is_enabled():
+            # Admit a limited number of starts per second; the rest wait
+            ticket = admission.take_ticket(exam.pk, request.user.pk)
+            admitted, _, _ = admission.get_status(ticket)
+            if not admitted:
+                return redirect("attempts:waiting", pk=exam.pk)
+            # Give the time spent waiting back to the student
+            time_credit = admission.release_ticket(exam.pk, request.user.pk, ticket)
+
+        # Claim a pre-generated attempt or create a new one. The checks above
+        # are only a fast path; a concurrent start returns the same attempt.
+        attempt = ExamAttempt.start_attempt(exam, request.user, time_credit=time_credit)
+        if attempt.status != ExamAttempt.Status.IN_PROGRESS:
+            messages.info(request, "You have already completed this exam.")
+            return redirect("attempts:result", pk=exam.pk)
         return redirect("attempts:take", pk=exam.pk)
 
 
+class StudentWaitingRoomView(StudentRequiredMixin, View):
+    """Waiting page for students queued to start an exam."""
+
+    template_name = "attempts/exam_waiting.html"
+
+    def get(self, request, pk):
+        ticket = admission.get_ticket(pk, request.user.pk)
+        if ticket is None:
+            return redirect("attempts:start", pk=pk)
+
+        exam = get_object_or_404(
+            Exam.objects.only("title", "end_time"), pk=pk, status=Exam.Status.PUBLISHED
+        )
+        admitted, position, wait_seconds = admission.get_status(ticket)
+        return render(
+            request,
+            self.template_name,
+            {
+                "exam": exam,
+                "position": position,
+                "wait_seconds": wait_seconds,
+                "status_url": reverse("attempts:admission_status", args=[pk]),
+            },
+        )
+
+
+class StudentAdmissionStatusView(StudentRequiredMixin, View):
+    """
+    Report a queued student's position for the waiting page to poll.
+
+    Reads only the cache. Students without a ticket are reported as
+    admitted, so the waiting page goes back to the start form.
+    """
+
+    def get(self, request, pk):
+        ticket = admission.get_ticket(pk, request.user.pk)
+        if ticket is None:
+            return JsonResponse({"admitted": True, "position": 0, "wait_seconds": 0})
+        admitted, position, wait_seconds = admission.get_status(ticket)
+        return JsonResponse(
+            {"admitted": admitted, "position": position, "wait_seconds": wait_seconds}
+        )
+
+
 class StudentExamView(StudentRequiredMixin, View):
     """Main exam-taking interface."""
 
@@ -240,18 +242,26 @@ class StudentExamView(StudentRequiredMixin, View):
         if not attempt:
             return redirect("attempts:start", pk=pk)
 
-        if attempt.is_time_expired:
-            attempt.status = ExamAttempt.Status.TIMED_OUT
-            attempt.submitted_at = exam.end_time
-            attempt.save()
-            attempt.calculate_score()
+        # In offline mode the page still loads during the sync grace period,
+        # so the client can sync its queued answers before auto-submitting
+        in_grace = (
+            settings.EXAM_OFFLINE_MODE and timezone.now() <= attempt.sync_deadline
+        )
+        if attempt.is_time_expired and not in_grace:
+            ScoringService.finalize(
+                attempt, ExamAttempt.Status.TIMED_OUT, submitted_at=attempt.ends_at
+            )
             messages.warning(
                 request, "Time expired. Your exam has been auto-submitted."
             )
             return redirect("attempts:result", pk=pk)
 
-        questions_data = attempt.get_all_questions_with_options()
-        time_remaining = (exam.end_time - timezone.now()).total_seconds()
+        if settings.EXAM_ASYNC_ENDPOINTS:
+            autosave_url = reverse("attempts:autosave_async", args=[pk])
+            heartbeat_url = reverse("attempts:heartbeat_async", args=[pk])
+        else:
+            autosave_url = reverse("attempts:autosave", args=[pk])
+            heartbeat_url = None
 
         return render(
             request,
@@ -259,8 +269,13 @@ class StudentExamView(StudentRequiredMixin, View):
             {
                 "exam": exam,
                 "attempt": attempt,
-                "questions_data": questions_data,
-                "time_remaining": max(0, int(time_remaining)),
+                "selected_answers": attempt.get_selected_answers(),
+                # The paper is fetched separately and revalidated by its ETag
+                "paper_url": reverse("attempts:paper", args=[pk]),
+                "time_remaining": attempt.time_remaining,
+                "autosave_url": autosave_url,
+                "heartbeat_url": heartbeat_url,
+                "offline_mode": settings.EXAM_OFFLINE_MODE,
             },
         )
 
@@ -273,61 +288,175 @@ class StudentExamView(StudentRequiredMixin, View):
         if attempt.status != ExamAttempt.Status.IN_PROGRESS:
             return redirect("attempts:result", pk=pk)
 
-        # Save answers - value is now the option ID (integer)
-        for key, value in request.POST.items():
-            if key.startswith("question_") and value:
-                question_id = key.replace("question_", "")
-                try:
-                    option_id = int(value)
-                    ExamAnswer.objects.update_or_create(
-                        attempt=attempt,
-                        question_id=question_id,
-                        defaults={"selected_option_id": option_id},
-                    )
-                except (ValueError, TypeError):
-                    continue
+        # Grade and save all answers in a single bulk upsert
+        saved = AnswerService.save_answers(attempt, request.POST)
 
         if request.headers.get("X-Requested-With") == "XMLHttpRequest":
-            return render(request, self.template_name, {"saved": True})
+            return JsonResponse({"saved": saved})
 
         return redirect("attempts:take", pk=pk)
 
 
+class StudentPaperView(StudentRequiredMixin, View):
+    """
+    JSON endpoint serving an attempt's permuted paper.
+
+    The paper is fixed for the attempt until a question or option is edited,
+    so responses carry a strong ETag and clients revalidating with
+    ``If-None-Match`` get an empty 304 without the paper being rebuilt.
+    """
+
+    def get(self, request, pk):
+        attempt = (
+            ExamAttempt.objects.filter(
+                exam_id=pk,
+                student=request.user,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            )
+            .select_related("exam")
+            .first()
+        )
+        if not attempt:
+            return JsonResponse({"error": "No active exam attempt."}, status=404)
+
+        if attempt.is_time_expired:
+            return JsonResponse({"error": "Exam time has expired."}, status=409)
+
+        etag = quote_etag(attempt.get_paper_etag())
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = JsonResponse({"questions": attempt.get_paper_data()})
+        response["ETag"] = etag
+        # Student-specific, and must be revalidated since papers can change
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+
+class StudentAutosaveView(StudentRequiredMixin, View):
+    """
+    JSON autosave endpoint that accepts only changed answers.
+
+    Expects a body of ``{"seq": <int>, "answers": {"<question_id>": <option_id>}}``
+    where ``seq`` increases with every delta the client sends. Stale or
+    duplicate deltas are dropped and the reply carries the highest applied
+    sequence number so the client can resend anything newer.
+    """
+
+    def post(self, request, pk):
+        try:
+            payload = json.loads(request.body)
+            seq = int(payload["seq"])
+            answers = payload.get("answers", {})
+        except (ValueError, TypeError, KeyError):
+            return JsonResponse({"error": "Invalid autosave payload."}, status=400)
+
+        if seq < 1:
+            return JsonResponse({"error": "Invalid sequence number."}, status=400)
+
+        attempt = (
+            ExamAttempt.objects.filter(
+                exam_id=pk,
+                student=request.user,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            )
+            .select_related("exam")
+            .first()
+        )
+        if not attempt:
+            return JsonResponse({"error": "No active exam attempt."}, status=404)
+
+        if attempt.is_time_expired:
+            return JsonResponse({"error": "Exam time has expired."}, status=409)
+
+        applied, ack, saved = AnswerService.apply_delta(attempt, seq, answers)
+        return JsonResponse({"ack": ack, "applied": applied, "saved": saved})
+
+
+class StudentSyncView(StudentRequiredMixin, View):
+    """
+    Batch sync endpoint for answers queued by the offline exam client.
+
+    Expects ``{"sent_at": <ms>, "answers": [{"seq": <int>, "question": <id>,
+    "option": <id>, "answered_at": <ms>}]}``. Sequence numbers make syncing
+    idempotent, so the client can resend a batch until it is acknowledged.
+    Batches are accepted until the end time plus the sync grace period, but
+    only answers given before the end time are kept.
+    """
+
+    def post(self, request, pk):
+        now = timezone.now()
+        try:
+            entries = AnswerService.parse_batch(json.loads(request.body), now)
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        # Locked so overlapping retries of the same batch apply it once
+        attempt = (
+            ExamAttempt.objects.select_for_update(of=("self",))
+            .select_related("exam")
+            .filter(
+                exam_id=pk,
+                student=request.user,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            )
+            .first()
+        )
+        if not attempt:
+            return JsonResponse({"error": "No active exam attempt."}, status=404)
+
+        if now > attempt.sync_deadline:
+            return JsonResponse({"error": "The sync window has closed."}, status=409)
+
+        ack, saved = AnswerService.apply_batch(attempt, entries, attempt.ends_at)
+        return JsonResponse({"ack": ack, "saved": saved})
+
+
+class ExamServiceWorkerView(View):
+    """
+    Serve the offline exam client's service worker.
+
+    Served from the exams URL prefix rather than as a static file, so that
+    its scope covers the exam pages.
+    """
+
+    def get(self, request):
+        response = render(
+            request,
+            "attempts/service_worker.js",
+            content_type="application/javascript",
+        )
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
 class StudentSubmitExamView(StudentRequiredMixin, View):
     """Submit exam and finalize score."""
 
     def post(self, request, pk):
         exam = get_object_or_404(Exam, pk=pk)
 
-        # Get in-progress attempt
-        attempt = ExamAttempt.objects.filter(
-            exam=exam,
-            student=request.user,
-            status=ExamAttempt.Status.IN_PROGRESS,
-        ).first()
+        # Get in-progress attempt, locked so a double submit waits for this one
+        attempt = (
+            ExamAttempt.objects.select_for_update(of=("self",))
+            .select_related("exam")
+            .filter(
+                exam=exam,
+                student=request.user,
+                status=ExamAttempt.Status.IN_PROGRESS,
+            )
+            .first()
+        )
 
         if not attempt:
             messages.error(request, "No active exam attempt found.")
             return redirect("attempts:list")
 
-        # Save answers - value is now the option ID (integer)
-        for key, value in request.POST.items():
-            if key.startswith("question_") and value:
-                question_id = key.replace("question_", "")
-                try:
-                    option_id = int(value)
-                    ExamAnswer.objects.update_or_create(
-                        attempt=attempt,
-                        question_id=question_id,
-                        defaults={"selected_option_id": option_id},
-                    )
-                except (ValueError, TypeError):
-                    continue
-
-        attempt.status = ExamAttempt.Status.SUBMITTED
-        attempt.submitted_at = timezone.now()
-        attempt.save()
-        attempt.calculate_score()
+        # Grade and save all answers in a single bulk upsert
+        AnswerService.save_answers(attempt, request.POST)
+
+        # Finalize status, submission time and score in one UPDATE
+        ScoringService.finalize(attempt, ExamAttempt.Status.SUBMITTED)
 
         messages.success(request, "Exam submitted successfully!")
         # For practice exams, redirect to the specific attempt result
@@ -378,6 +507,7 @@ class StudentResultView(StudentRequiredMixin, View):
                 "attempt": attempt,
                 "all_attempts": all_attempts,
                 "is_practice": exam.is_practice,
+                "standing": RankingService.get_standing(exam.pk, request.user.pk),
             },
         )
 
@@ -438,109 +568,76 @@ class StudentPerformanceView(StudentRequiredMixin, View):
     """Student performance dashboard with analytics."""
 
     template_name = "attempts/performance.html"
+    # Attempts plotted on the score trend chart
+    trend_length = 50
 
     def get(self, request):
         user = request.user
 
-        # Get all completed attempts for this student
-        attempts = ExamAttempt.objects.filter(
-            student=user,
-            status__in=[ExamAttempt.Status.SUBMITTED, ExamAttempt.Status.TIMED_OUT],
-        ).select_related("exam", "exam__subject")
-
-        # Overall statistics
-        stats = attempts.aggregate(
-            total_exams=Count("id"),
-            avg_score=Avg("score"),
-            max_score=Max("score"),
-            min_score=Min("score"),
-            total_questions=Avg("total_questions"),
+        # Running per-subject totals, maintained as attempts are finalized
+        rollups = list(
+            PerformanceRollup.objects.filter(student=user).select_related(
+                "subject",
+                "best_attempt__exam__subject",
+                "worst_attempt__exam__subject",
+            )
         )
 
-        total_exams = stats["total_exams"] or 0
-        avg_score_raw = stats["avg_score"] or 0
-        avg_total_questions = stats["total_questions"] or 0
-
-        # Calculate average percentage
-        if total_exams > 0 and avg_total_questions > 0:
-            avg_percentage = round((avg_score_raw / avg_total_questions) * 100, 1)
-        else:
-            avg_percentage = 0
+        total_exams = sum(r.attempt_count for r in rollups)
+        score_sum = sum(r.score_sum for r in rollups)
+        total_sum = sum(r.total_sum for r in rollups)
+        avg_percentage = round((score_sum / total_sum) * 100, 1) if total_sum else 0
 
-        # Calculate pass rate (>=50%)
-        passed_count = 0
-        for attempt in attempts:
-            if attempt.percentage_score >= 50:
-                passed_count += 1
+        passed_count = sum(r.pass_count for r in rollups)
         pass_rate = (
             round((passed_count / total_exams) * 100, 1) if total_exams > 0 else 0
         )
 
         # Find highest and lowest scoring exams
-        highest_exam = None
-        lowest_exam = None
-        highest_percentage = 0
-        lowest_percentage = 100
-
-        for attempt in attempts:
-            if attempt.percentage_score >= highest_percentage:
-                highest_percentage = attempt.percentage_score
-                highest_exam = attempt
-            if attempt.percentage_score <= lowest_percentage:
-                lowest_percentage = attempt.percentage_score
-                lowest_exam = attempt
-
-        # Subject-wise breakdown
-        subject_stats = {}
-        for attempt in attempts:
-            subject_name = attempt.exam.subject.name
-            if subject_name not in subject_stats:
-                subject_stats[subject_name] = {
-                    "name": subject_name,
-                    "total_exams": 0,
-                    "total_score": 0,
-                    "total_questions": 0,
-                    "scores": [],
-                }
-            subject_stats[subject_name]["total_exams"] += 1
-            subject_stats[subject_name]["total_score"] += attempt.score or 0
-            subject_stats[subject_name]["total_questions"] += attempt.total_questions
-            subject_stats[subject_name]["scores"].append(attempt.percentage_score)
-
-        # Calculate averages for each subject
-        subject_data = []
-        for name, data in subject_stats.items():
-            if data["total_questions"] > 0:
-                avg_pct = round(
-                    (data["total_score"] / data["total_questions"]) * 100, 1
-                )
-            else:
-                avg_pct = 0
-            subject_data.append(
+        best = [r for r in rollups if r.best_attempt is not None]
+        worst = [r for r in rollups if r.worst_attempt is not None]
+        highest_exam = (
+            max(best, key=lambda r: r.best_percentage).best_attempt if best else None
+        )
+        lowest_exam = (
+            min(worst, key=lambda r: r.worst_percentage).worst_attempt
+            if worst
+            else None
+        )
+
+        # Subject-wise breakdown, sorted by average percentage descending
+        subject_data = sorted(
+            (
                 {
-                    "name": name,
-                    "total_exams": data["total_exams"],
-                    "avg_percentage": avg_pct,
+                    "name": r.subject.name,
+                    "total_exams": r.attempt_count,
+                    "avg_percentage": r.avg_percentage,
                 }
-            )
-
-        # Sort by average percentage descending
-        subject_data.sort(key=lambda x: x["avg_percentage"], reverse=True)
+                for r in rollups
+            ),
+            key=lambda x: x["avg_percentage"],
+            reverse=True,
+        )
 
-        # Recent exam history (last 10)
-        recent_attempts = attempts.order_by("-submitted_at")[:10]
+        # Latest attempts, newest first, for the history table and trend chart
+        latest_attempts = list(
+            ExamAttempt.objects.completed()
+            .filter(student=user)
+            .select_related("exam", "exam__subject")
+            .order_by("-submitted_at")[: self.trend_length]
+        )
+        recent_attempts = latest_attempts[:10]
 
         # Data for charts (JSON)
         # Score trend chart data
-        trend_data = []
-        for attempt in attempts.order_by("submitted_at"):
-            trend_data.append(
-                {
-                    "date": attempt.submitted_at.strftime("%Y-%m-%d"),
-                    "score": attempt.percentage_score,
-                    "exam": attempt.exam.title[:20],
-                }
-            )
+        trend_data = [
+            {
+                "date": attempt.submitted_at.strftime("%Y-%m-%d"),
+                "score": attempt.percentage_score,
+                "exam": attempt.exam.title[:20],
+            }
+            for attempt in reversed(latest_attempts)
+        ]
 
         # Subject comparison chart data
         chart_subjects = [s["name"] for s in subject_data]
@@ -568,15 +665,23 @@ class StudentExamHistoryView(StudentRequiredMixin, View):
 
     template_name = "attempts/exam_history.html"
     paginate_by = 10
+    # Sort option -> (field, descending); ties are broken by primary key
+    sort_fields = {
+        "date_desc": ("submitted_at", True),
+        "date_asc": ("submitted_at", False),
+        "score_desc": ("percentage", True),
+        "score_asc": ("percentage", False),
+    }
 
     def get(self, request):
         user = request.user
 
         # Get all completed attempts for this student
-        attempts = ExamAttempt.objects.filter(
-            student=user,
-            status__in=[ExamAttempt.Status.SUBMITTED, ExamAttempt.Status.TIMED_OUT],
-        ).select_related("exam", "exam__subject")
+        attempts = (
+            ExamAttempt.objects.completed()
+            .filter(student=user)
+            .select_related("exam", "exam__subject")
+        )
 
         # Get unique subjects for filter dropdown
         subjects = (
@@ -601,66 +706,75 @@ class StudentExamHistoryView(StudentRequiredMixin, View):
 
         status_filter = request.GET.get("status")
         if status_filter == "pass":
-            # Filter for passed exams (>=50%)
-            attempt_ids = [a.id for a in attempts if a.percentage_score >= 50]
-            attempts = attempts.filter(id__in=attempt_ids)
+            attempts = attempts.passed()
         elif status_filter == "fail":
-            # Filter for failed exams (<50%)
-            attempt_ids = [a.id for a in attempts if a.percentage_score < 50]
-            attempts = attempts.filter(id__in=attempt_ids)
-
-        # Apply sorting
-        sort_by = request.GET.get("sort", "-submitted_at")
-        if sort_by == "date_asc":
-            attempts = attempts.order_by("submitted_at")
-        elif sort_by == "date_desc":
-            attempts = attempts.order_by("-submitted_at")
-        elif sort_by == "score_asc":
-            # Sort by percentage score (need to calculate)
-            attempts = sorted(attempts, key=lambda a: a.percentage_score)
-        elif sort_by == "score_desc":
-            attempts = sorted(attempts, key=lambda a: a.percentage_score, reverse=True)
-        else:
-            attempts = attempts.order_by("-submitted_at")
-
-        # Handle sorted list vs queryset for pagination
-        if isinstance(attempts, list):
-            total_count = len(attempts)
-            page = int(request.GET.get("page", 1))
-            start = (page - 1) * self.paginate_by
-            end = start + self.paginate_by
-            page_attempts = attempts[start:end]
-            has_previous = page > 1
-            has_next = end < total_count
-            total_pages = (total_count + self.paginate_by - 1) // self.paginate_by
+            attempts = attempts.failed()
+
+        sort_by = request.GET.get("sort")
+        if sort_by not in self.sort_fields:
+            sort_by = "date_desc"
+        field, descending = self.sort_fields[sort_by]
+
+        # Keyset pagination: seek past the first or last row of the page the
+        # student came from, so each page reads only its own rows
+        before = request.GET.get("before", "")
+        cursor = before or request.GET.get("after", "")
+        backwards = bool(before)
+        reverse = descending != backwards
+        page_attempts = attempts
+        if cursor.isdigit():
+            page_attempts = page_attempts.filter(
+                self.seek_filter(attempts, field, int(cursor), reverse)
+            )
+        prefix = "-" if reverse else ""
+        page_attempts = list(
+            page_attempts.order_by(f"{prefix}{field}", f"{prefix}pk")[
+                : self.paginate_by + 1
+            ]
+        )
+        has_more = len(page_attempts) > self.paginate_by
+        page_attempts = page_attempts[: self.paginate_by]
+        if backwards:
+            page_attempts.reverse()
+            has_previous, has_next = has_more, True
         else:
-            total_count = attempts.count()
-            paginator = Paginator(attempts, self.paginate_by)
-            page = request.GET.get("page", 1)
-            page_obj = paginator.get_page(page)
-            page_attempts = page_obj.object_list
-            has_previous = page_obj.has_previous()
-            has_next = page_obj.has_next()
-            page = page_obj.number
-            total_pages = paginator.num_pages
+            has_previous, has_next = bool(cursor), has_more
 
         context = {
             "attempts": page_attempts,
             "subjects": subjects,
-            "total_count": total_count,
-            "current_page": int(page),
-            "total_pages": total_pages,
-            "has_previous": has_previous,
-            "has_next": has_next,
+            "total_count": attempts.count(),
+            "has_previous": has_previous and bool(page_attempts),
+            "has_next": has_next and bool(page_attempts),
+            "previous_query": self.page_query(request, "before", page_attempts, 0),
+            "next_query": self.page_query(request, "after", page_attempts, -1),
             "selected_subject": subject_filter,
             "selected_status": status_filter,
-            "selected_sort": sort_by if sort_by else "-submitted_at",
+            "selected_sort": sort_by,
             "date_from": date_from,
             "date_to": date_to,
         }
 
         return render(request, self.template_name, context)
 
+    @staticmethod
+    def seek_filter(attempts, field, cursor, descending):
+        """Filter to attempts after the cursor attempt in the sort order."""
+        value = Subquery(attempts.filter(pk=cursor).values(field)[:1])
+        op = "lt" if descending else "gt"
+        return Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"pk__{op}": cursor})
+
+    @staticmethod
+    def page_query(request, direction, page_attempts, index):
+        """Build the query string for the page before or after this one."""
+        if not page_attempts:
+            return ""
+        params = request.GET.copy()
+        for key in ("page", "before", "after"):
+            params.pop(key, None)
+        params[direction] = page_attempts[index].pk
+        return params.urlencode()
+
 
 class TeacherResultsListView(ResultsViewerRequiredMixin, View):
     """List exam results for teacher's assigned subjects."""
@@ -695,8 +809,12 @@ class TeacherResultsListView(ResultsViewerRequiredMixin, View):
 
         # Filter by exam if provided
         exam_id = request.GET.get("exam")
+        statistics = None
         if exam_id:
             attempts = attempts.filter(exam_id=exam_id)
+            statistics = ExamStatistics.objects.filter(
+                exam__in=exams, exam_id=exam_id
+            ).first()
 
         # Filter by class if provided
         class_id = request.GET.get("class")
@@ -711,6 +829,12 @@ class TeacherResultsListView(ResultsViewerRequiredMixin, View):
         page_number = request.GET.get("page")
         page_obj = paginator.get_page(page_number)
 
+        # Rank each student's best attempt within its exam
+        page_obj.object_list = list(page_obj.object_list)
+        standings = RankingService.get_attempt_standings(page_obj.object_list)
+        for attempt in page_obj.object_list:
+            attempt.standing = standings.get(attempt.pk)
+
         context = {
             "page_obj": page_obj,
             "exams": exams.select_related("subject"),
@@ -718,6 +842,7 @@ class TeacherResultsListView(ResultsViewerRequiredMixin, View):
             "selected_exam": exam_id,
             "selected_class": class_id,
             "total_results": attempts.count(),
+            "statistics": statistics,
         }
         return render(request, self.template_name, context)
 
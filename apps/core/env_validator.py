@@ -23,6 +23,7 @@ class EnvironmentValidator:
         self._validate_database()
         self._validate_email()
         self._validate_logging()
+        self._validate_answer_buffer()
         self._validate_production_security()
 
         # Log warnings
@@ -80,6 +81,19 @@ class EnvironmentValidator:
                 f"LOG_LEVEL must be one of {self.VALID_LOG_LEVELS}, got: {log_level}"
             )
 
+    def _validate_answer_buffer(self):
+        if not getattr(settings, "EXAM_ANSWER_WRITE_BEHIND", False):
+            return
+        from apps.attempts.buffer import get_buffer_durability
+
+        level, detail = get_buffer_durability()
+        if level != "shared":
+            self.errors.append(
+                f"EXAM_ANSWER_WRITE_BEHIND requires a shared cache, but {detail}"
+            )
+        if getattr(settings, "EXAM_ANSWER_FLUSH_INTERVAL", 0) < 1:
+            self.errors.append("EXAM_ANSWER_FLUSH_INTERVAL must be at least 1 second")
+
     def _validate_production_security(self):
         """Validate security settings for production (DEBUG=False)."""
         if settings.DEBUG:
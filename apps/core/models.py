@@ -9,3 +9,62 @@ class TimestampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class FieldTrackerMixin(models.Model):
+    """
+    Abstract mixin that tracks changes to selected fields without a query.
+
+    List field attribute names (``status``, ``subject_id``...) in
+    ``tracked_fields``. Their values are snapshotted when the instance is
+    loaded from the database and again after every save, so ``pre_save`` and
+    ``post_save`` handlers can compare against the stored values instead of
+    re-fetching the row.
+    """
+
+    tracked_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot_tracked_fields()
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._snapshot_tracked_fields()
+
+    def _snapshot_tracked_fields(self):
+        # Deferred fields are not loaded, so their stored value is unknown
+        self._tracked_values = {
+            field: self.__dict__[field]
+            for field in self.tracked_fields
+            if field in self.__dict__
+        }
+
+    def previous(self, field):
+        """
+        Return the stored value of a tracked field.
+
+        Returns None for unsaved instances and for fields that were
+        deferred when the instance was loaded.
+        """
+        return getattr(self, "_tracked_values", {}).get(field)
+
+    def has_changed(self, field):
+        """
+        Check whether a tracked field differs from its stored value.
+
+        Always True for unsaved instances and for deferred fields.
+        """
+        tracked_values = getattr(self, "_tracked_values", {})
+        if field not in tracked_values:
+            return True
+        return tracked_values[field] != getattr(self, field)
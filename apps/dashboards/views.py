@@ -36,33 +36,13 @@ class DashboardView(LoginRequiredMixin, View):
         return render(request, self.get_template(user), context)
 
     def get_student_context(self, user):
-        from apps.attempts.models import ExamAttempt
-        from apps.exams.models import Exam
-
-        if not user.assigned_class:
-            return {
-                "active_exam_count": 0,
-                "total_exam_count": 0,
-                "completed_exam_count": 0,
-            }
-
-        exams = Exam.objects.filter(
-            subject__assigned_class=user.assigned_class,
-            status=Exam.Status.PUBLISHED,
-            is_active=True,
-        ).select_related("subject")
-
-        attempts = ExamAttempt.objects.filter(
-            student=user,
-            status=ExamAttempt.Status.SUBMITTED,
-        )
-
-        active_count = sum(1 for e in exams if e.is_running)
+        from apps.attempts.services.exam_state import ExamStateService
 
+        states = ExamStateService.get_student_states(user).values()
         return {
-            "active_exam_count": active_count,
-            "total_exam_count": exams.count(),
-            "completed_exam_count": attempts.count(),
+            "active_exam_count": sum(1 for s in states if s["exam"].is_running),
+            "total_exam_count": len(states),
+            "completed_exam_count": sum(s["submitted_count"] for s in states),
         }
 
     def get_teacher_context(self, user):
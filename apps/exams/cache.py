@@ -0,0 +1,188 @@
+"""Exam paper snapshot caching for the exam-taking hot path."""
+
+import time
+
+from django.core.cache import cache
+
+PAPER_SNAPSHOT_VERSION_KEY = "exam_paper_version_{exam_id}"
+PAPER_SNAPSHOT_CACHE_KEY = "exam_paper_{exam_id}_{version}"
+PAPER_SNAPSHOT_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+CURRENT_PAPER_CACHE_KEY = "exam_current_paper_{exam_id}_{version}"
+PAPER_STRUCTURE_CACHE_KEY = "exam_paper_structure_{paper_id}"
+
+
+def serialize_questions(question_ids):
+    """
+    Serialize questions and their options into plain dicts.
+
+    Returns a mapping of question ID to
+    ``{"id", "question_text", "options": {option_id: text}}``, with options
+    in database order. Uses two queries regardless of the number of
+    questions.
+    """
+    from apps.questions.models import Question
+
+    questions = Question.objects.filter(id__in=question_ids).prefetch_related("options")
+    return {
+        q.id: {
+            "id": q.id,
+            "question_text": q.question_text,
+            "options": {opt.id: opt.text for opt in q.options.all()},
+        }
+        for q in questions
+    }
+
+
+def get_paper_version(exam_id):
+    """Return the current snapshot version token for an exam."""
+    key = PAPER_SNAPSHOT_VERSION_KEY.format(exam_id=exam_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def get_paper_snapshot(exam):
+    """
+    Get the frozen question/option snapshot for a manually-assembled exam.
+
+    The snapshot is built once per version and shared by every attempt, so
+    rendering a paper needs no question or option queries on a cache hit.
+    Exams that draw random questions from the subject bank have no shared
+    paper and return None.
+    """
+    if exam.use_random_questions:
+        return None
+
+    version = get_paper_version(exam.pk)
+    key = PAPER_SNAPSHOT_CACHE_KEY.format(exam_id=exam.pk, version=version)
+    snapshot = cache.get(key)
+
+    if snapshot is None:
+        question_ids = exam.exam_questions.values_list("question_id", flat=True)
+        snapshot = {
+            "version": version,
+            "questions": serialize_questions(list(question_ids)),
+        }
+        cache.set(key, snapshot, PAPER_SNAPSHOT_CACHE_TIMEOUT)
+
+    return snapshot
+
+
+def get_paper(paper_id):
+    """
+    Get an ExamPaper by ID with caching.
+
+    Papers are immutable, so they are cached without expiry.
+    """
+    from apps.exams.models import ExamPaper
+
+    key = PAPER_STRUCTURE_CACHE_KEY.format(paper_id=paper_id)
+    paper = cache.get(key)
+    if paper is None:
+        paper = ExamPaper.objects.get(pk=paper_id)
+        cache.set(key, paper, None)
+    return paper
+
+
+def get_current_paper(exam):
+    """
+    Get the exam's current ExamPaper, freezing a new one if needed.
+
+    The pointer to the current paper shares the snapshot version token, so
+    anything that invalidates the snapshot also forces a re-check.
+    """
+    from apps.exams.models import ExamPaper
+
+    version = get_paper_version(exam.pk)
+    key = CURRENT_PAPER_CACHE_KEY.format(exam_id=exam.pk, version=version)
+    paper_id = cache.get(key)
+    if paper_id is not None:
+        return get_paper(paper_id)
+
+    paper = ExamPaper.objects.filter(exam=exam, is_current=True).order_by("-pk").first()
+    if paper is None:
+        paper = ExamPaper.freeze(exam)
+    cache.set(PAPER_STRUCTURE_CACHE_KEY.format(paper_id=paper.pk), paper, None)
+    cache.set(key, paper.pk, PAPER_SNAPSHOT_CACHE_TIMEOUT)
+    return paper
+
+
+def retire_current_paper(exam_id):
+    """
+    Retire the exam's current paper after its question set changed.
+
+    Started attempts keep referencing the retired paper; the next attempt
+    freezes a new one. Pre-generated attempts that nobody has started yet
+    are deleted, so students are not handed a paper built from the old
+    questions. Also invalidates the rendering snapshot.
+    """
+    from apps.attempts.models import ExamAttempt
+    from apps.exams.models import ExamPaper
+
+    ExamPaper.objects.filter(exam_id=exam_id, is_current=True).update(is_current=False)
+    ExamAttempt.objects.filter(exam_id=exam_id).pending().delete()
+    invalidate_paper_snapshot(exam_id)
+
+
+def retire_random_papers_for_subject(subject_id):
+    """Retire current papers of random-question exams drawing from a subject."""
+    from apps.exams.models import Exam
+
+    exam_ids = Exam.objects.filter(
+        subject_id=subject_id, use_random_questions=True
+    ).values_list("id", flat=True)
+    for exam_id in exam_ids:
+        retire_current_paper(exam_id)
+
+
+def retire_papers_for_question(question_id, subject_id):
+    """
+    Retire current papers that include a question's options.
+
+    Covers manual exams that include the question and random-question exams
+    drawing from its subject's bank.
+    """
+    from apps.exams.models import ExamQuestion
+
+    exam_ids = ExamQuestion.objects.filter(question_id=question_id).values_list(
+        "exam_id", flat=True
+    )
+    for exam_id in exam_ids:
+        retire_current_paper(exam_id)
+    retire_random_papers_for_subject(subject_id)
+
+
+def invalidate_paper_snapshot(exam_id):
+    """
+    Invalidate an exam's paper snapshot.
+
+    A fresh version token is issued rather than deleting the snapshot, so a
+    snapshot built concurrently from stale data is never served.
+    """
+    cache.set(PAPER_SNAPSHOT_VERSION_KEY.format(exam_id=exam_id), time.time_ns(), None)
+
+
+def invalidate_paper_snapshots_for_question(question_id, subject_id=None):
+    """
+    Invalidate the snapshot of every exam that includes a question.
+
+    If ``subject_id`` is given, random-question exams drawing from that
+    subject are invalidated too, since their papers may include it.
+    """
+    from apps.exams.models import Exam, ExamQuestion
+
+    exam_ids = set(
+        ExamQuestion.objects.filter(question_id=question_id).values_list(
+            "exam_id", flat=True
+        )
+    )
+    if subject_id is not None:
+        exam_ids.update(
+            Exam.objects.filter(
+                subject_id=subject_id, use_random_questions=True
+            ).values_list("id", flat=True)
+        )
+    for exam_id in exam_ids:
+        invalidate_paper_snapshot(exam_id)
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exams", "0005_add_exam_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExamPaper",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("question_ids", models.JSONField(default=list)),
+                ("option_ids", models.JSONField(default=dict)),
+                ("sample_size", models.PositiveIntegerField(default=0)),
+                ("is_current", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "exam",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="papers",
+                        to="exams.exam",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Paper",
+                "verbose_name_plural": "Exam Papers",
+                "db_table": "exam_papers",
+                "indexes": [
+                    models.Index(
+                        fields=["exam", "is_current"], name="exam_papers_current_idx"
+                    )
+                ],
+            },
+        ),
+    ]
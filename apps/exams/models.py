@@ -2,10 +2,12 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from apps.core.models import FieldTrackerMixin
+
 from .managers import ExamManager
 
 
-class Exam(models.Model):
+class Exam(FieldTrackerMixin, models.Model):
     """Exam definition created by Admin/Examiner."""
 
     class Status(models.TextChoices):
@@ -60,6 +62,13 @@ class Exam(models.Model):
 
     objects = ExamManager()
 
+    tracked_fields = (
+        "status",
+        "subject_id",
+        "use_random_questions",
+        "random_question_count",
+    )
+
     class Meta:
         db_table = "exams"
         verbose_name = "Exam"
@@ -137,20 +146,18 @@ class Exam(models.Model):
             return "Running"
         return "Ended"
 
-    def get_questions(self):
+    def get_paper_question_ids(self):
         """
-        Get questions for this exam.
+        Get the IDs of every question an attempt's paper can draw from.
 
-        If using random questions, returns random selection from subject bank.
-        If using manual selection, returns assigned questions.
+        For random selection this is the subject's whole active bank, read
+        from the cache; for manual selection it is the assigned questions.
         """
         if self.use_random_questions:
             from apps.questions.models import Question
 
-            return Question.get_random_questions(
-                self.subject, self.random_question_count or 10
-            )
-        return [eq.question for eq in self.exam_questions.select_related("question")]
+            return Question.get_bank_question_ids(self.subject_id)
+        return list(self.exam_questions.values_list("question_id", flat=True))
 
     def get_question_count(self):
         """Return the number of questions in this exam."""
@@ -187,3 +194,64 @@ class ExamQuestion(models.Model):
 
     def __str__(self):
         return f"{self.exam.title} - Q{self.order + 1}"
+
+
+class ExamPaper(models.Model):
+    """
+    Immutable structure of an exam paper shared by many attempts.
+
+    Holds the canonical (sorted) question and option IDs that attempts
+    permute with their own shuffle seed. For random-question exams the paper
+    is the subject's active question bank at freeze time and each attempt
+    draws ``sample_size`` questions from it. A paper is never modified;
+    when the exam's questions change a new paper becomes current.
+    """
+
+    exam = models.ForeignKey(
+        Exam,
+        on_delete=models.CASCADE,
+        related_name="papers",
+    )
+    question_ids = models.JSONField(default=list)
+    option_ids = models.JSONField(default=dict)
+    sample_size = models.PositiveIntegerField(default=0)
+    is_current = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "exam_papers"
+        verbose_name = "Exam Paper"
+        verbose_name_plural = "Exam Papers"
+        indexes = [
+            models.Index(fields=["exam", "is_current"], name="exam_papers_current_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.exam.title} - Paper {self.pk}"
+
+    @classmethod
+    def freeze(cls, exam):
+        """Create a new current paper from the exam's questions and options."""
+        from apps.questions.models import QuestionOption
+
+        question_ids = sorted(set(exam.get_paper_question_ids()))
+        option_ids = {str(question_id): [] for question_id in question_ids}
+        option_rows = (
+            QuestionOption.objects.filter(question_id__in=question_ids)
+            .order_by("id")
+            .values_list("question_id", "id")
+        )
+        for question_id, option_id in option_rows:
+            option_ids[str(question_id)].append(option_id)
+
+        if exam.use_random_questions:
+            sample_size = min(exam.random_question_count or 10, len(question_ids))
+        else:
+            sample_size = len(question_ids)
+
+        return cls.objects.create(
+            exam=exam,
+            question_ids=question_ids,
+            option_ids=option_ids,
+            sample_size=sample_size,
+        )
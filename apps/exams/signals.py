@@ -1,25 +1,32 @@
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from apps.exams.models import Exam
+from apps.exams.cache import (
+    get_paper_snapshot,
+    invalidate_paper_snapshots_for_question,
+    retire_current_paper,
+    retire_papers_for_question,
+    retire_random_papers_for_subject,
+)
+from apps.exams.models import Exam, ExamQuestion
+from apps.questions.models import Question, QuestionOption
 
 logger = logging.getLogger(__name__)
 
 
-# Store old status before save to detect status change
-@receiver(pre_save, sender=Exam)
-def store_old_status(sender, instance, **kwargs):
-    """Store the old status before saving to detect status changes."""
-    if instance.pk:
-        try:
-            old_instance = Exam.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.status
-        except Exam.DoesNotExist:
-            instance._old_status = None
-    else:
-        instance._old_status = None
+def _was_just_published(instance, created):
+    """
+    Check whether a save published the exam.
+
+    True if the exam was just created with published status, or its status
+    changed from draft to published.
+    """
+    status_just_published = created or instance.has_changed("status")
+    return instance.status == Exam.Status.PUBLISHED and status_just_published
 
 
 @receiver(post_save, sender=Exam)
@@ -27,16 +34,105 @@ def notify_exam_published(sender, instance, created, **kwargs):
     """Send notification when an exam is published."""
     from apps.core.services.notification import NotificationService
 
-    old_status = getattr(instance, "_old_status", None)
-
-    # Only notify if:
-    # 1. Exam was just created with published status, or
-    # 2. Exam status changed from draft to published
-    status_just_published = created or (
-        old_status and old_status != Exam.Status.PUBLISHED
-    )
-    if instance.status == Exam.Status.PUBLISHED and status_just_published:
+    if _was_just_published(instance, created):
         try:
             NotificationService.notify_exam_published(instance)
         except Exception as e:
             logger.error(f"Failed to send exam published notifications: {e}")
+
+
+@receiver(post_save, sender=Exam)
+def refresh_paper_snapshot(sender, instance, created, **kwargs):
+    """
+    Retire the current paper when the exam's question selection changes.
+
+    Manual question sets are handled by the ExamQuestion signals; here only
+    the subject and the random-question settings affect the paper. The
+    snapshot is pre-built for published exams either way.
+    """
+    if created:
+        return
+    if any(
+        instance.has_changed(field)
+        for field in ("subject_id", "use_random_questions", "random_question_count")
+    ):
+        retire_current_paper(instance.pk)
+    if instance.status == Exam.Status.PUBLISHED and instance.is_active:
+        get_paper_snapshot(instance)
+
+
+@receiver(post_save, sender=Exam)
+def pregenerate_attempts_on_publish(sender, instance, created, **kwargs):
+    """Pre-generate attempts for the class when enabled in settings."""
+    from apps.attempts.models import ExamAttempt
+
+    if not settings.EXAM_PREGENERATE_ON_PUBLISH:
+        return
+    if instance.is_active and _was_just_published(instance, created):
+        try:
+            with transaction.atomic():
+                ExamAttempt.pregenerate_attempts(instance)
+        except Exception as e:
+            logger.error(f"Failed to pre-generate attempts for exam {instance.pk}: {e}")
+
+
+@receiver(post_save, sender=ExamQuestion)
+@receiver(post_delete, sender=ExamQuestion)
+def invalidate_snapshot_on_exam_question_change(sender, instance, **kwargs):
+    """Retire the current paper when the exam's question set changes."""
+    retire_current_paper(instance.exam_id)
+
+
+@receiver(post_save, sender=Question)
+def invalidate_snapshot_on_question_change(sender, instance, created, **kwargs):
+    """
+    Invalidate snapshots of exams using a question when it is edited.
+
+    Text and answer-key edits only need fresh snapshots. Random-question
+    papers are retired when the subject's bank gains or loses the question:
+    on creation, (de)activation or a move between subjects.
+    """
+    if not created:
+        invalidate_paper_snapshots_for_question(instance.pk, instance.subject_id)
+    if not (
+        created
+        or instance.has_changed("is_active")
+        or instance.has_changed("subject_id")
+    ):
+        return
+    retire_random_papers_for_subject(instance.subject_id)
+    previous_subject_id = instance.previous("subject_id")
+    if previous_subject_id and previous_subject_id != instance.subject_id:
+        retire_random_papers_for_subject(previous_subject_id)
+
+
+@receiver(post_delete, sender=Question)
+def retire_papers_on_question_delete(sender, instance, **kwargs):
+    """Retire random-question papers drawing from the question's subject."""
+    retire_random_papers_for_subject(instance.subject_id)
+
+
+@receiver(post_save, sender=QuestionOption)
+def invalidate_snapshot_on_option_change(sender, instance, created, **kwargs):
+    """Update papers and snapshots of exams using a question when its options change."""
+    if created:
+        retire_papers_for_question(instance.question_id, instance.question.subject_id)
+    else:
+        invalidate_paper_snapshots_for_question(
+            instance.question_id, instance.question.subject_id
+        )
+
+
+@receiver(post_delete, sender=QuestionOption)
+def retire_papers_on_option_delete(sender, instance, **kwargs):
+    """Retire papers of exams using a question when one of its options is removed."""
+    subject_id = (
+        Question.objects.filter(pk=instance.question_id)
+        .values_list("subject_id", flat=True)
+        .first()
+    )
+    if subject_id is None:
+        # The question itself is being deleted
+        invalidate_paper_snapshots_for_question(instance.question_id)
+        return
+    retire_papers_for_question(instance.question_id, subject_id)
@@ -4,6 +4,8 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 
 from apps.academic.models import Subject
+from apps.attempts.models import ExamStatistics
+from apps.attempts.services.item_analysis import ItemAnalysisService
 from apps.core.mixins import ExamViewerRequiredMixin, QuestionManagerRequiredMixin
 from apps.questions.models import Question
 
@@ -121,6 +123,9 @@ class ExamDetailView(ExamViewerRequiredMixin, View):
             "exam": exam,
             "available_questions": available_questions,
             "can_manage": user.is_admin or user.is_examiner,
+            "item_analysis_available": ItemAnalysisService.is_available(),
+            "item_analysis": ItemAnalysisService.get_analysis(exam),
+            "statistics": ExamStatistics.objects.filter(exam=exam).first(),
         }
         return render(request, self.template_name, context)
 
@@ -1,4 +1,5 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db import transaction
 
 from .models import Question, QuestionOption
 
@@ -24,6 +25,7 @@ class QuestionAdmin(admin.ModelAdmin):
     search_fields = ["question_text"]
     inlines = [QuestionOptionInline]
     raw_id_fields = ["correct_option", "subject", "created_by", "updated_by"]
+    actions = ["regrade_answers"]
 
     def question_text_short(self, obj):
         return (
@@ -45,6 +47,33 @@ class QuestionAdmin(admin.ModelAdmin):
 
     correct_option_text.short_description = "Correct Answer"
 
+    @transaction.non_atomic_requests
+    def changelist_view(self, request, extra_context=None):
+        # Run actions outside ATOMIC_REQUESTS: a regrade commits batch by
+        # batch instead of holding every row it touches in one transaction.
+        # list_editable saves are still wrapped in their own transaction.
+        return super().changelist_view(request, extra_context)
+
+    @admin.action(description="Regrade answers to selected questions")
+    def regrade_answers(self, request, queryset):
+        """
+        Regrade the selected questions in batches.
+
+        Large regrades are better run with the ``regrade_answers``
+        management command, which reports progress.
+        """
+        from apps.attempts.services.regrade import RegradeService
+
+        run = RegradeService.regrade_questions(
+            queryset.values_list("id", flat=True), user=request.user
+        )
+        self.message_user(
+            request,
+            f"Regrade complete: {run.answers_changed} of {run.answers_checked} "
+            f"answers changed, {run.attempts_rescored} attempts rescored.",
+            messages.SUCCESS,
+        )
+
 
 @admin.register(QuestionOption)
 class QuestionOptionAdmin(admin.ModelAdmin):
@@ -5,3 +5,6 @@ class QuestionsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.questions"
     verbose_name = "Question Bank"
+
+    def ready(self):
+        import apps.questions.signals  # noqa: F401
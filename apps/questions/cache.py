@@ -0,0 +1,78 @@
+"""Question bank caching utilities for random sampling and grading."""
+
+import time
+
+from django.core.cache import cache
+
+ACTIVE_IDS_VERSION_KEY = "question_bank_version_{subject_id}"
+ACTIVE_IDS_CACHE_KEY = "question_bank_ids_{subject_id}_{version}"
+ACTIVE_IDS_CACHE_TIMEOUT = 60 * 60  # 1 hour
+ANSWER_KEY_CACHE_KEY = "question_answer_key_{subject_id}_{version}"
+ANSWER_KEY_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+
+
+def _get_bank_version(subject_id):
+    """Return the current question bank version token for a subject."""
+    key = ACTIVE_IDS_VERSION_KEY.format(subject_id=subject_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def get_active_question_ids(subject_id):
+    """
+    Get the IDs of a subject's active questions with caching.
+
+    Only the primary keys are read, using the (subject, is_active) index,
+    so the bank can be sampled without loading any question rows.
+    """
+    from apps.questions.models import Question
+
+    version = _get_bank_version(subject_id)
+    key = ACTIVE_IDS_CACHE_KEY.format(subject_id=subject_id, version=version)
+    question_ids = cache.get(key)
+
+    if question_ids is None:
+        question_ids = list(
+            Question.objects.filter(subject_id=subject_id, is_active=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        cache.set(key, question_ids, ACTIVE_IDS_CACHE_TIMEOUT)
+
+    return question_ids
+
+
+def get_answer_key(subject_id):
+    """
+    Get a subject's answer key with caching.
+
+    Maps every question of the subject (active or not) to its correct
+    option ID, so grading an answer is a dict lookup. The key shares the
+    bank version token and is rebuilt after any question edit, including
+    a change of correct option.
+    """
+    from apps.questions.models import Question
+
+    version = _get_bank_version(subject_id)
+    key = ANSWER_KEY_CACHE_KEY.format(subject_id=subject_id, version=version)
+    answer_key = cache.get(key)
+
+    if answer_key is None:
+        answer_key = dict(
+            Question.objects.filter(subject_id=subject_id).values_list(
+                "id", "correct_option_id"
+            )
+        )
+        cache.set(key, answer_key, ANSWER_KEY_CACHE_TIMEOUT)
+
+    return answer_key
+
+
+def invalidate_active_question_ids(subject_id):
+    """Invalidate the cached active question IDs and answer key for a subject."""
+    cache.set(
+        ACTIVE_IDS_VERSION_KEY.format(subject_id=subject_id), time.time_ns(), None
+    )
@@ -3,7 +3,7 @@ import secrets
 from django.conf import settings
 from django.db import models
 
-from apps.core.models import TimestampedModel
+from apps.core.models import FieldTrackerMixin, TimestampedModel
 
 from .managers import QuestionManager
 
@@ -34,7 +34,7 @@ class QuestionOption(TimestampedModel):
         return self.text[:50]
 
 
-class Question(TimestampedModel):
+class Question(FieldTrackerMixin, TimestampedModel):
     """MCQ Question for the question bank."""
 
     # Core fields
@@ -71,6 +71,8 @@ class Question(TimestampedModel):
 
     objects = QuestionManager()
 
+    tracked_fields = ("subject_id", "is_active")
+
     class Meta:
         db_table = "questions"
         verbose_name = "Question"
@@ -136,29 +138,25 @@ class Question(TimestampedModel):
         return result
 
     @staticmethod
-    def get_random_questions(subject, count):
+    def get_bank_question_ids(subject_id):
         """
-        Get random questions from a subject for exam generation.
+        Get the IDs of a subject's active questions for freezing exam papers.
+
+        Reads the cached bank, which the question signals refresh on every
+        change, and checks its size with a single count query so a bank
+        left stale by a bulk update is rebuilt instead of frozen.
 
         Args:
-            subject: The Subject instance to get questions from
-            count: Number of questions to select
+            subject_id: ID of the Subject whose bank to read
 
         Returns:
-            QuerySet of randomly selected questions
+            List of active question IDs in ID order
         """
-        all_questions = list(Question.objects.filter(subject=subject, is_active=True))
-
-        if len(all_questions) <= count:
-            return all_questions
-
-        # Cryptographically secure random selection
-        selected = []
-        temp_questions = all_questions.copy()
-        for _ in range(count):
-            if not temp_questions:
-                break
-            index = secrets.randbelow(len(temp_questions))
-            selected.append(temp_questions.pop(index))
-
-        return selected
+        from .cache import get_active_question_ids, invalidate_active_question_ids
+
+        bank = get_active_question_ids(subject_id)
+        active = Question.objects.filter(subject_id=subject_id, is_active=True)
+        if len(bank) != active.count():
+            invalidate_active_question_ids(subject_id)
+            bank = get_active_question_ids(subject_id)
+        return bank
@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.questions.cache import invalidate_active_question_ids
+from apps.questions.models import Question, QuestionOption
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_question_bank(sender, instance, **kwargs):
+    """
+    Invalidate the subject's cached active question IDs and answer key.
+
+    Covers creation, deactivation, correct-option changes and moves between
+    subjects, where the previous subject is invalidated too.
+    """
+    invalidate_active_question_ids(instance.subject_id)
+    previous_subject_id = instance.previous("subject_id")
+    if previous_subject_id and previous_subject_id != instance.subject_id:
+        invalidate_active_question_ids(previous_subject_id)
+
+
+@receiver(post_delete, sender=QuestionOption)
+def invalidate_answer_key_on_option_delete(sender, instance, **kwargs):
+    """
+    Invalidate the subject's answer key when an option is deleted.
+
+    Deleting the correct option clears ``correct_option`` in SQL without
+    saving the question, so the question's post_save never runs.
+    """
+    subject_id = (
+        Question.objects.filter(pk=instance.question_id)
+        .values_list("subject_id", flat=True)
+        .first()
+    )
+    if subject_id is not None:
+        invalidate_active_question_ids(subject_id)
@@ -3,10 +3,12 @@ from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from apps.core.models import FieldTrackerMixin
+
 from .managers import UserManager
 
 
-class User(AbstractUser):
+class User(FieldTrackerMixin, AbstractUser):
     """Custom user model with roles."""
 
     class Role(models.TextChoices):
@@ -38,6 +40,8 @@ class User(AbstractUser):
 
     objects = UserManager()
 
+    tracked_fields = ("assigned_class_id", "is_active")
+
     class Meta:
         db_table = "users"
         verbose_name = "User"
@@ -258,3 +258,36 @@ CACHES = {
         },
     }
 }
+
+# Pre-generate randomized attempts for the whole class when an exam is
+# published, instead of on each student's start (see pregenerate_attempts).
+EXAM_PREGENERATE_ON_PUBLISH = config(
+    "EXAM_PREGENERATE_ON_PUBLISH", default=False, cast=bool
+)
+
+# Buffer autosaved answers in the cache and persist them in bulk (see
+# flush_answer_buffer). Answers are always flushed on submit and timeout.
+EXAM_ANSWER_WRITE_BEHIND = config("EXAM_ANSWER_WRITE_BEHIND", default=False, cast=bool)
+EXAM_ANSWER_FLUSH_INTERVAL = config("EXAM_ANSWER_FLUSH_INTERVAL", default=10, cast=int)
+
+# Append answers to an insert-only journal (AnswerEvent) instead of updating
+# answer rows in place. Answers are materialized on submit/timeout and by
+# compact_answer_journal; the journal keeps the full history for replay.
+EXAM_ANSWER_JOURNAL = config("EXAM_ANSWER_JOURNAL", default=False, cast=bool)
+
+# Admit at most EXAM_ADMISSION_RATE exam starts per second (after a burst of
+# EXAM_ADMISSION_BURST, defaulting to the rate); other students wait in a
+# queue and get the waiting time back. 0 disables admission control.
+EXAM_ADMISSION_RATE = config("EXAM_ADMISSION_RATE", default=0, cast=float)
+EXAM_ADMISSION_BURST = config("EXAM_ADMISSION_BURST", default=0, cast=int)
+
+# Point the exam page at the async autosave and time-sync endpoints. Enable
+# when serving with an ASGI server (see config/asgi.py).
+EXAM_ASYNC_ENDPOINTS = config("EXAM_ASYNC_ENDPOINTS", default=False, cast=bool)
+
+# Offline-tolerant exam page: a service worker caches the paper and answers
+# are queued in the browser and synced in batches. Syncs are accepted until
+# EXAM_SYNC_GRACE_PERIOD seconds after the end time, and expired attempts are
+# only timed out once the grace period has passed.
+EXAM_OFFLINE_MODE = config("EXAM_OFFLINE_MODE", default=False, cast=bool)
+EXAM_SYNC_GRACE_PERIOD = config("EXAM_SYNC_GRACE_PERIOD", default=120, cast=int)
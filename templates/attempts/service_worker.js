@@ -0,0 +1,58 @@
+// Service worker for the offline-tolerant exam page.
+//
+// Exam pages and papers are fetched network-first and kept in a cache, so a
+// reload during a network blip is served locally instead of failing (or
+// piling more requests onto the server). Answers never pass through here;
+// the page queues them in IndexedDB and syncs them itself.
+
+const CACHE_NAME = 'examcore-exam-v1';
+const NETWORK_TIMEOUT = 4000;
+const EXAM_PATH = new RegExp('^' + new URL(self.registration.scope).pathname + '\\d+/(take|paper)/$');
+
+self.addEventListener('install', () => self.skipWaiting());
+
+self.addEventListener('activate', event => {
+  event.waitUntil(
+    caches.keys()
+      .then(names => Promise.all(names.filter(name => name !== CACHE_NAME).map(name => caches.delete(name))))
+      .then(() => self.clients.claim())
+  );
+});
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  if (request.method !== 'GET' || !EXAM_PATH.test(new URL(request.url).pathname)) {
+    return;
+  }
+  event.respondWith(networkFirst(request));
+});
+
+function withTimeout(promise, ms) {
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(() => reject(new Error('timeout')), ms);
+    promise.then(
+      value => { clearTimeout(timer); resolve(value); },
+      error => { clearTimeout(timer); reject(error); }
+    );
+  });
+}
+
+async function networkFirst(request) {
+  const cache = await caches.open(CACHE_NAME);
+  try {
+    const response = await withTimeout(fetch(request), NETWORK_TIMEOUT);
+    if (response.ok) {
+      cache.put(request, response.clone());
+    } else if (response.type === 'opaqueredirect' || response.status === 404 || response.status === 409) {
+    // The attempt is over: drop the cached page and paper
+      cache.delete(request);
+    }
+    return response;
+  } catch (error) {
+    const cached = await cache.match(request);
+    if (cached) {
+      return cached;
+    }
+    throw error;
+  }
+}